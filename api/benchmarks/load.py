@@ -0,0 +1,77 @@
+import http.client
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+
+def run_load_test(
+    url: str, concurrency: int, requests: int, timeout: float = 30.0
+) -> Dict[str, Any]:
+    """
+    Envía `requests` peticiones GET a `url` desde `concurrency` clientes
+    concurrentes, cada uno con su propia conexión keep-alive, y devuelve el
+    throughput, la latencia en milisegundos y la cantidad de respuestas por
+    código de estado.
+    """
+    parts = urlsplit(url)
+    path: str = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+    connection_class = (
+        http.client.HTTPSConnection
+        if parts.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    counts: List[int] = [
+        requests // concurrency + (1 if index < requests % concurrency else 0)
+        for index in range(concurrency)
+    ]
+
+    def client(count: int) -> List[Tuple[float, int]]:
+        results: List[Tuple[float, int]] = []
+        connection = connection_class(parts.netloc, timeout=timeout)
+        try:
+            for _ in range(count):
+                start: float = time.perf_counter()
+                try:
+                    connection.request("GET", path)
+                    response = connection.getresponse()
+                    response.read()
+                    status: int = response.status
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    status = 0
+                results.append(((time.perf_counter() - start) * 1000, status))
+        finally:
+            connection.close()
+        return results
+
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results: List[Tuple[float, int]] = [
+            result for chunk in executor.map(client, counts) for result in chunk
+        ]
+    elapsed: float = time.perf_counter() - start
+
+    timings: List[float] = sorted(timing for timing, _ in results)
+    status_counts: Dict[str, int] = {}
+    for _, status in results:
+        status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+
+    def percentile(fraction: float) -> float:
+        return round(timings[min(len(timings) - 1, int(len(timings) * fraction))], 3)
+
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "requests": requests,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(requests / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(timings[-1], 3),
+        "status_counts": status_counts,
+    }
@@ -0,0 +1,326 @@
+import io
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import Max
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from api.benchmarks.utils import (
+    consume,
+    measure_memory,
+    profile_call,
+    rollback_after,
+    run_concurrently,
+    time_call,
+    without_response_cache,
+)
+from api.order.seed import OrderSeeder
+from api.order.views.update_view import OrderUpdateView
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer, orjson
+from api.technician.repositories.technician_repository import TechnicianRepository
+from api.technician.services.payment_service import PaymentService
+from api.technician.value_objects import ReportSummary, TechnicianPayment
+from api.technician.views.payment_view import TechnicianPaymentView
+from api.technician.views.report_view import TechnicianReportView
+from rapihogar.models import Order, Scheme, Technician, TechnicianStats, User
+
+FIRST_NAMES: List[str] = ["Juan", "Maria", "Carlos", "Lucia", "Pedro", "Sofia"]
+LAST_NAMES: List[str] = ["Perez", "Lopez", "Gomez", "Fernandez", "Diaz", "Romero"]
+# Hilos concurrentes de la medición de throughput, los de un worker `gthread`.
+THROUGHPUT_CONCURRENCY: int = 4
+
+
+def _seed_technicians(size: int, batch_size: int = 5000) -> None:
+    """
+    Crea `size` técnicos con nombres únicos por combinación de prefijo y número.
+    """
+    for start in range(0, size, batch_size):
+        Technician.objects.bulk_create(
+            [
+                Technician(
+                    first_name=f"{FIRST_NAMES[index % len(FIRST_NAMES)]}{index}",
+                    last_name=f"{LAST_NAMES[index % len(LAST_NAMES)]}{index}",
+                )
+                for index in range(start, min(start + batch_size, size))
+            ]
+        )
+
+
+def name_filter(size: int, repeat: int) -> Dict[str, Any]:
+    """
+    Mide la latencia del filtro por nombre de `TechnicianPaymentView` con
+    `size` técnicos, para términos frecuentes, selectivos e inexistentes.
+    """
+    terms: List[str] = ["maria", "perez12345", "zzz"]
+    factory = APIRequestFactory()
+    view = TechnicianPaymentView.as_view()
+    results: Dict[str, Any] = {
+        "scenario": "name_filter",
+        "vendor": connection.vendor,
+        "technicians": size,
+        "terms": {},
+    }
+    with rollback_after(), without_response_cache():
+        _seed_technicians(size)
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE rapihogar_technician")
+        for term in terms:
+            request = factory.get("/api/technicians/payments/", {"name": term})
+            results["terms"][term] = time_call(lambda: view(request).render(), repeat)
+            results["terms"][term]["plan"] = TechnicianRepository.filter_by_name(
+                Technician.objects.only("id"), term
+            ).explain()
+    return results
+
+
+def payment_memory(size: int, repeat: int) -> Dict[str, Any]:
+    """
+    Compara los bytes por técnico que ocupan los pagos del informe según cómo
+    se representan: instancias de `Technician` anotadas (lo que conservaba
+    antes `TechnicianPayment`), `TechnicianPayment` compactos creados desde
+    `values_list` y los arreglos de `ReportSummary`.
+    """
+    fields: List[str] = ["id", "first_name", "last_name", "total_payment"]
+    representations = {
+        "model_instances": lambda queryset: list(queryset),
+        "technician_payments": lambda queryset: [
+            TechnicianPayment.from_row(row) for row in queryset.values_list(*fields)
+        ],
+        "report_summary": lambda queryset: ReportSummary.from_rows(
+            queryset.values_list(*fields).iterator(chunk_size=2000)
+        ),
+    }
+    results: Dict[str, Any] = {
+        "scenario": "payment_memory",
+        "vendor": connection.vendor,
+        "technicians": size,
+        "representations": {},
+    }
+    with rollback_after():
+        _seed_technicians(size)
+        queryset = TechnicianRepository.with_payment_totals().order_by("id")
+        for name, build in representations.items():
+            memory: Dict[str, int] = measure_memory(lambda: build(queryset.all()))
+            results["representations"][name] = {
+                **memory,
+                "bytes_per_technician": round(memory["retained_bytes"] / size, 1),
+                **time_call(lambda: build(queryset.all()), repeat),
+            }
+    return results
+
+
+def connection_reuse(size: int, repeat: int) -> Dict[str, Any]:
+    """
+    Compara abrir una conexión nueva por petición, como ocurre con
+    `CONN_MAX_AGE = 0`, con reutilizar una conexión persistente, y pone la
+    diferencia en proporción a una página del listado de pagos con `size`
+    técnicos.
+
+    También mide las peticiones por segundo del listado de pagos con
+    `THROUGHPUT_CONCURRENCY` hilos, cerrando la conexión después de cada
+    petición o conservándola. Como cada hilo necesita ver los técnicos
+    sembrados, en esa medición se confirman y se eliminan al terminar.
+    """
+
+    def new_connection() -> None:
+        wrapper = connections.create_connection(DEFAULT_DB_ALIAS)
+        try:
+            with wrapper.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        finally:
+            wrapper.close()
+
+    def persistent_connection() -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+    factory = APIRequestFactory()
+    view = TechnicianPaymentView.as_view()
+    results: Dict[str, Any] = {
+        "scenario": "connection_reuse",
+        "vendor": connection.vendor,
+        "technicians": size,
+        "new_connection": time_call(new_connection, repeat),
+        "persistent_connection": time_call(persistent_connection, repeat),
+    }
+    with rollback_after(), without_response_cache():
+        _seed_technicians(size)
+        request = factory.get("/api/technicians/payments/", {"page_size": 100})
+        results["payments_page"] = time_call(lambda: view(request).render(), repeat)
+    overhead: float = (
+        results["new_connection"]["p50_ms"] - results["persistent_connection"]["p50_ms"]
+    )
+    results["connection_overhead_ms"] = round(overhead, 3)
+    results["overhead_per_payments_page"] = round(
+        overhead / results["payments_page"]["p50_ms"], 3
+    )
+
+    def payments_page() -> None:
+        view(factory.get("/api/technicians/payments/", {"page_size": 100})).render()
+
+    def payments_page_new_connection() -> None:
+        payments_page()
+        connection.close()
+
+    last_pk: int = Technician.objects.aggregate(last_pk=Max("pk"))["last_pk"] or 0
+    requests: int = repeat * THROUGHPUT_CONCURRENCY
+    try:
+        _seed_technicians(size)
+        with without_response_cache():
+            results["payments_throughput"] = {
+                "new_connection": run_concurrently(
+                    payments_page_new_connection, THROUGHPUT_CONCURRENCY, requests
+                ),
+                "persistent_connection": run_concurrently(
+                    payments_page, THROUGHPUT_CONCURRENCY, requests
+                ),
+            }
+    finally:
+        Technician.objects.filter(pk__gt=last_pk).delete()
+    return results
+
+
+def json_render(size: int, repeat: int) -> Dict[str, Any]:
+    """
+    Compara `JSONRenderer` con `FastJSONRenderer` al renderizar `size` filas
+    del listado de pagos, y `JSONParser` con `FastJSONParser` al leer un
+    cuerpo de `size` pedidos para la modificación masiva.
+    """
+    hours: List[int] = [index % 200 for index in range(size)]
+    rows: List[Dict[str, Any]] = [
+        {
+            "full_name": f"{FIRST_NAMES[index % len(FIRST_NAMES)]}{index} Pérez",
+            "total_hours": hour,
+            "total_payment": round(payment, 2),
+            "total_orders": index % 30,
+        }
+        for index, (hour, payment) in enumerate(
+            zip(hours, PaymentService.calculate_payments(hours))
+        )
+    ]
+    body: bytes = JSONRenderer().render(
+        [
+            {"id": index, "hours_worked": index % 10, "technician": index % 100}
+            for index in range(1, size + 1)
+        ]
+    )
+    renderers = {"drf": JSONRenderer(), "fast": FastJSONRenderer()}
+    parsers = {"drf": JSONParser(), "fast": FastJSONParser()}
+    return {
+        "scenario": "json_render",
+        "orjson": orjson is not None,
+        "rows": size,
+        "identical": renderers["drf"].render(rows) == renderers["fast"].render(rows),
+        "render": {
+            name: time_call(lambda: renderer.render(rows), repeat)
+            for name, renderer in renderers.items()
+        },
+        "parse": {
+            name: time_call(
+                lambda: parser.parse(io.BytesIO(body), parser_context={}), repeat
+            )
+            for name, parser in parsers.items()
+        },
+    }
+
+
+def _seed_orders(size: int, technicians: int, rng: random.Random) -> None:
+    """
+    Crea `technicians` técnicos, 100 clientes, 5 esquemas y `size` pedidos
+    aleatorios repartidos entre ellos.
+    """
+    _seed_technicians(technicians)
+    User.objects.bulk_create(
+        [
+            User(username=f"benchmark{index}", email=f"benchmark{index}@example.com")
+            for index in range(100)
+        ]
+    )
+    Scheme.objects.bulk_create([Scheme(name=f"Esquema {index}") for index in range(5)])
+    OrderSeeder.create_random_orders_in_batches(
+        OrderSeeder.get_ids(Technician.objects),
+        OrderSeeder.get_ids(User.objects),
+        OrderSeeder.get_ids(Scheme.objects),
+        size,
+        use_copy=connection.vendor == "postgresql",
+        rng=rng,
+    )
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+
+def endpoints(size: int, repeat: int) -> Dict[str, Any]:
+    """
+    Siembra `size` pedidos, con un técnico cada 100 pedidos, y mide la
+    latencia, la cantidad de consultas y el pico de memoria del listado de
+    pagos completo y paginado, del informe, de la modificación de un pedido
+    y del cálculo de pagos de `PaymentService`.
+    """
+    technicians: int = max(10, size // 100)
+    rng = random.Random(0)
+    factory = APIRequestFactory()
+    payment_view = TechnicianPaymentView.as_view()
+    report_view = TechnicianReportView.as_view()
+    update_view = OrderUpdateView.as_view()
+    results: Dict[str, Any] = {
+        "scenario": "endpoints",
+        "vendor": connection.vendor,
+        "orders": size,
+        "technicians": technicians,
+    }
+    with rollback_after(), without_response_cache():
+        _seed_orders(size, technicians, rng)
+        # Cada modificación cambia las horas de un pedido distinto, para que
+        # siempre escriba en la base de datos.
+        orders: List[Tuple[int, int]] = list(
+            Order.objects.order_by("-pk").values_list("pk", "hours_worked")[:1000]
+        )
+        hours: List[int] = list(
+            TechnicianStats.objects.values_list("total_hours", flat=True)
+        )
+
+        def update_order() -> int:
+            index: int = rng.randrange(len(orders))
+            pk, hours_worked = orders[index]
+            orders[index] = (pk, hours_worked % 10 + 1)
+            request = factory.patch(
+                f"/api/order/{pk}/", {"hours_worked": orders[index][1]}, format="json"
+            )
+            return consume(update_view(request, pk=pk))
+
+        measurements: Dict[str, Callable[[], Any]] = {
+            "payments": lambda: consume(
+                payment_view(factory.get("/api/technicians/payments/"))
+            ),
+            "payments_page": lambda: consume(
+                payment_view(
+                    factory.get("/api/technicians/payments/", {"page_size": 100})
+                )
+            ),
+            "report": lambda: consume(
+                report_view(factory.get("/api/technicians/report/"))
+            ),
+            "order_update": update_order,
+            "calculate_payment": lambda: [
+                PaymentService.calculate_payment(total) for total in hours
+            ],
+            "calculate_payments": lambda: PaymentService.calculate_payments(hours),
+        }
+        for name, function in measurements.items():
+            results[name] = profile_call(function, repeat)
+    return results
+
+
+SCENARIOS = {
+    "endpoints": endpoints,
+    "name_filter": name_filter,
+    "payment_memory": payment_memory,
+    "connection_reuse": connection_reuse,
+    "json_render": json_render,
+}
@@ -0,0 +1,148 @@
+import gc
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+from django.db import connection, connections, reset_queries, transaction
+from django.http import HttpResponseBase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+
+class _Rollback(Exception):
+    """Excepción interna para descartar los datos sembrados por un benchmark."""
+
+
+@contextmanager
+def rollback_after() -> Iterator[None]:
+    """
+    Ejecuta el bloque dentro de una transacción que siempre se revierte, para
+    que los datos sembrados por un benchmark no queden en la base de datos.
+    """
+    try:
+        with transaction.atomic():
+            yield
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+
+@contextmanager
+def without_response_cache() -> Iterator[None]:
+    """
+    Desactiva la caché de respuestas para que cada repetición de un benchmark
+    ejecute la vista completa.
+    """
+    with override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    ):
+        yield
+
+
+def time_call(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """
+    Ejecuta `function` `repeat` veces y devuelve estadísticas de latencia en
+    milisegundos.
+    """
+    timings: List[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "repeat": repeat,
+        "min_ms": round(timings[0], 3),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def run_concurrently(
+    function: Callable[[], object], concurrency: int, requests: int
+) -> Dict[str, Any]:
+    """
+    Ejecuta `function` `requests` veces repartidas entre `concurrency` hilos,
+    como un worker `gthread` de gunicorn, y devuelve el throughput y la
+    latencia en milisegundos. Cada hilo usa su propia conexión a la base de
+    datos y la cierra al terminar.
+    """
+    counts: List[int] = [
+        requests // concurrency + (1 if index < requests % concurrency else 0)
+        for index in range(concurrency)
+    ]
+
+    def worker(count: int) -> List[float]:
+        timings: List[float] = []
+        try:
+            for _ in range(count):
+                start: float = time.perf_counter()
+                function()
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            connections.close_all()
+        return timings
+
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings: List[float] = sorted(
+            timing for chunk in executor.map(worker, counts) for timing in chunk
+        )
+    elapsed: float = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "requests_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def measure_memory(function: Callable[[], Any]) -> Dict[str, int]:
+    """
+    Ejecuta `function` y devuelve, en bytes, la memoria que sigue ocupando su
+    resultado y el pico de memoria durante la ejecución.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = function()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"retained_bytes": retained - before, "peak_bytes": peak - before}
+
+
+def consume(response: HttpResponseBase) -> int:
+    """
+    Renderiza o recorre por completo la respuesta de una vista y devuelve su
+    tamaño en bytes, para que la medición incluya la serialización.
+    """
+    if response.streaming:
+        return sum(len(chunk) for chunk in response.streaming_content)
+    if hasattr(response, "render"):
+        response.render()
+    return len(response.content)
+
+
+def profile_call(function: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """
+    Devuelve la cantidad de consultas y el pico de memoria de una ejecución
+    de `function`, junto con las estadísticas de latencia de `time_call`.
+    """
+    # El registro de consultas tiene un máximo; si ya está lleno, la cuenta
+    # de `CaptureQueriesContext` no es correcta.
+    reset_queries()
+    with CaptureQueriesContext(connection) as queries:
+        function()
+    return {
+        "queries": len(queries),
+        "peak_bytes": measure_memory(function)["peak_bytes"],
+        **time_call(function, repeat),
+    }
@@ -0,0 +1,116 @@
+import hashlib
+import inspect
+from functools import wraps
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import parse_etags
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from rapihogar.models import DataVersion
+
+
+def versioned_cache(version_name: str) -> Callable:
+    """
+    Cachea la respuesta de un método `get` de una vista con la caché de Django.
+
+    La clave y el ETag de la respuesta combinan el token de `DataVersion`
+    `version_name` con la ruta y los parámetros de la consulta, por lo que
+    cualquier escritura que cambie el token invalida las respuestas previas.
+    Si el cliente envía `If-None-Match` con el ETag vigente se responde 304
+    sin recalcular nada. Las respuestas en streaming y los errores no se
+    cachean.
+
+    Si el método es asíncrono se cachea el cuerpo ya serializado de las
+    respuestas JSON.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+            return _async_versioned_cache(method, version_name)
+
+        @wraps(method)
+        def wrapper(view: Any, request: Request, *args: Any, **kwargs: Any) -> Any:
+            token = DataVersion.objects.get_token(version_name)
+            digest: str = _digest(token, request)
+            etag: str = f'"{digest}"'
+
+            if _etag_matches(etag, request):
+                return Response(
+                    status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+            cache_key: str = f"response:{version_name}:{digest}"
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data, headers={"ETag": etag})
+
+            response = method(view, request, *args, **kwargs)
+            if isinstance(response, Response) and response.status_code == 200:
+                cache.set(cache_key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+                response["ETag"] = etag
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _async_versioned_cache(method: Callable, version_name: str) -> Callable:
+    """
+    Versión de `versioned_cache` para métodos asíncronos que devuelven JSON.
+    """
+
+    @wraps(method)
+    async def wrapper(
+        view: Any, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        token = await DataVersion.objects.aget_token(version_name)
+        digest: str = _digest(token, request)
+        etag: str = f'"{digest}"'
+
+        if _etag_matches(etag, request):
+            return HttpResponse(
+                status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+        cache_key: str = f"response-json:{version_name}:{digest}"
+        content = await cache.aget(cache_key)
+        if content is not None:
+            return HttpResponse(
+                content, content_type="application/json", headers={"ETag": etag}
+            )
+
+        response = await method(view, request, *args, **kwargs)
+        if (
+            response.status_code == 200
+            and not response.streaming
+            and response.get("Content-Type") == "application/json"
+        ):
+            await cache.aset(
+                cache_key, response.content, settings.RESPONSE_CACHE_TIMEOUT
+            )
+            response["ETag"] = etag
+        return response
+
+    return wrapper
+
+
+def _digest(token: Any, request: HttpRequest) -> str:
+    """
+    Combina el token de la versión de datos con la ruta y los parámetros.
+    """
+    return hashlib.sha1(f"{token}:{request.get_full_path()}".encode()).hexdigest()
+
+
+def _etag_matches(etag: str, request: HttpRequest) -> bool:
+    """
+    Indica si `etag` está entre los de `If-None-Match`, que usa la
+    comparación débil: `W/"x"` coincide con `"x"` y `*` con cualquiera.
+    """
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in etags or etag in {tag.removeprefix("W/") for tag in etags}
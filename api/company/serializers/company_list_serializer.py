@@ -0,0 +1,26 @@
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Sequence
+
+from rapihogar.models import Company
+
+
+class CompanyListSerializer:
+    """
+    Serializador de solo lectura para los listados de empresas.
+
+    Todos los campos de `Company` son simples, así que cada fila se arma
+    leyendo los atributos directamente, sin crear los campos de DRF por
+    cada empresa. Devuelve lo mismo que `CompanySerializer` para esos campos.
+    """
+
+    def __init__(self, instances: Iterable[Company], fields: Sequence[str]) -> None:
+        self.instances = instances
+        self.fields = tuple(fields)
+
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        if len(self.fields) == 1:
+            field: str = self.fields[0]
+            return [{field: getattr(instance, field)} for instance in self.instances]
+        getter = attrgetter(*self.fields)
+        return [dict(zip(self.fields, getter(instance))) for instance in self.instances]
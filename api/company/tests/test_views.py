@@ -4,6 +4,7 @@ from django.urls import reverse
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
+from api.company.serializers.company_serializer import CompanySerializer
 from rapihogar.models import Company, User
 
 
@@ -37,3 +38,62 @@ class CompanyListCreateAPIViewTestCase(APITestCase):
         response = self.client.get(self.url)
         self.assertEqual(200, response.status_code)
         self.assertTrue(len(json.loads(response.content)) == Company.objects.count())
+
+
+class CompanyListPaginationTestCase(APITestCase):
+    url = reverse("company-list")
+
+    @classmethod
+    def setUpTestData(cls):
+        Company.objects.bulk_create(
+            [
+                Company(
+                    name=f"Empresa {index}",
+                    phone=f"{index}",
+                    email=f"empresa{index}@rapihogar.com",
+                    website=f"http://www.empresa{index}.com",
+                )
+                for index in range(5)
+            ]
+        )
+
+    def test_list_matches_model_serializer(self):
+        response = self.client.get(self.url)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            CompanySerializer(Company.objects.order_by("id"), many=True).data,
+            sorted(response.json(), key=lambda company: company["id"]),
+        )
+
+    def test_cursor_pagination(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(200, response.status_code)
+        ids = [company["id"] for company in response.json()["results"]]
+        next_url = response.json()["next"]
+        while next_url:
+            response = self.client.get(next_url)
+            ids += [company["id"] for company in response.json()["results"]]
+            next_url = response.json()["next"]
+        self.assertEqual(
+            ids, list(Company.objects.order_by("id").values_list("id", flat=True))
+        )
+
+    def test_sparse_fields(self):
+        with self.assertNumQueries(1) as queries:
+            response = self.client.get(self.url, {"fields": "name, id,name"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(set(response.json()[0]), {"name", "id"})
+        self.assertNotIn("website", queries.captured_queries[0]["sql"])
+
+    def test_sparse_fields_with_pagination(self):
+        response = self.client.get(self.url, {"fields": "name", "page_size": 3})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(len(response.json()["results"]), 3)
+        self.assertEqual(set(response.json()["results"][0]), {"name"})
+        self.assertIsNotNone(response.json()["next"])
+
+    def test_invalid_sparse_fields(self):
+        for fields in ("name,password", ","):
+            response = self.client.get(self.url, {"fields": fields})
+            self.assertEqual(400, response.status_code)
+            self.assertIn("fields", response.json())
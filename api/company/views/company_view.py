@@ -1,9 +1,77 @@
-from rest_framework import viewsets
+from typing import Any, List, Tuple
 
+from django.db.models import QuerySet
+from rest_framework import serializers, viewsets
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from api.company.serializers.company_list_serializer import CompanyListSerializer
 from api.company.serializers.company_serializer import CompanySerializer
+from api.pagination import KeysetPagination
 from rapihogar.models import Company
 
 
 class CompanyViewSet(viewsets.ModelViewSet):
+    """
+    ABM de empresas.
+
+    El listado admite paginación por id (`cursor`, `page_size`) y
+    `?fields=id,name` para devolver y leer de la base de datos solo esos
+    campos.
+    """
+
     serializer_class = CompanySerializer
     queryset = Company.objects.filter()
+    pagination_class = KeysetPagination
+
+    LIST_FIELDS: Tuple[str, ...] = tuple(
+        field.name for field in Company._meta.concrete_fields
+    )
+
+    def get_queryset(self) -> QuerySet:
+        queryset: QuerySet = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.only(*self.get_list_fields())
+        return queryset
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        fields: Tuple[str, ...] = self.get_list_fields()
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(CompanyListSerializer(page, fields).data)
+
+        return Response(CompanyListSerializer(queryset, fields).data)
+
+    def get_list_fields(self) -> Tuple[str, ...]:
+        """
+        Devuelve los campos pedidos en `?fields=`, o todos si no se indica.
+
+        Raises:
+            serializers.ValidationError: Si se pide un campo inexistente.
+        """
+        fields_param: str = self.request.query_params.get("fields", "")
+        if not fields_param:
+            return self.LIST_FIELDS
+
+        fields: List[str] = []
+        for field in fields_param.split(","):
+            field = field.strip()
+            if field and field not in fields:
+                fields.append(field)
+        invalid_fields: List[str] = [
+            field for field in fields if field not in self.LIST_FIELDS
+        ]
+        if invalid_fields or not fields:
+            raise serializers.ValidationError(
+                {
+                    "fields": [
+                        "Campos inválidos: {}. Valores posibles: {}.".format(
+                            ", ".join(invalid_fields) or fields_param,
+                            ", ".join(self.LIST_FIELDS),
+                        )
+                    ]
+                }
+            )
+        return tuple(fields)
@@ -0,0 +1,119 @@
+import bisect
+import math
+import threading
+from typing import Any, Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias en milisegundos con cubetas de tamaño geométrico.
+
+    Cada cubeta es un 10% más grande que la anterior, desde 0,01 ms hasta más
+    de 10 minutos, así ocupa memoria fija y los percentiles tienen un error
+    relativo acotado sin guardar cada muestra.
+    """
+
+    BOUNDS: Tuple[float, ...] = tuple(0.01 * 1.1**index for index in range(200))
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(self.BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Devuelve el límite superior de la cubeta que contiene el percentil.
+        """
+        if not self.count:
+            return 0.0
+        rank: int = max(1, math.ceil(self.count * fraction))
+        seen: int = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index >= len(self.BOUNDS):
+                    return self.max
+                return min(self.BOUNDS[index], self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(0.5), 3),
+            "p95": round(self.percentile(0.95), 3),
+            "p99": round(self.percentile(0.99), 3),
+            "max": round(self.max, 3),
+        }
+
+
+class EndpointMetrics:
+    """
+    Métricas acumuladas de un endpoint: cantidad de peticiones, consultas y
+    histogramas del tiempo total, de base de datos y de serialización.
+    """
+
+    __slots__ = ("requests", "queries", "max_queries", "histograms")
+
+    TIMINGS: Tuple[str, ...] = ("total", "db", "serialization")
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.queries: int = 0
+        self.max_queries: int = 0
+        self.histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram() for name in self.TIMINGS
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "queries": {
+                "mean": round(self.queries / self.requests, 2) if self.requests else 0,
+                "max": self.max_queries,
+            },
+            **{f"{name}_ms": self.histograms[name].to_dict() for name in self.TIMINGS},
+        }
+
+
+class MetricsRegistry:
+    """
+    Métricas por endpoint del proceso actual, compartidas por sus hilos.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+
+    def record(self, endpoint: str, queries: int, timings: Dict[str, float]) -> None:
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self._endpoints[endpoint] = EndpointMetrics()
+            metrics.requests += 1
+            metrics.queries += queries
+            metrics.max_queries = max(metrics.max_queries, queries)
+            for name, value in timings.items():
+                metrics.histograms[name].record(value)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                endpoint: metrics.to_dict()
+                for endpoint, metrics in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,164 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+
+from api.metrics.histogram import registry
+
+_current_metrics: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+class RequestMetrics:
+    """
+    Consultas y tiempos, en milisegundos, de la petición en curso.
+    """
+
+    __slots__ = ("queries", "db_ms", "serialization_ms", "start")
+
+    def __init__(self) -> None:
+        self.queries: int = 0
+        self.db_ms: float = 0.0
+        self.serialization_ms: float = 0.0
+        self.start: float = time.perf_counter()
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: Dict
+    ) -> Any:
+        """
+        Se instala con `connection.execute_wrapper` para medir cada consulta.
+        """
+        start: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - start) * 1000
+
+    def timings(self) -> Dict[str, float]:
+        total_ms: float = (time.perf_counter() - self.start) * 1000
+        return {
+            "total": total_ms,
+            "db": self.db_ms,
+            "serialization": self.serialization_ms,
+        }
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """
+    Suma el tiempo del bloque a la serialización de la petición en curso.
+    """
+    metrics: Optional[RequestMetrics] = _current_metrics.get()
+    start: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.serialization_ms += (time.perf_counter() - start) * 1000
+
+
+def is_instrumented(request: HttpRequest) -> bool:
+    """
+    Indica si la vista que atendió la petición declara `instrumented = True`.
+    """
+    resolver_match = getattr(request, "resolver_match", None)
+    view_class = getattr(getattr(resolver_match, "func", None), "view_class", None)
+    return bool(getattr(view_class, "instrumented", False))
+
+
+def server_timing(metrics: RequestMetrics, timings: Dict[str, float]) -> str:
+    app_ms: float = max(
+        timings["total"] - timings["db"] - timings["serialization"], 0.0
+    )
+    return ", ".join(
+        (
+            f'db;dur={timings["db"]:.3f};desc="{metrics.queries} queries"',
+            f'serialization;dur={timings["serialization"]:.3f}',
+            f"app;dur={app_ms:.3f}",
+            f'total;dur={timings["total"]:.3f}',
+        )
+    )
+
+
+class RequestMetricsMiddleware:
+    """
+    Mide las consultas, el tiempo de base de datos, de serialización y total
+    de cada petición.
+
+    En las vistas con `instrumented = True` agrega el encabezado
+    `Server-Timing` y acumula las métricas del endpoint en `registry`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token = self._start()
+        try:
+            with connection.execute_wrapper(metrics):
+                response: HttpResponse = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self._finish(request, response, metrics)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        metrics, token = self._start()
+        try:
+            with connection.execute_wrapper(metrics):
+                response: HttpResponse = await self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self._finish(request, response, metrics)
+
+    @staticmethod
+    def _start() -> Any:
+        metrics = RequestMetrics()
+        return metrics, _current_metrics.set(metrics)
+
+    @staticmethod
+    def _finish(
+        request: HttpRequest, response: HttpResponse, metrics: RequestMetrics
+    ) -> HttpResponse:
+        if not is_instrumented(request):
+            return response
+        timings: Dict[str, float] = metrics.timings()
+        response["Server-Timing"] = server_timing(metrics, timings)
+        registry.record(
+            f"{request.method} {request.resolver_match.route}",
+            metrics.queries,
+            timings,
+        )
+        return response
+
+
+class InstrumentedViewMixin:
+    """
+    Mixin para vistas de DRF que activa las métricas de
+    `RequestMetricsMiddleware` y mide el renderizado de la respuesta como
+    tiempo de serialización.
+    """
+
+    instrumented: bool = True
+
+    def finalize_response(
+        self, request: Any, response: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+            with measure_serialization():
+                response.render()
+        return response
@@ -0,0 +1,127 @@
+import re
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.metrics.histogram import LatencyHistogram, registry
+from rapihogar.models import Order, Scheme, Technician, User
+
+
+class LatencyHistogramTest(SimpleTestCase):
+    def test_percentiles(self) -> None:
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(float(value))
+        data = histogram.to_dict()
+        self.assertEqual(data["mean"], 50.5)
+        self.assertEqual(data["max"], 100.0)
+        # Cada cubeta es un 10% más grande que la anterior.
+        self.assertLessEqual(abs(data["p50"] - 50) / 50, 0.1)
+        self.assertLessEqual(abs(data["p95"] - 95) / 95, 0.1)
+        self.assertEqual(LatencyHistogram().percentile(0.5), 0.0)
+
+
+class RequestMetricsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        client_user = User.objects.create(
+            email="cliente@prueba.com", username="clienteprueba"
+        )
+        cls.order = Order.objects.create(
+            technician=Technician.objects.create(first_name="Juan", last_name="Perez"),
+            client=client_user,
+            scheme=Scheme.objects.create(name="Esquema de prueba"),
+            hours_worked=5,
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        registry.reset()
+
+    def test_server_timing_and_registry(self) -> None:
+        """
+        Verifica el encabezado Server-Timing y las métricas acumuladas.
+        """
+        url: str = reverse("technician-payments-list")
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        server_timing: str = response["Server-Timing"]
+        self.assertIn('desc="2 queries"', server_timing)
+        for metric in ("db", "serialization", "app", "total"):
+            self.assertRegex(server_timing, rf"{metric};dur=\d+\.\d{{3}}")
+
+        self.client.get(url)
+        metrics = registry.snapshot()["GET api/technicians/payments/"]
+        self.assertEqual(metrics["requests"], 2)
+        self.assertEqual(metrics["queries"]["max"], 2)
+        self.assertEqual(
+            set(metrics),
+            {"requests", "queries", "total_ms", "db_ms", "serialization_ms"},
+        )
+
+    def test_instrumented_views(self) -> None:
+        """
+        Verifica que las vistas instrumentadas por defecto informen sus métricas.
+        """
+        responses = [
+            self.client.get(reverse("technician-report")),
+            self.client.get(reverse("technician-report-async")),
+            self.client.patch(
+                reverse("order-update", args=[self.order.id]),
+                {"hours_worked": 6},
+                format="json",
+            ),
+            self.client.patch(
+                reverse("order-update-async", args=[self.order.id]),
+                {"hours_worked": 7},
+                format="json",
+            ),
+        ]
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn("Server-Timing", response)
+        self.assertEqual(
+            set(registry.snapshot()),
+            {
+                "GET api/technicians/report/",
+                "GET api/async/technicians/report/",
+                "PATCH api/order/<int:pk>/",
+                "PATCH api/async/order/<int:pk>/",
+            },
+        )
+        queries = re.search(r'desc="(\d+) queries"', responses[1]["Server-Timing"])
+        self.assertGreater(int(queries.group(1)), 0)
+
+    def test_not_instrumented_view(self) -> None:
+        """
+        Verifica que las vistas sin instrumentar no informen métricas.
+        """
+        response = self.client.get(reverse("company-list"))
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(registry.snapshot(), {})
+
+    @override_settings(DEBUG=False)
+    def test_metrics_view_requires_staff(self) -> None:
+        url: str = reverse("request-metrics")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        staff = User.objects.create(
+            username="staff", email="staff@prueba.com", is_staff=True
+        )
+        self.client.force_authenticate(staff)
+        self.client.get(reverse("technician-payments-list"))
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("GET api/technicians/payments/", response.json())
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(registry.snapshot(), {})
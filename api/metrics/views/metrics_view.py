@@ -0,0 +1,39 @@
+from typing import Any
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.metrics.histogram import registry
+
+
+class IsStaffOrDebug(BasePermission):
+    """
+    Permite el acceso a usuarios staff, o a cualquiera en modo DEBUG.
+    """
+
+    def has_permission(self, request: Request, view: APIView) -> bool:
+        return settings.DEBUG or bool(request.user and request.user.is_staff)
+
+
+class RequestMetricsView(APIView):
+    """
+    Muestra las métricas por endpoint acumuladas en este proceso: cantidad de
+    peticiones y consultas, y percentiles del tiempo total, de base de datos
+    y de serialización, en milisegundos.
+    """
+
+    permission_classes = [IsStaffOrDebug]
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(registry.snapshot())
+
+    def delete(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Reinicia las métricas acumuladas.
+        """
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
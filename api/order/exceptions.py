@@ -0,0 +1,12 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class OrderVersionConflict(APIException):
+    """
+    El pedido fue modificado por otra petición desde que se leyó.
+    """
+
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "El pedido fue modificado por otra petición."
+    default_code = "precondition_failed"
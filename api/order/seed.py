@@ -1,54 +1,354 @@
+import csv
+import io
 import random
-from typing import List
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
 
-from rapihogar.models import Order, Scheme, Technician, User
+from django.db import connection, connections, transaction
+from django.db.models import Count, Max, Min, QuerySet
+
+from api.order.seed_worker import SeedResult, SeedTask, seed_orders
+from rapihogar.models import (
+    DataVersion,
+    Order,
+    Scheme,
+    Technician,
+    TechnicianPeriodStats,
+    TechnicianStats,
+    User,
+    apply_stats_changes,
+)
+from rapihogar.signals import has_other_order_delete_receivers
+
+ProgressCallback = Callable[[int, float], None]
 
 
 class OrderSeeder:
 
+    DEFAULT_BATCH_SIZE: int = 5000
+    DELETE_STANDARD: str = "standard"
+    DELETE_FAST: str = "fast"
+    DELETE_CHUNKED: str = "chunked"
+    DELETE_AUTO: str = "auto"
+    DELETE_MODES: List[str] = [
+        DELETE_AUTO,
+        DELETE_FAST,
+        DELETE_CHUNKED,
+        DELETE_STANDARD,
+    ]
+    RANDOM_BLOCK_SIZE: int = 10000
+    MIN_HOURS: int = 1
+
     @staticmethod
-    def create_random_orders(
+    def get_ids(queryset: QuerySet) -> Sequence[int]:
+        """
+        Devuelve los ids de `queryset` para sortear entre ellos.
+
+        Si los ids son consecutivos se devuelve un `range`, que ocupa lo mismo
+        sin importar la cantidad de filas; si no, la lista de ids.
+        """
+        bounds: Dict[str, Optional[int]] = queryset.aggregate(
+            min_id=Min("id"), max_id=Max("id"), count=Count("id")
+        )
+        if not bounds["count"]:
+            return []
+        if bounds["max_id"] - bounds["min_id"] + 1 == bounds["count"]:
+            return range(bounds["min_id"], bounds["max_id"] + 1)
+        return list(queryset.order_by("id").values_list("id", flat=True))
+
+    @staticmethod
+    def generate_random_orders(
         technicians: List[Technician],
         clients: List[User],
         schemes: List[Scheme],
         n: int,
         max_hours: int = 10,
-    ) -> List[Order]:
+        rng: Optional[random.Random] = None,
+    ) -> Iterator[Order]:
         """
-        Crea múltiples pedidos aleatorios seleccionando técnicos, clientes y esquemas al azar.
-        Inserta los pedidos en la base de datos de forma masiva.
+        Genera `n` pedidos aleatorios sin guardarlos, de a uno por vez.
         """
-        if not technicians or not clients or not schemes:
+        return OrderSeeder.generate_random_orders_by_ids(
+            [technician.id for technician in technicians],
+            [client.id for client in clients],
+            [scheme.id for scheme in schemes],
+            n,
+            max_hours,
+            rng,
+        )
+
+    @staticmethod
+    def generate_random_orders_by_ids(
+        technician_ids: Sequence[int],
+        client_ids: Sequence[int],
+        scheme_ids: Sequence[int],
+        n: int,
+        max_hours: int = 10,
+        rng: Optional[random.Random] = None,
+    ) -> Iterator[Order]:
+        """
+        Genera `n` pedidos aleatorios sin guardarlos, eligiendo al azar entre
+        los ids de técnicos, clientes y esquemas.
+        """
+        if not technician_ids or not client_ids or not scheme_ids:
             raise ValueError(
                 "Asegúrate de tener técnicos, clientes y esquemas en la base de datos."
             )
-
-        MIN_HOURS: int = 1
-        if max_hours < MIN_HOURS:
+        if max_hours < OrderSeeder.MIN_HOURS:
             raise ValueError("max_hours debe ser al menos 1.")
 
-        orders = []
-        for _ in range(n):
-            technician = random.choice(technicians)
-            client = random.choice(clients)
-            scheme = random.choice(schemes)
-            hours_worked = random.randint(MIN_HOURS, max_hours)
-
-            orders.append(
-                Order(
-                    technician=technician,
-                    client=client,
-                    scheme=scheme,
+        return OrderSeeder._generate(
+            technician_ids, client_ids, scheme_ids, n, max_hours, rng or random.Random()
+        )
+
+    @staticmethod
+    def _generate(
+        technician_ids: Sequence[int],
+        client_ids: Sequence[int],
+        scheme_ids: Sequence[int],
+        n: int,
+        max_hours: int,
+        rng: random.Random,
+    ) -> Iterator[Order]:
+        # Las elecciones aleatorias se generan por bloques con `choices`, que
+        # sortea todo el bloque en una sola llamada en lugar de una por campo.
+        hours = range(OrderSeeder.MIN_HOURS, max_hours + 1)
+        for start in range(0, n, OrderSeeder.RANDOM_BLOCK_SIZE):
+            block: int = min(OrderSeeder.RANDOM_BLOCK_SIZE, n - start)
+            for technician_id, client_id, scheme_id, hours_worked in zip(
+                rng.choices(technician_ids, k=block),
+                rng.choices(client_ids, k=block),
+                rng.choices(scheme_ids, k=block),
+                rng.choices(hours, k=block),
+            ):
+                yield Order(
+                    technician_id=technician_id,
+                    client_id=client_id,
+                    scheme_id=scheme_id,
                     hours_worked=hours_worked,
                     type_request=Order.ORDER,
                 )
-            )
 
+    @staticmethod
+    def create_random_orders(
+        technicians: List[Technician],
+        clients: List[User],
+        schemes: List[Scheme],
+        n: int,
+        max_hours: int = 10,
+    ) -> List[Order]:
+        """
+        Crea múltiples pedidos aleatorios seleccionando técnicos, clientes y esquemas al azar.
+        Inserta los pedidos en la base de datos de forma masiva.
+        """
+        orders = list(
+            OrderSeeder.generate_random_orders(
+                technicians, clients, schemes, n, max_hours
+            )
+        )
         return Order.objects.bulk_create(orders)
 
     @staticmethod
-    def delete_all_orders() -> None:
+    def create_random_orders_in_batches(
+        technician_ids: Sequence[int],
+        client_ids: Sequence[int],
+        scheme_ids: Sequence[int],
+        n: int,
+        max_hours: int = 10,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        use_copy: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        rng: Optional[random.Random] = None,
+    ) -> int:
+        """
+        Crea `n` pedidos aleatorios por lotes de `batch_size`, cada lote en su
+        propia transacción, sin tener todos los pedidos en memoria a la vez.
+
+        Con `use_copy` los lotes se insertan con `COPY` de PostgreSQL.
+        Después de cada lote se llama a `progress` con la cantidad de pedidos
+        creados y los segundos transcurridos. Devuelve la cantidad creada.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser al menos 1.")
+        if use_copy and connection.vendor != "postgresql":
+            raise ValueError("COPY solo está disponible en PostgreSQL.")
+
+        orders: Iterator[Order] = OrderSeeder.generate_random_orders_by_ids(
+            technician_ids, client_ids, scheme_ids, n, max_hours, rng
+        )
+        insert_batch = (
+            OrderSeeder._copy_orders if use_copy else Order.objects.bulk_create
+        )
+        created: int = 0
+        start: float = time.perf_counter()
+        while batch := list(islice(orders, batch_size)):
+            with transaction.atomic():
+                insert_batch(batch)
+            created += len(batch)
+            if progress:
+                progress(created, time.perf_counter() - start)
+        return created
+
+    @staticmethod
+    def create_random_orders_parallel(
+        technician_ids: Sequence[int],
+        client_ids: Sequence[int],
+        scheme_ids: Sequence[int],
+        n: int,
+        workers: int,
+        seed: int,
+        max_hours: int = 10,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        use_copy: bool = False,
+    ) -> List[SeedResult]:
         """
-        Elimina todos los pedidos de la base de datos.
+        Reparte la creación de `n` pedidos entre `workers` procesos.
+
+        Cada proceso abre su propia conexión y usa un generador aleatorio
+        derivado de `seed` y de su índice, por lo que la misma semilla
+        reproduce los mismos pedidos. Con un solo proceso se ejecuta en el
+        proceso actual. Devuelve el resultado de cada proceso.
+        """
+        if workers < 1:
+            raise ValueError("workers debe ser al menos 1.")
+        tasks: List[SeedTask] = [
+            SeedTask(
+                technician_ids=technician_ids,
+                client_ids=client_ids,
+                scheme_ids=scheme_ids,
+                n=worker_n,
+                seed=f"{seed}:{index}",
+                max_hours=max_hours,
+                batch_size=batch_size,
+                use_copy=use_copy,
+            )
+            for index, worker_n in enumerate(OrderSeeder.split_count(n, workers))
+        ]
+        if workers == 1:
+            return [seed_orders(tasks[0])]
+
+        # Los procesos no deben heredar la conexión abierta del proceso actual.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(seed_orders, tasks))
+
+    @staticmethod
+    def split_count(n: int, parts: int) -> List[int]:
+        """
+        Divide `n` en `parts` cantidades que difieren a lo sumo en uno.
+        """
+        return [n // parts + (1 if index < n % parts else 0) for index in range(parts)]
+
+    @staticmethod
+    def _copy_orders(orders: List[Order]) -> None:
         """
-        Order.objects.all().delete()
+        Inserta los pedidos con `COPY ... FROM STDIN` y actualiza las
+        estadísticas y la versión de datos que `bulk_create` mantiene solo.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for order in orders:
+            writer.writerow(
+                (
+                    order.type_request,
+                    order.client_id,
+                    order.technician_id,
+                    order.scheme_id,
+                    order.hours_worked,
+                    order.version,
+                    order.created_at.isoformat(),
+                )
+            )
+        buffer.seek(0)
+        sql: str = (
+            f"COPY {Order._meta.db_table} "
+            "(type_request, client_id, technician_id, scheme_id, hours_worked, version, "
+            "created_at) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        # Solo se importa en PostgreSQL: requiere psycopg2 o psycopg 3.
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        with connection.cursor() as cursor:
+            # psycopg 3 (el que usa el pool de conexiones) reemplaza
+            # `copy_expert` por `copy`.
+            if is_psycopg3:
+                with cursor.cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+            else:
+                cursor.cursor.copy_expert(sql, buffer)
+        apply_stats_changes([(None, order.stats_values()) for order in orders])
+        DataVersion.objects.bump(DataVersion.TECHNICIANS)
+
+    @staticmethod
+    def can_purge_orders() -> bool:
+        """
+        Indica si los pedidos se pueden eliminar sin pasar por el ORM: ningún
+        modelo depende de `Order` y no hay señales de eliminación cuyo efecto
+        no se pueda aplicar en bloque.
+        """
+        return (
+            not Order._meta.related_objects and not has_other_order_delete_receivers()
+        )
+
+    @staticmethod
+    def delete_all_orders(
+        mode: str = DELETE_STANDARD, chunk_size: int = DEFAULT_BATCH_SIZE
+    ) -> str:
+        """
+        Elimina todos los pedidos de la base de datos y devuelve el modo usado.
+
+        - `standard`: `Order.objects.all().delete()`, con señales y cascadas.
+        - `fast`: `TRUNCATE ... RESTART IDENTITY` en PostgreSQL o un `DELETE`
+          sin recolectar objetos en otros motores. Pone en cero las
+          estadísticas de técnicos y renueva la versión de datos. Requiere
+          `can_purge_orders()`.
+        - `chunked`: elimina por lotes de `chunk_size` a través del ORM, cada
+          lote en su propia transacción.
+        - `auto`: `fast` si es posible y `chunked` si no.
+        """
+        if mode not in OrderSeeder.DELETE_MODES:
+            raise ValueError(f"Modo de eliminación desconocido: {mode}.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser al menos 1.")
+        if mode == OrderSeeder.DELETE_AUTO:
+            mode = (
+                OrderSeeder.DELETE_FAST
+                if OrderSeeder.can_purge_orders()
+                else OrderSeeder.DELETE_CHUNKED
+            )
+
+        if mode == OrderSeeder.DELETE_STANDARD:
+            Order.objects.all().delete()
+        elif mode == OrderSeeder.DELETE_FAST:
+            if not OrderSeeder.can_purge_orders():
+                raise ValueError(
+                    "Los pedidos tienen dependencias o señales que impiden "
+                    "eliminarlos en bloque."
+                )
+            OrderSeeder._purge_orders()
+        else:
+            while ids := list(
+                Order.objects.order_by("pk").values_list("pk", flat=True)[:chunk_size]
+            ):
+                with transaction.atomic():
+                    Order.objects.filter(pk__in=ids).delete()
+        return mode
+
+    @staticmethod
+    def _purge_orders() -> None:
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"TRUNCATE TABLE {connection.ops.quote_name(Order._meta.db_table)} "
+                        "RESTART IDENTITY"
+                    )
+            else:
+                queryset = Order.objects.all()
+                queryset._raw_delete(queryset.db)
+            TechnicianStats.objects.all().delete()
+            TechnicianPeriodStats.objects.all().delete()
+            DataVersion.objects.bump(DataVersion.TECHNICIANS)
@@ -0,0 +1,58 @@
+"""
+Punto de entrada de los procesos que crean pedidos en paralelo.
+
+Este módulo no importa modelos al cargarse para que los procesos hijos
+puedan importarlo antes de inicializar Django.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+import django
+from django.apps import apps
+
+
+@dataclass(frozen=True)
+class SeedTask:
+    """Parte de la carga de pedidos asignada a un proceso."""
+
+    technician_ids: Sequence[int]
+    client_ids: Sequence[int]
+    scheme_ids: Sequence[int]
+    n: int
+    seed: str
+    max_hours: int
+    batch_size: int
+    use_copy: bool
+
+
+@dataclass(frozen=True)
+class SeedResult:
+    """Pedidos creados por un proceso y los segundos que tardó."""
+
+    created: int
+    elapsed: float
+
+
+def seed_orders(task: SeedTask) -> SeedResult:
+    """
+    Crea los pedidos de `task` por lotes con un generador aleatorio propio.
+    """
+    if not apps.ready:
+        django.setup()
+    from api.order.seed import OrderSeeder
+
+    start: float = time.perf_counter()
+    created: int = OrderSeeder.create_random_orders_in_batches(
+        task.technician_ids,
+        task.client_ids,
+        task.scheme_ids,
+        task.n,
+        max_hours=task.max_hours,
+        batch_size=task.batch_size,
+        use_copy=task.use_copy,
+        rng=random.Random(task.seed),
+    )
+    return SeedResult(created=created, elapsed=time.perf_counter() - start)
@@ -0,0 +1,33 @@
+from typing import Any, Dict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model
+from rest_framework import serializers
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    `PrimaryKeyRelatedField` que resuelve la pk con los objetos precargados
+    en el contexto del serializador, en `related_objects[Modelo][pk]`, en
+    lugar de hacer una consulta por campo. Si el modelo no está precargado se
+    comporta como `PrimaryKeyRelatedField`.
+    """
+
+    def to_internal_value(self, data: Any) -> Model:
+        model = self.get_queryset().model
+        related_objects: Dict[Any, Model] = self.context.get("related_objects", {}).get(
+            model
+        )
+        if related_objects is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = model._meta.pk.to_python(data)
+        except (DjangoValidationError, TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        related_object = related_objects.get(pk)
+        if related_object is None:
+            self.fail("does_not_exist", pk_value=data)
+        return related_object
@@ -1,8 +1,18 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from rest_framework import serializers
 
-from rapihogar.models import Order
+from api.order.exceptions import OrderVersionConflict
+from api.order.serializers.fields import PrefetchedPrimaryKeyRelatedField
+from rapihogar.models import Order, Scheme, Technician, User
+
+# Relaciones que se pueden modificar en un pedido y el modelo de cada una, para
+# precargarlas antes de validar.
+RELATED_FIELDS: Dict[str, type] = {
+    "client": User,
+    "scheme": Scheme,
+    "technician": Technician,
+}
 
 
 class OrderUpdateSerializer(serializers.ModelSerializer):
@@ -10,8 +20,12 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
     Este serializador permite modificar los campos `client`, `scheme`, `technician` y `hours_worked`
     de un pedido existente. Se asegura de que el pedido a modificar sea de tipo "PEDIDO".
     Si el pedido no es de tipo "PEDIDO", se lanzará una excepción de validación.
+    Las relaciones se resuelven con los objetos precargados en el contexto, si los hay,
+    y al guardar solo se escriben los campos que cambiaron.
     """
 
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     class Meta:
         model = Order
         fields = ["client", "scheme", "technician", "hours_worked"]
@@ -51,3 +65,44 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
         if self.instance.type_request != Order.ORDER:
             raise serializers.ValidationError("Solo se pueden modificar pedidos")
         return data
+
+    def assign_changes(
+        self, instance: Order, validated_data: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Asigna al pedido los valores de `validated_data` que difieren de los
+        actuales. Las relaciones se asignan por id, sin reemplazar el objeto
+        relacionado si no cambió.
+
+        Args:
+            instance (Order): El pedido a modificar.
+            validated_data (Dict[str, Any]): Los datos validados.
+
+        Returns:
+            List[str]: Los nombres de los campos que cambiaron.
+        """
+        changed_fields: List[str] = []
+        for name, value in validated_data.items():
+            field = instance._meta.get_field(name)
+            if field.is_relation:
+                attname, value = field.attname, None if value is None else value.pk
+            else:
+                attname = name
+            if getattr(instance, attname) != value:
+                setattr(instance, attname, value)
+                changed_fields.append(name)
+        return changed_fields
+
+    def update(self, instance: Order, validated_data: Dict[str, Any]) -> Order:
+        """
+        Guarda solo los campos que cambiaron, siempre que el pedido siga en la
+        versión leída; si no cambió ninguno no se ejecuta el UPDATE.
+
+        Raises:
+            OrderVersionConflict: Si otra petición modificó el pedido.
+        """
+        version: int = instance.version
+        changed_fields: List[str] = self.assign_changes(instance, validated_data)
+        if changed_fields and not instance.save_if_version(version, changed_fields):
+            raise OrderVersionConflict()
+        return instance
@@ -0,0 +1,134 @@
+from typing import Any, Dict, List, Set, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import Model
+
+from api.order.exceptions import OrderVersionConflict
+from api.order.serializers.update_serializer import (
+    RELATED_FIELDS,
+    OrderUpdateSerializer,
+)
+from rapihogar.models import Order
+
+
+class OrderBulkUpdateService:
+    """
+    Servicio para modificar muchos pedidos en una sola operación.
+    """
+
+    @staticmethod
+    def update(
+        items: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Valida y aplica los cambios de `items`, una lista de `{id, ...campos}`.
+
+        Los pedidos y las relaciones referenciadas se cargan con una consulta
+        por modelo, cada item se valida con las reglas de
+        `OrderUpdateSerializer` y los pedidos que cambiaron se guardan con
+        `bulk_update` en una sola transacción. Si algún item es inválido no
+        se modifica ningún pedido.
+
+        Como `Order.save_if_version`, los pedidos se leen sin bloquearlos: al
+        guardar se bloquean en orden de pk y solo se modifican si ninguno
+        cambió de versión desde que se leyó.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Dict[str, Any]]: Los pedidos
+            modificados y los errores por posición del item.
+
+        Raises:
+            OrderVersionConflict: Si otra petición modificó alguno de los
+            pedidos, con los items afectados por posición.
+        """
+        errors: Dict[str, Any] = {}
+        ids: List[Any] = []
+        seen_ids: Set[Any] = set()
+        for index, item in enumerate(items):
+            order_id = item.get("id") if isinstance(item, dict) else None
+            if not isinstance(order_id, int) or isinstance(order_id, bool):
+                errors[str(index)] = {"id": ["Se requiere un id de pedido válido."]}
+            elif order_id in seen_ids:
+                errors[str(index)] = {"id": ["El pedido está repetido."]}
+            else:
+                seen_ids.add(order_id)
+            ids.append(order_id)
+
+        orders: Dict[int, Order] = Order.objects.in_bulk(seen_ids)
+        context: Dict[str, Any] = {
+            "related_objects": OrderBulkUpdateService._load_related_objects(items)
+        }
+
+        indexes: List[str] = []
+        serializers: List[OrderUpdateSerializer] = []
+        for index, (order_id, item) in enumerate(zip(ids, items)):
+            if str(index) in errors:
+                continue
+            order = orders.get(order_id)
+            if order is None:
+                errors[str(index)] = {"id": ["No existe el pedido."]}
+                continue
+            data = {key: value for key, value in item.items() if key != "id"}
+            serializer = OrderUpdateSerializer(
+                order, data=data, partial=True, context=context
+            )
+            if serializer.is_valid():
+                indexes.append(str(index))
+                serializers.append(serializer)
+            else:
+                errors[str(index)] = serializer.errors
+
+        if errors:
+            return [], errors
+
+        fields: Set[str] = set()
+        changed_orders: Dict[str, Order] = {}
+        for index, serializer in zip(indexes, serializers):
+            changed_fields = serializer.assign_changes(
+                serializer.instance, serializer.validated_data
+            )
+            if changed_fields:
+                fields.update(changed_fields)
+                changed_orders[index] = serializer.instance
+        if changed_orders:
+            with transaction.atomic():
+                versions: Dict[int, int] = dict(
+                    Order.objects.select_for_update()
+                    .filter(pk__in=[order.pk for order in changed_orders.values()])
+                    .order_by("pk")
+                    .values_list("pk", "version")
+                )
+                conflicts: Dict[str, Any] = {
+                    index: {"id": [OrderVersionConflict.default_detail]}
+                    for index, order in changed_orders.items()
+                    if versions.get(order.pk) != order.version
+                }
+                if conflicts:
+                    raise OrderVersionConflict({"errors": conflicts})
+                Order.objects.bulk_update(list(changed_orders.values()), sorted(fields))
+
+        return [
+            {"id": serializer.instance.id, **serializer.data}
+            for serializer in serializers
+        ], {}
+
+    @staticmethod
+    def _load_related_objects(
+        items: List[Dict[str, Any]],
+    ) -> Dict[type, Dict[Any, Model]]:
+        """
+        Carga con una consulta por modelo los objetos referenciados por los items.
+        """
+        related_objects: Dict[type, Dict[Any, Model]] = {}
+        for field, model in RELATED_FIELDS.items():
+            pks: Set[Any] = set()
+            for item in items:
+                if not isinstance(item, dict) or item.get(field) is None:
+                    continue
+                try:
+                    pks.add(model._meta.pk.to_python(item[field]))
+                except (DjangoValidationError, TypeError, ValueError):
+                    continue
+            related_objects[model] = model.objects.in_bulk(pks) if pks else {}
+        return related_objects
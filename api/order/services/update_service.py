@@ -0,0 +1,81 @@
+from typing import Any, Dict, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Exists, Model, QuerySet
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+from api.order.serializers.update_serializer import RELATED_FIELDS
+from rapihogar.models import Order
+
+RelatedObjects = Dict[type, Dict[Any, Model]]
+RelatedPks = Dict[str, Tuple[type, Any]]
+
+
+class OrderUpdateService:
+    """
+    Servicio para cargar un pedido a modificar junto con sus relaciones.
+    """
+
+    @staticmethod
+    def get_order(pk: int, data: Dict[str, Any]) -> Tuple[Order, RelatedObjects]:
+        """
+        Carga el pedido `pk` y verifica en la misma consulta, con un `EXISTS`
+        por modelo, que existan las relaciones indicadas en `data`.
+
+        Returns:
+            Tuple[Order, RelatedObjects]: El pedido y, por modelo, las
+            relaciones existentes como referencias con solo la pk, para usar
+            como `related_objects` en el contexto de `OrderUpdateSerializer`.
+
+        Raises:
+            Http404: Si el pedido no existe.
+        """
+        queryset, related_pks = OrderUpdateService._get_queryset(data)
+        order: Order = get_object_or_404(queryset, pk=pk)
+        return order, OrderUpdateService._get_related_objects(order, related_pks)
+
+    @staticmethod
+    async def aget_order(pk: int, data: Dict[str, Any]) -> Tuple[Order, RelatedObjects]:
+        """
+        Versión asíncrona de `get_order`.
+        """
+        queryset, related_pks = OrderUpdateService._get_queryset(data)
+        order: Order = await queryset.filter(pk=pk).afirst()
+        if order is None:
+            raise Http404("No existe el pedido.")
+        return order, OrderUpdateService._get_related_objects(order, related_pks)
+
+    @staticmethod
+    def _get_queryset(data: Dict[str, Any]) -> Tuple[QuerySet, RelatedPks]:
+        """
+        Devuelve los pedidos anotados con la existencia de cada relación de
+        `data` y las pks de esas relaciones. Las pks con formato inválido se
+        omiten: el serializador las rechaza sin consultar.
+        """
+        related_pks: RelatedPks = {}
+        for field, model in RELATED_FIELDS.items():
+            if data.get(field) is None:
+                continue
+            try:
+                related_pks[field] = (model, model._meta.pk.to_python(data[field]))
+            except (DjangoValidationError, TypeError, ValueError):
+                related_pks[field] = (model, None)
+
+        queryset: QuerySet = Order.objects.annotate(
+            **{
+                f"{field}_exists": Exists(model.objects.filter(pk=related_pk))
+                for field, (model, related_pk) in related_pks.items()
+                if related_pk is not None
+            }
+        )
+        return queryset, related_pks
+
+    @staticmethod
+    def _get_related_objects(order: Order, related_pks: RelatedPks) -> RelatedObjects:
+        related_objects: RelatedObjects = {}
+        for field, (model, related_pk) in related_pks.items():
+            related_objects[model] = {}
+            if related_pk is not None and getattr(order, f"{field}_exists"):
+                related_objects[model][related_pk] = model(pk=related_pk)
+        return related_objects
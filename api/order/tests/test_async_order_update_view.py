@@ -0,0 +1,140 @@
+from unittest import mock
+
+from django.conf import settings
+from django.middleware.csrf import CSRF_SECRET_LENGTH
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.test import APIClient, APITestCase
+
+from api.order.views.update_view import OrderUpdateView
+from rapihogar.models import Order, Scheme, Technician, TechnicianStats, User
+
+
+class AsyncOrderUpdateViewTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        cls.client_user: User = User.objects.create(
+            first_name="Cliente",
+            last_name="Prueba",
+            email="cliente@prueba.com",
+            username="clienteprueba",
+        )
+        cls.scheme: Scheme = Scheme.objects.create(name="Esquema de prueba")
+        cls.technician1: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        cls.technician2: Technician = Technician.objects.create(
+            first_name="Maria", last_name="Lopez"
+        )
+        cls.order: Order = Order.objects.create(
+            technician=cls.technician1,
+            client=cls.client_user,
+            scheme=cls.scheme,
+            hours_worked=5,
+            type_request=Order.ORDER,
+        )
+        cls.non_editable_order: Order = Order.objects.create(
+            technician=cls.technician2,
+            client=cls.client_user,
+            scheme=cls.scheme,
+            hours_worked=10,
+            type_request=Order.REQUEST,
+        )
+
+    def test_update_order_success(self) -> None:
+        """
+        Verifica que se actualice el pedido, su versión y las estadísticas.
+        """
+        url: str = reverse("order-update-async", args=[self.order.id])
+        response = self.client.patch(
+            url, {"hours_worked": 8, "technician": self.technician2.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["hours_worked"], 8)
+        self.assertEqual(response["ETag"], '"2"')
+
+        stats = TechnicianStats.objects.get(technician=self.technician2)
+        self.assertEqual((stats.total_hours, stats.total_orders), (18, 2))
+
+    def test_update_order_errors(self) -> None:
+        """
+        Verifica las respuestas de error de la vista asíncrona.
+        """
+        url: str = reverse("order-update-async", args=[self.order.id])
+        cases = (
+            (
+                reverse("order-update-async", args=[self.non_editable_order.id]),
+                {"hours_worked": 1},
+                {},
+                status.HTTP_400_BAD_REQUEST,
+            ),
+            (url, {"hours_worked": -1}, {}, status.HTTP_400_BAD_REQUEST),
+            (url, {"technician": 999}, {}, status.HTTP_400_BAD_REQUEST),
+            (
+                url,
+                {"hours_worked": 1},
+                {"HTTP_IF_MATCH": '"7"'},
+                status.HTTP_412_PRECONDITION_FAILED,
+            ),
+            (
+                reverse("order-update-async", args=[999]),
+                {"hours_worked": 1},
+                {},
+                status.HTTP_404_NOT_FOUND,
+            ),
+        )
+        for case_url, data, headers, expected_status in cases:
+            with self.subTest(data=data, headers=headers):
+                response = self.client.patch(case_url, data, format="json", **headers)
+                self.assertEqual(response.status_code, expected_status)
+        self.assertEqual(Order.objects.get(id=self.order.id).hours_worked, 5)
+
+    def test_invalid_json(self) -> None:
+        """
+        Verifica que se rechace un cuerpo que no es JSON.
+        """
+        url: str = reverse("order-update-async", args=[self.order.id])
+        response = self.client.generic(
+            "PATCH", url, "{", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_session_patch_without_csrf_token(self) -> None:
+        """
+        Verifica que con sesión se rechace el PATCH sin token CSRF y se acepte
+        con él.
+        """
+        url: str = reverse("order-update-async", args=[self.order.id])
+        client: APIClient = APIClient(enforce_csrf_checks=True)
+        client.force_login(self.client_user)
+
+        response = client.patch(url, {"hours_worked": 8}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Order.objects.get(id=self.order.id).hours_worked, 5)
+
+        token: str = "a" * CSRF_SECRET_LENGTH
+        client.cookies[settings.CSRF_COOKIE_NAME] = token
+        response = client.patch(
+            url, {"hours_worked": 8}, format="json", HTTP_X_CSRFTOKEN=token
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_uses_sync_view_permissions(self) -> None:
+        """
+        Verifica que se apliquen los permisos de `OrderUpdateView`.
+        """
+        url: str = reverse("order-update-async", args=[self.order.id])
+        with mock.patch.object(
+            OrderUpdateView, "permission_classes", [IsAuthenticated]
+        ):
+            response = self.client.patch(url, {"hours_worked": 8}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+            self.client.force_authenticate(self.client_user)
+            response = self.client.patch(url, {"hours_worked": 8}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Order.objects.get(id=self.order.id).hours_worked, 8)
@@ -0,0 +1,161 @@
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.order.services.bulk_update_service import OrderBulkUpdateService
+from rapihogar.models import Order, Scheme, Technician, TechnicianStats, User
+
+
+class OrderBulkUpdateViewTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        cls.client_user: User = User.objects.create(
+            first_name="Cliente",
+            last_name="Prueba",
+            email="cliente@prueba.com",
+            username="clienteprueba",
+        )
+        cls.scheme: Scheme = Scheme.objects.create(name="Esquema de prueba")
+        cls.technician1: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        cls.technician2: Technician = Technician.objects.create(
+            first_name="Maria", last_name="Lopez"
+        )
+        cls.orders = [
+            Order.objects.create(
+                technician=cls.technician1,
+                client=cls.client_user,
+                scheme=cls.scheme,
+                hours_worked=5,
+                type_request=Order.ORDER,
+            )
+            for _ in range(3)
+        ]
+        cls.non_editable_order: Order = Order.objects.create(
+            technician=cls.technician2,
+            client=cls.client_user,
+            scheme=cls.scheme,
+            hours_worked=10,
+            type_request=2,
+        )
+        cls.url: str = reverse("order-bulk-update")
+
+    def test_bulk_update_success(self) -> None:
+        """
+        Verifica que se actualicen todos los pedidos y las estadísticas de los técnicos.
+        """
+        data = [
+            {"id": self.orders[0].id, "hours_worked": 8},
+            {"id": self.orders[1].id, "technician": self.technician2.id},
+        ]
+        response = self.client.patch(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]["hours_worked"], 8)
+
+        self.assertEqual(Order.objects.get(id=self.orders[0].id).hours_worked, 8)
+        self.assertEqual(
+            Order.objects.get(id=self.orders[1].id).technician_id, self.technician2.id
+        )
+        stats1 = TechnicianStats.objects.get(technician=self.technician1)
+        stats2 = TechnicianStats.objects.get(technician=self.technician2)
+        self.assertEqual((stats1.total_hours, stats1.total_orders), (13, 2))
+        self.assertEqual((stats2.total_hours, stats2.total_orders), (15, 2))
+
+    def test_bulk_update_errors_per_item(self) -> None:
+        """
+        Verifica que se informen los errores por item y no se modifique ningún pedido.
+        """
+        data = [
+            {"id": self.orders[0].id, "hours_worked": 8},
+            {"id": self.non_editable_order.id, "hours_worked": 1},
+            {"id": self.orders[1].id, "hours_worked": -1},
+            {"id": self.orders[2].id, "technician": 999},
+            {"id": 999, "hours_worked": 1},
+            {"hours_worked": 1},
+            {"id": self.orders[0].id, "hours_worked": 2},
+        ]
+        response = self.client.patch(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        errors = response.data["errors"]
+        self.assertEqual(set(errors), {"1", "2", "3", "4", "5", "6"})
+        self.assertIn("Solo se pueden modificar pedidos", str(errors["1"]))
+        self.assertIn("hours_worked", errors["2"])
+        self.assertIn("technician", errors["3"])
+        self.assertEqual(Order.objects.get(id=self.orders[0].id).hours_worked, 5)
+
+    def test_bulk_update_conflicts_with_interleaved_save(self) -> None:
+        """
+        Verifica que si otra petición modifica un pedido después de que se
+        leyó, la modificación masiva responda 412 sin revertir ese cambio ni
+        alterar las estadísticas.
+        """
+        load_related_objects = OrderBulkUpdateService._load_related_objects
+
+        def save_order_meanwhile(items):
+            response = self.client.patch(
+                reverse("order-update", args=[self.orders[1].id]),
+                {"technician": self.technician2.id},
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return load_related_objects(items)
+
+        data = [
+            {"id": self.orders[0].id, "hours_worked": 8},
+            {"id": self.orders[1].id, "hours_worked": 9},
+        ]
+        with patch.object(
+            OrderBulkUpdateService,
+            "_load_related_objects",
+            side_effect=save_order_meanwhile,
+        ):
+            response = self.client.patch(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(set(response.data["errors"]), {"1"})
+
+        order: Order = Order.objects.get(id=self.orders[1].id)
+        self.assertEqual(
+            (order.technician_id, order.hours_worked), (self.technician2.id, 5)
+        )
+        self.assertEqual(Order.objects.get(id=self.orders[0].id).hours_worked, 5)
+        stats1 = TechnicianStats.objects.get(technician=self.technician1)
+        stats2 = TechnicianStats.objects.get(technician=self.technician2)
+        self.assertEqual((stats1.total_hours, stats1.total_orders), (10, 2))
+        self.assertEqual((stats2.total_hours, stats2.total_orders), (15, 2))
+
+    def test_bulk_update_invalid_payload(self) -> None:
+        """
+        Verifica que se rechace un cuerpo que no sea una lista no vacía.
+        """
+        for data in ([], {"id": self.orders[0].id}):
+            response = self.client.patch(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_query_count(self) -> None:
+        """
+        Verifica que la cantidad de consultas no dependa de la cantidad de pedidos.
+        """
+        data = [
+            {
+                "id": order.id,
+                "hours_worked": 7,
+                "technician": self.technician2.id,
+                "client": self.client_user.id,
+                "scheme": self.scheme.id,
+            }
+            for order in self.orders
+        ]
+        # pedidos, clientes, esquemas y técnicos; savepoint, bloqueo y versiones
+        # de los pedidos, bulk_update; alta, bloqueo y actualización de las
+        # estadísticas por técnico y por período; versión de datos y release.
+        with self.assertNumQueries(15), self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,82 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from rapihogar.models import Order, Scheme, Technician, User
+
+INDEX_NAME: str = "order_technician_hours_idx"
+
+
+class OrderIndexTest(TestCase):
+    """
+    Verifica con EXPLAIN que las sumas de horas por técnico se resuelvan con
+    el índice `(technician_id, hours_worked)` sin leer la tabla de pedidos.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        client_user: User = User.objects.create(
+            email="cliente@prueba.com", username="clienteprueba"
+        )
+        scheme: Scheme = Scheme.objects.create(name="Esquema de prueba")
+        cls.technician: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        Order.objects.bulk_create(
+            [
+                Order(
+                    client=client_user,
+                    technician=cls.technician,
+                    scheme=scheme,
+                    hours_worked=index % 10,
+                )
+                for index in range(50)
+            ]
+        )
+
+    def explain(self, queryset) -> str:
+        if connection.vendor == "postgresql":
+            # Con pocas filas PostgreSQL prefiere recorrer la tabla.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def assertIndexOnly(self, plan: str) -> None:
+        if connection.vendor == "postgresql":
+            self.assertIn(f"Index Only Scan using {INDEX_NAME}", plan)
+        else:
+            self.assertIn(f"USING COVERING INDEX {INDEX_NAME}", plan)
+
+    @skipUnless(
+        connection.vendor in ("postgresql", "sqlite"),
+        "Los planes solo se verifican en PostgreSQL y SQLite.",
+    )
+    def test_totals_by_technician_is_index_only(self) -> None:
+        """
+        Verifica que los totales de todos los técnicos se lean del índice.
+        """
+        self.assertIndexOnly(self.explain(Order.objects.totals_by_technician()))
+
+    @skipUnless(
+        connection.vendor in ("postgresql", "sqlite"),
+        "Los planes solo se verifican en PostgreSQL y SQLite.",
+    )
+    def test_technician_totals_is_index_only(self) -> None:
+        """
+        Verifica que los totales de un técnico se lean del índice.
+        """
+        queryset = Order.objects.filter(
+            technician=self.technician
+        ).totals_by_technician()
+        self.assertIndexOnly(self.explain(queryset))
+        self.assertEqual(
+            list(queryset),
+            [
+                {
+                    "technician_id": self.technician.id,
+                    "total_hours": 225,
+                    "total_orders": 50,
+                }
+            ],
+        )
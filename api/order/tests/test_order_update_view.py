@@ -2,7 +2,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from rapihogar.models import Order, Scheme, Technician, User
+from rapihogar.models import Order, Scheme, Technician, TechnicianStats, User
 
 
 class OrderUpdateViewTest(APITestCase):
@@ -89,3 +89,195 @@ class OrderUpdateViewTest(APITestCase):
         new_data: dict = {"hours_worked": invalid_hours_worked}
         response = self.client.patch(url, new_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update_order_query_count(self) -> None:
+        """
+        Verifica que el pedido y sus relaciones se validen en una sola consulta
+        y que solo se escriban los campos que cambiaron.
+        """
+        other_client: User = User.objects.create(
+            email="otro@prueba.com", username="otrocliente"
+        )
+        other_scheme: Scheme = Scheme.objects.create(name="Otro esquema")
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        new_data: dict = {
+            "hours_worked": 5,
+            "technician": self.technician1.id,
+            "client": other_client.id,
+            "scheme": other_scheme.id,
+        }
+        with self.assertNumQueries(2) as queries:
+            response = self.client.patch(url, new_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["client"], other_client.id)
+        update_sql: str = queries.captured_queries[1]["sql"]
+        self.assertIn("client_id", update_sql)
+        self.assertNotIn("hours_worked", update_sql)
+
+        updated_order: Order = Order.objects.get(id=self.valid_order.id)
+        self.assertEqual(updated_order.client_id, other_client.id)
+        self.assertEqual(updated_order.scheme_id, other_scheme.id)
+
+    def test_update_order_without_changes(self) -> None:
+        """
+        Verifica que no se ejecute el UPDATE si ningún campo cambió.
+        """
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        new_data: dict = {
+            "hours_worked": 5,
+            "technician": self.technician1.id,
+            "client": self.client_user.id,
+            "scheme": self.scheme.id,
+        }
+        with self.assertNumQueries(1):
+            response = self.client.patch(url, new_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_update_order_missing_relations(self) -> None:
+        """
+        Verifica que se informen las relaciones inexistentes sin consultas extra.
+        """
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        new_data: dict = {"technician": 999, "client": "abc", "scheme": 999}
+        with self.assertNumQueries(1):
+            response = self.client.patch(url, new_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {"technician", "client", "scheme"})
+
+    def test_update_order_updates_technician_stats(self) -> None:
+        """
+        Verifica que al guardar solo los campos modificados se actualicen las
+        estadísticas de los técnicos.
+        """
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        new_data: dict = {"hours_worked": 8, "technician": self.technician2.id}
+        # Lectura, UPDATE del pedido, creación de la fila faltante, bloqueo y
+        # UPDATE de las dos tablas de totales y renovación de `DataVersion`.
+        with self.assertNumQueries(9), self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, new_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        stats1 = TechnicianStats.objects.get(technician=self.technician1)
+        stats2 = TechnicianStats.objects.get(technician=self.technician2)
+        self.assertEqual((stats1.total_hours, stats1.total_orders), (0, 0))
+        self.assertEqual((stats2.total_hours, stats2.total_orders), (18, 2))
+
+    def test_update_order_hours_query_count(self) -> None:
+        """
+        Verifica que cambiar las horas sume un UPDATE por tabla de totales y
+        la renovación de `DataVersion`.
+        """
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        with self.assertNumQueries(5) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.patch(url, {"hours_worked": 8}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(all(query["sql"].startswith("UPDATE") for query in queries[1:]))
+
+        stats = TechnicianStats.objects.get(technician=self.technician1)
+        self.assertEqual((stats.total_hours, stats.total_orders), (8, 1))
+
+    def test_update_order_returns_version_etag(self) -> None:
+        """
+        Verifica que la respuesta incluya el ETag con la nueva versión del pedido.
+        """
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        response = self.client.patch(url, {"hours_worked": 8}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], '"2"')
+        self.assertEqual(Order.objects.get(id=self.valid_order.id).version, 2)
+
+    def test_update_order_if_match(self) -> None:
+        """
+        Verifica que con `If-Match` solo se modifique la versión indicada.
+        """
+        url: str = reverse("order-update", args=[self.valid_order.id])
+        response = self.client.patch(
+            url, {"hours_worked": 8}, format="json", HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.patch(
+            url, {"hours_worked": 9}, format="json", HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(Order.objects.get(id=self.valid_order.id).hours_worked, 8)
+
+        response = self.client.patch(
+            url, {"hours_worked": 9}, format="json", HTTP_IF_MATCH='"1", "2"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], '"3"')
+
+    def test_save_if_version_conflict(self) -> None:
+        """
+        Verifica que el UPDATE condicional falle si otra modificación cambió
+        la versión y que las estadísticas se mantengan.
+        """
+        order: Order = Order.objects.get(id=self.valid_order.id)
+        Order.objects.filter(id=order.id).update(scheme=None)
+
+        order.hours_worked = 8
+        self.assertFalse(order.save_if_version(order.version, ["hours_worked"]))
+        self.assertEqual(Order.objects.get(id=order.id).hours_worked, 5)
+
+        order = Order.objects.get(id=order.id)
+        order.hours_worked = 8
+        self.assertTrue(order.save_if_version(order.version, ["hours_worked"]))
+        self.assertEqual(order.version, 3)
+        stats = TechnicianStats.objects.get(technician=self.technician1)
+        self.assertEqual((stats.total_hours, stats.total_orders), (8, 1))
+
+    def test_save_increments_version(self) -> None:
+        """
+        Verifica que guardar un pedido incremente su versión en la base de datos.
+        """
+        stale_order: Order = Order.objects.get(id=self.valid_order.id)
+        order: Order = Order.objects.get(id=self.valid_order.id)
+        order.hours_worked = 6
+        order.save()
+        stale_order.save(update_fields=["scheme"])
+        with self.assertNumQueries(0):
+            self.assertEqual(order.version, 2)
+            self.assertEqual(stale_order.version, 3)
+        self.assertEqual(Order.objects.get(id=order.id).version, 3)
+
+    def test_save_unloaded_order_keeps_version(self) -> None:
+        """
+        Verifica que guardar un pedido construido a mano con el pk de uno
+        existente incremente su versión en lugar de volver a la inicial.
+        """
+        Order.objects.filter(id=self.valid_order.id).update(hours_worked=6)
+        order: Order = Order(
+            id=self.valid_order.id,
+            technician=self.technician2,
+            client=self.client_user,
+            scheme=self.scheme,
+            hours_worked=9,
+            created_at=self.valid_order.created_at,
+        )
+        order.save()
+        self.assertEqual(order.version, 3)
+        self.assertEqual(Order.objects.get(id=order.id).version, 3)
+
+        stats1 = TechnicianStats.objects.get(technician=self.technician1)
+        stats2 = TechnicianStats.objects.get(technician=self.technician2)
+        self.assertEqual((stats1.total_hours, stats1.total_orders), (0, 0))
+        self.assertEqual((stats2.total_hours, stats2.total_orders), (19, 2))
+
+    def test_save_new_order_with_pk(self) -> None:
+        """
+        Verifica que un pedido construido a mano con un pk libre se inserte
+        con la versión inicial.
+        """
+        order: Order = Order(
+            id=self.valid_order.id + 100,
+            technician=self.technician1,
+            client=self.client_user,
+            scheme=self.scheme,
+            hours_worked=3,
+        )
+        order.save()
+        self.assertEqual(Order.objects.get(id=order.id).version, 1)
+        stats = TechnicianStats.objects.get(technician=self.technician1)
+        self.assertEqual((stats.total_hours, stats.total_orders), (8, 2))
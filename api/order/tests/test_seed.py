@@ -0,0 +1,280 @@
+import random
+from io import StringIO
+from typing import Any, List, Tuple
+from unittest import skipIf
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Sum
+from django.db.models.signals import post_delete, pre_delete
+from django.test import TestCase, override_settings
+
+from api.order.seed import OrderSeeder
+from rapihogar.models import Order, Scheme, Technician, TechnicianStats, User
+
+
+class OrderSeederTest(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        cls.technicians: List[Technician] = [
+            Technician.objects.create(first_name="Juan", last_name="Perez"),
+            Technician.objects.create(first_name="Maria", last_name="Lopez"),
+        ]
+        cls.clients: List[User] = [
+            User.objects.create(
+                first_name="Cliente",
+                last_name="Prueba",
+                email="cliente@prueba.com",
+                username="clienteprueba",
+            )
+        ]
+        cls.schemes: List[Scheme] = [Scheme.objects.create(name="Esquema de prueba")]
+        cls.technician_ids: List[int] = [
+            technician.id for technician in cls.technicians
+        ]
+        cls.client_ids: List[int] = [client.id for client in cls.clients]
+        cls.scheme_ids: List[int] = [scheme.id for scheme in cls.schemes]
+
+    def test_create_in_batches(self) -> None:
+        """
+        Verifica que los pedidos se creen por lotes y se informe el progreso.
+        """
+        progress: List[Tuple[int, float]] = []
+        created: int = OrderSeeder.create_random_orders_in_batches(
+            self.technician_ids,
+            self.client_ids,
+            self.scheme_ids,
+            250,
+            batch_size=100,
+            progress=lambda count, elapsed: progress.append((count, elapsed)),
+        )
+        self.assertEqual(created, 250)
+        self.assertEqual(Order.objects.count(), 250)
+        self.assertEqual([count for count, _ in progress], [100, 200, 250])
+        self.assertTrue(
+            all(1 <= order.hours_worked <= 10 for order in Order.objects.all())
+        )
+        self.assertEqual(
+            TechnicianStats.objects.aggregate(total=Sum("total_orders"))["total"], 250
+        )
+
+    def test_invalid_arguments(self) -> None:
+        """
+        Verifica que se rechacen tamaños de lote inválidos y COPY fuera de PostgreSQL.
+        """
+        with self.assertRaises(ValueError):
+            OrderSeeder.create_random_orders_in_batches(
+                self.technician_ids, self.client_ids, self.scheme_ids, 10, batch_size=0
+            )
+        with self.assertRaises(ValueError):
+            OrderSeeder.create_random_orders_in_batches(
+                self.technician_ids, self.client_ids, self.scheme_ids, 10, use_copy=True
+            )
+
+    @override_settings(DEBUG=True)
+    def test_generate_orders_command_without_upper_limit(self) -> None:
+        """
+        Verifica que el comando acepte más de 100 pedidos y reporte el progreso.
+        """
+        stdout = StringIO()
+        call_command("generate_orders", 150, "--batch-size", "100", stdout=stdout)
+        self.assertEqual(Order.objects.count(), 150)
+        self.assertIn("100/150 pedidos", stdout.getvalue())
+        self.assertIn("Se generaron 150 pedidos correctamente", stdout.getvalue())
+
+    @override_settings(DEBUG=True)
+    def test_generate_orders_command_is_reproducible(self) -> None:
+        """
+        Verifica que la misma semilla genere los mismos pedidos.
+        """
+        generated: List[List[Tuple[int, int]]] = []
+        for _ in range(2):
+            call_command(
+                "generate_orders", 30, "--delete", "--seed", "42", stdout=StringIO()
+            )
+            generated.append(
+                list(
+                    Order.objects.order_by("id").values_list(
+                        "technician_id", "hours_worked"
+                    )
+                )
+            )
+        self.assertEqual(generated[0], generated[1])
+
+    @override_settings(DEBUG=True)
+    @skipIf(connection.vendor == "postgresql", "COPY está disponible en PostgreSQL.")
+    def test_generate_orders_command_copy_keeps_orders(self) -> None:
+        """
+        Verifica que `--copy` fuera de PostgreSQL falle antes de `--delete`,
+        sin eliminar los pedidos previos.
+        """
+        OrderSeeder.create_random_orders_in_batches(
+            self.technician_ids, self.client_ids, self.scheme_ids, 5
+        )
+        with self.assertRaisesMessage(CommandError, "COPY"):
+            call_command("generate_orders", 10, "--delete", "--copy", stdout=StringIO())
+        self.assertEqual(Order.objects.count(), 5)
+
+    def test_parallel_seed_matches_sequential_seed(self) -> None:
+        """
+        Verifica que con un proceso la carga en paralelo use la misma
+        sub-semilla que la carga por lotes.
+        """
+        results = OrderSeeder.create_random_orders_parallel(
+            self.technician_ids, self.client_ids, self.scheme_ids, 20, workers=1, seed=7
+        )
+        self.assertEqual([result.created for result in results], [20])
+        expected: List[Tuple[int, int]] = [
+            (order.technician_id, order.hours_worked)
+            for order in OrderSeeder.generate_random_orders_by_ids(
+                self.technician_ids,
+                self.client_ids,
+                self.scheme_ids,
+                20,
+                rng=random.Random("7:0"),
+            )
+        ]
+        self.assertEqual(
+            list(
+                Order.objects.order_by("id").values_list(
+                    "technician_id", "hours_worked"
+                )
+            ),
+            expected,
+        )
+
+    def test_get_ids(self) -> None:
+        """
+        Verifica que los ids consecutivos se devuelvan como rango y los demás
+        como lista.
+        """
+        technician_ids = OrderSeeder.get_ids(Technician.objects.all())
+        self.assertIsInstance(technician_ids, range)
+        self.assertEqual(list(technician_ids), self.technician_ids)
+
+        extra: Technician = Technician.objects.create(
+            first_name="Ana", last_name="Diaz"
+        )
+        Technician.objects.filter(id=self.technician_ids[-1]).delete()
+        technician_ids = OrderSeeder.get_ids(Technician.objects.all())
+        self.assertEqual(list(technician_ids), [self.technician_ids[0], extra.id])
+        self.assertNotIsInstance(technician_ids, range)
+
+        self.assertEqual(OrderSeeder.get_ids(Scheme.objects.none()), [])
+
+    def test_generate_from_id_ranges(self) -> None:
+        """
+        Verifica que los pedidos se generen por bloques a partir de rangos de ids.
+        """
+        orders: List[Order] = list(
+            OrderSeeder.generate_random_orders_by_ids(
+                range(1, 4), range(10, 11), [5], OrderSeeder.RANDOM_BLOCK_SIZE + 5
+            )
+        )
+        self.assertEqual(len(orders), OrderSeeder.RANDOM_BLOCK_SIZE + 5)
+        self.assertEqual({order.technician_id for order in orders}, {1, 2, 3})
+        self.assertEqual({order.client_id for order in orders}, {10})
+        self.assertEqual({order.scheme_id for order in orders}, {5})
+        self.assertEqual({order.hours_worked for order in orders}, set(range(1, 11)))
+
+    def test_delete_all_orders_modes(self) -> None:
+        """
+        Verifica que todos los modos eliminen los pedidos y dejen en cero las
+        estadísticas de los técnicos.
+        """
+        self.assertTrue(OrderSeeder.can_purge_orders())
+        test_cases = [
+            (OrderSeeder.DELETE_AUTO, OrderSeeder.DELETE_FAST),
+            (OrderSeeder.DELETE_FAST, OrderSeeder.DELETE_FAST),
+            (OrderSeeder.DELETE_CHUNKED, OrderSeeder.DELETE_CHUNKED),
+            (OrderSeeder.DELETE_STANDARD, OrderSeeder.DELETE_STANDARD),
+        ]
+        for mode, expected_mode in test_cases:
+            with self.subTest(mode=mode):
+                OrderSeeder.create_random_orders_in_batches(
+                    self.technician_ids, self.client_ids, self.scheme_ids, 25
+                )
+                used_mode: str = OrderSeeder.delete_all_orders(mode, chunk_size=10)
+                self.assertEqual(used_mode, expected_mode)
+                self.assertFalse(Order.objects.exists())
+                self.assertFalse(
+                    TechnicianStats.objects.exclude(total_orders=0).exists()
+                )
+
+    def test_delete_all_orders_with_other_receivers(self) -> None:
+        """
+        Verifica que con otros receptores de señales no se use el modo en
+        bloque y que los receptores reciban cada pedido eliminado.
+        """
+        deleted_ids: List[int] = []
+
+        def receiver(sender: Any, instance: Order, **kwargs: Any) -> None:
+            deleted_ids.append(instance.id)
+
+        OrderSeeder.create_random_orders_in_batches(
+            self.technician_ids, self.client_ids, self.scheme_ids, 5
+        )
+        post_delete.connect(receiver, sender=Order)
+        try:
+            self.assertFalse(OrderSeeder.can_purge_orders())
+            with self.assertRaises(ValueError):
+                OrderSeeder.delete_all_orders(OrderSeeder.DELETE_FAST)
+            self.assertEqual(
+                OrderSeeder.delete_all_orders(OrderSeeder.DELETE_AUTO),
+                OrderSeeder.DELETE_CHUNKED,
+            )
+        finally:
+            post_delete.disconnect(receiver, sender=Order)
+        self.assertEqual(len(deleted_ids), 5)
+        self.assertTrue(OrderSeeder.can_purge_orders())
+
+    def test_delete_all_orders_with_receivers_of_any_sender(self) -> None:
+        """
+        Verifica que los receptores conectados sin `sender` o a `pre_delete`
+        también impidan el modo en bloque.
+        """
+        deleted_ids: List[int] = []
+
+        def receiver(sender: Any, instance: Any, **kwargs: Any) -> None:
+            if sender is Order:
+                deleted_ids.append(instance.id)
+
+        OrderSeeder.create_random_orders_in_batches(
+            self.technician_ids, self.client_ids, self.scheme_ids, 3
+        )
+        for signal in (pre_delete, post_delete):
+            with self.subTest(signal=signal):
+                signal.connect(receiver, dispatch_uid="order_stats_delete")
+                try:
+                    self.assertFalse(OrderSeeder.can_purge_orders())
+                finally:
+                    signal.disconnect(dispatch_uid="order_stats_delete")
+                self.assertTrue(OrderSeeder.can_purge_orders())
+
+        # La verificación vuelve a conectar los receptores de este módulo.
+        Order.objects.first().delete()
+        self.assertEqual(
+            TechnicianStats.objects.aggregate(total=Sum("total_orders"))["total"], 2
+        )
+
+        post_delete.connect(receiver)
+        try:
+            self.assertEqual(
+                OrderSeeder.delete_all_orders(OrderSeeder.DELETE_AUTO),
+                OrderSeeder.DELETE_CHUNKED,
+            )
+        finally:
+            post_delete.disconnect(receiver)
+        self.assertEqual(len(deleted_ids), 2)
+
+    def test_split_count(self) -> None:
+        """
+        Verifica que la cantidad se reparta entre procesos sin perder pedidos.
+        """
+        test_cases = [(10, 3, [4, 3, 3]), (2, 4, [1, 1, 0, 0]), (8, 1, [8])]
+        for n, parts, expected in test_cases:
+            with self.subTest(n=n, parts=parts):
+                self.assertEqual(OrderSeeder.split_count(n, parts), expected)
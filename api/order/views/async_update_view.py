@@ -0,0 +1,107 @@
+import json
+from typing import Any, Dict, Optional, Set
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException
+
+from api.order.exceptions import OrderVersionConflict
+from api.order.serializers.update_serializer import OrderUpdateSerializer
+from api.order.services.update_service import OrderUpdateService
+from api.order.views.update_view import OrderUpdateView
+from api.responses import json_response
+
+
+class AsyncOrderUpdateView(View):
+    """
+    Versión asíncrona de `OrderUpdateView` para servidores ASGI.
+
+    No pasa por DRF, pero ejecuta los autenticadores, permisos y límites de
+    `OrderUpdateView`, y `CsrfViewMiddleware` protege la ruta. El pedido se lee con el ORM asíncrono; el UPDATE condicional se ejecuta
+    con `sync_to_async` porque actualiza las estadísticas de los técnicos en
+    una transacción, que el ORM asíncrono no admite.
+    """
+
+    instrumented: bool = True
+
+    async def patch(
+        self, request: HttpRequest, pk: int, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """
+        Actualiza un pedido existente.
+        """
+        denied: Optional[HttpResponse] = await sync_to_async(self.check_access)(request)
+        if denied is not None:
+            return denied
+
+        try:
+            data: Any = json.loads(request.body or b"{}")
+        except ValueError:
+            return json_response(
+                {"detail": "El cuerpo no es un JSON válido."}, status=400
+            )
+
+        order, related_objects = await OrderUpdateService.aget_order(
+            pk, data if isinstance(data, dict) else {}
+        )
+
+        versions: Optional[Set[str]] = OrderUpdateView.parse_if_match(
+            request.headers.get("If-Match")
+        )
+        if versions is not None and "*" not in versions:
+            if str(order.version) not in versions:
+                return self._conflict(OrderVersionConflict())
+
+        serializer: OrderUpdateSerializer = OrderUpdateSerializer(
+            order,
+            data=data,
+            partial=True,
+            context={"related_objects": related_objects},
+        )
+        if not serializer.is_valid():
+            return json_response(serializer.errors, status=400)
+
+        try:
+            await sync_to_async(serializer.save)()
+        except OrderVersionConflict as exc:
+            return self._conflict(exc)
+
+        return json_response(
+            serializer.data, headers={"ETag": OrderUpdateView.etag(order)}
+        )
+
+    def check_access(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """
+        Autentica la petición y comprueba sus permisos y límites con la
+        configuración de `OrderUpdateView`.
+
+        Returns:
+            Optional[HttpResponse]: La respuesta de error, o `None` si la
+            petición puede continuar.
+        """
+        view: OrderUpdateView = OrderUpdateView(
+            args=self.args, kwargs=self.kwargs, format_kwarg=None
+        )
+        view.request = view.initialize_request(request)
+        try:
+            view.perform_authentication(view.request)
+            view.check_permissions(view.request)
+            view.check_throttles(view.request)
+        except APIException as exc:
+            response = view.handle_exception(exc)
+            return json_response(
+                response.data,
+                status=response.status_code,
+                headers={
+                    name: value
+                    for name, value in response.items()
+                    if name in ("WWW-Authenticate", "Retry-After")
+                },
+            )
+        return None
+
+    @staticmethod
+    def _conflict(exc: OrderVersionConflict) -> HttpResponse:
+        data: Dict[str, Any] = {"detail": exc.detail}
+        return json_response(data, status=exc.status_code)
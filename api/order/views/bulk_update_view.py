@@ -0,0 +1,41 @@
+from typing import Any
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.order.services.bulk_update_service import OrderBulkUpdateService
+
+MAX_BULK_ITEMS = 10000
+
+
+class OrderBulkUpdateView(APIView):
+    """
+    Servicio para modificar varios pedidos en una sola petición.
+    """
+
+    def patch(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Actualiza una lista de pedidos `[{id, ...campos}]`. Si algún item es
+        inválido no se modifica ningún pedido y se devuelven los errores por
+        posición; si otra petición modificó alguno de los pedidos mientras
+        tanto, se responde 412 con los items afectados.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Se espera una lista de pedidos no vacía."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > MAX_BULK_ITEMS:
+            return Response(
+                {"detail": f"No se pueden modificar más de {MAX_BULK_ITEMS} pedidos."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        orders, errors = OrderBulkUpdateService.update(items)
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(orders, status=status.HTTP_200_OK)
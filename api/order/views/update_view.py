@@ -1,31 +1,76 @@
-from typing import Any
+from typing import Any, Optional, Set
 
-from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from api.metrics.instrumentation import InstrumentedViewMixin
+from api.order.exceptions import OrderVersionConflict
 from api.order.serializers.update_serializer import OrderUpdateSerializer
+from api.order.services.update_service import OrderUpdateService
 from rapihogar.models import Order
 
 
-class OrderUpdateView(APIView):
+class OrderUpdateView(InstrumentedViewMixin, APIView):
     """
     Servicio para modificar solo los pedidos.
+
+    Cada respuesta incluye el ETag con la versión del pedido. Si la petición
+    envía `If-Match` y el pedido cambió de versión, responde 412.
     """
 
     def patch(self, request: Request, pk: int, *args: Any, **kwargs: Any) -> Response:
         """
-        Actualiza un pedido existente.
+        Actualiza un pedido existente. El pedido y sus relaciones se validan
+        en una sola consulta y solo se escriben los campos que cambiaron, con
+        un UPDATE condicionado a la versión leída.
         """
-        order: Order = get_object_or_404(Order, pk=pk)
+        data = request.data if isinstance(request.data, dict) else {}
+        order, related_objects = OrderUpdateService.get_order(pk, data)
+
+        versions: Optional[Set[str]] = self.parse_if_match(
+            request.headers.get("If-Match")
+        )
+        if versions is not None and "*" not in versions:
+            if str(order.version) not in versions:
+                raise OrderVersionConflict()
+
         serializer: OrderUpdateSerializer = OrderUpdateSerializer(
-            order, data=request.data, partial=True
+            order,
+            data=request.data,
+            partial=True,
+            context={"related_objects": related_objects},
         )
 
         if serializer.is_valid():
             serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(
+                serializer.data,
+                status=status.HTTP_200_OK,
+                headers={"ETag": self.etag(order)},
+            )
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @staticmethod
+    def etag(order: Order) -> str:
+        """
+        Devuelve el ETag del pedido, derivado de su versión.
+        """
+        return f'"{order.version}"'
+
+    @staticmethod
+    def parse_if_match(header: Optional[str]) -> Optional[Set[str]]:
+        """
+        Devuelve las versiones aceptadas por el encabezado `If-Match`, o
+        `None` si no se envió.
+        """
+        if header is None:
+            return None
+        versions: Set[str] = set()
+        for etag in header.split(","):
+            etag = etag.strip()
+            # Los ETag débiles nunca coinciden en `If-Match`.
+            versions.add(etag if etag.startswith("W/") else etag.strip('"'))
+        return versions
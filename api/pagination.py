@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from rest_framework import serializers
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+
+
+class PageQuerySerializer(serializers.Serializer):
+    """
+    Valida los parámetros de la paginación por id: `cursor` es el último id
+    de la página anterior y `page_size` la cantidad de filas por página.
+    """
+
+    cursor = serializers.IntegerField(required=False, min_value=0)
+    page_size = serializers.IntegerField(
+        required=False, min_value=1, max_value=MAX_PAGE_SIZE
+    )
+
+
+def is_paginated(params: Dict[str, Any]) -> bool:
+    """
+    Indica si los parámetros validados piden una página: solo se pagina si la
+    petición envía `cursor` o `page_size`.
+    """
+    return params.get("cursor") is not None or params.get("page_size") is not None
+
+
+def split_page(rows: Sequence[Any], page_size: int) -> Tuple[List[Any], Optional[int]]:
+    """
+    Recibe hasta `page_size + 1` filas ordenadas por id y devuelve las de la
+    página junto con el cursor de la siguiente, o `None` si es la última.
+    """
+    page: List[Any] = list(rows[:page_size])
+    next_cursor: Optional[int] = page[-1].pk if len(rows) > page_size else None
+    return page, next_cursor
+
+
+def paginated_data(
+    request: HttpRequest, results: List[Any], next_cursor: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Devuelve el cuerpo de una página: `results` y `next`, la URL relativa de
+    la siguiente página con los mismos parámetros, o `None` si es la última.
+    """
+    next_url: Optional[str] = None
+    if next_cursor is not None:
+        next_url = replace_query_param(request.get_full_path(), "cursor", next_cursor)
+    return {"results": results, "next": next_url}
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación de DRF por id, con el mismo cuerpo que el listado de pagos de
+    técnicos. Sin `cursor` ni `page_size` devuelve el listado completo.
+    """
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Optional[object] = None
+    ) -> Optional[List[Any]]:
+        query_serializer = PageQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params: Dict[str, Any] = query_serializer.validated_data
+        if not is_paginated(params):
+            return None
+
+        if params.get("cursor") is not None:
+            queryset = queryset.filter(pk__gt=params["cursor"])
+        page_size: int = params.get("page_size") or DEFAULT_PAGE_SIZE
+        self.request = request
+        page, self.next_cursor = split_page(
+            list(queryset.order_by("pk")[: page_size + 1]), page_size
+        )
+        return page
+
+    def get_paginated_response(self, data: List[Any]) -> Response:
+        return Response(paginated_data(self.request, data, self.next_cursor))
@@ -0,0 +1,69 @@
+import re
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+# Números que orjson escribe distinto que `json`: los floats menores que 1e-4
+# en valor absoluto (0.00001 en lugar de 1e-05) y los que usan exponente
+# (1e16 en lugar de 1e+16). Solo se buscan al principio o después de `:`, `,`
+# o `[`; una coincidencia dentro de un string solo hace usar `JSONRenderer`.
+DIVERGENT_FLOAT_PATTERN = re.compile(rb"(?:^|[:,\[])-?(?:0\.0000|\d+(?:\.\d+)?e)")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` que serializa con orjson si está instalado.
+
+    Genera los mismos bytes que `JSONRenderer` con la configuración por
+    defecto de DRF (compacto, sin escapar unicode): las fechas, decimales y
+    demás tipos que orjson no serializa igual se delegan en el encoder de DRF.
+    Si orjson no está instalado, se pide indentación, la serialización falla
+    (por ejemplo, enteros de más de 64 bits) o la salida tiene floats que
+    orjson escribe distinto (menores que 1e-4 o desde 1e16 en valor
+    absoluto), se usa `JSONRenderer`.
+    """
+
+    if orjson is not None:
+        OPTIONS: int = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            content: bytes = orjson.dumps(
+                data, default=JSONEncoder().default, option=self.OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if DIVERGENT_FLOAT_PATTERN.search(content):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Igual que `JSONRenderer`, se escapan U+2028 y U+2029 para que el
+        # resultado sea un subconjunto estricto de JavaScript.
+        if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+            content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return content
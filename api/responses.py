@@ -0,0 +1,26 @@
+from typing import Any, Dict, Optional
+
+from django.http import HttpResponse
+
+from api.metrics.instrumentation import measure_serialization
+from api.renderers import FastJSONRenderer
+
+# Mismo formato que el `JSONRenderer` de DRF: compacto y sin escapar unicode.
+JSON_DUMPS_PARAMS: Dict[str, Any] = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def json_response(
+    data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None
+) -> HttpResponse:
+    """
+    Devuelve `data` como JSON con el mismo renderer que las vistas de DRF,
+    para las vistas asíncronas que no pasan por DRF.
+    """
+    with measure_serialization():
+        content: bytes = FastJSONRenderer().render(data)
+    return HttpResponse(
+        content,
+        status=status,
+        headers=headers,
+        content_type=FastJSONRenderer.media_type,
+    )
@@ -0,0 +1,165 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import (
+    Avg,
+    BooleanField,
+    ExpressionWrapper,
+    F,
+    FilteredRelation,
+    Q,
+    QuerySet,
+    Window,
+)
+from django.db.models.functions import Coalesce, FirstValue
+
+from api.technician.services.payment_service import PaymentService
+from api.technician.value_objects import TechnicianPayment
+from rapihogar.models import Technician
+
+
+class TechnicianRepository:
+    """
+    Consultas de técnicos con sus totales calculados en la base de datos.
+    """
+
+    @staticmethod
+    def filter_by_name(queryset: QuerySet, name: str) -> QuerySet:
+        """
+        Filtra los técnicos cuyo nombre o apellido contiene `name`.
+
+        En PostgreSQL `icontains` se traduce a `UPPER(columna::text) LIKE`,
+        expresión cubierta por los índices de trigramas de la migración 0008.
+        En otros motores (SQLite en los tests) es un `LIKE` sin índice.
+        """
+        return queryset.filter(
+            Q(first_name__icontains=name) | Q(last_name__icontains=name)
+        )
+
+    @staticmethod
+    def with_payment_totals(
+        queryset: Optional[QuerySet] = None, period: Optional[date] = None
+    ) -> QuerySet:
+        """
+        Anota cada técnico con `total_hours`, `total_orders` y `total_payment`.
+
+        Los totales se leen de `TechnicianStats` o, si se indica `period`, de
+        la fila de ese período de `TechnicianPeriodStats`. Ambas se mantienen
+        al modificar pedidos, por lo que la consulta no recorre la tabla de
+        pedidos. El pago se calcula en la base de datos con la misma tabla de
+        tarifas que `PaymentService`, de modo que se puede filtrar, ordenar y
+        paginar por pago sin traer los técnicos a Python.
+        """
+        if queryset is None:
+            queryset = Technician.objects.all()
+        totals: str = "stats"
+        if period is not None:
+            queryset = queryset.annotate(
+                period_totals=FilteredRelation(
+                    "period_stats", condition=Q(period_stats__period=period)
+                )
+            )
+            totals = "period_totals"
+        default_total: int = 0
+        return queryset.annotate(
+            total_hours=Coalesce(F(f"{totals}__total_hours"), default_total),
+            total_orders=Coalesce(F(f"{totals}__total_orders"), default_total),
+        ).annotate(total_payment=PaymentService.get_payment_expression("total_hours"))
+
+    @staticmethod
+    def supports_report_query() -> bool:
+        """
+        Indica si el informe completo se puede calcular con una sola consulta.
+        Solo se usa en PostgreSQL; en otros motores se calcula en Python.
+        """
+        return connection.vendor == "postgresql"
+
+    @staticmethod
+    def get_report(period: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Calcula el informe de técnicos, del período `period` si se indica, en
+        una sola consulta.
+
+        Funciones de ventana sobre el pago de cada técnico obtienen el
+        promedio y los ids del monto más bajo (ante empates, el de mayor id)
+        y más alto (ante empates, el de menor id). La consulta solo devuelve
+        los técnicos por debajo del promedio y esos dos, ordenados por id.
+        """
+        return TechnicianRepository._report_from_rows(
+            list(TechnicianRepository._report_query(period))
+        )
+
+    @staticmethod
+    async def aget_report(period: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Versión asíncrona de `get_report`.
+        """
+        return TechnicianRepository._report_from_rows(
+            [row async for row in TechnicianRepository._report_query(period)]
+        )
+
+    @staticmethod
+    def _report_query(period: Optional[date] = None) -> QuerySet:
+        """
+        Consulta del informe: por cada técnico devuelto, (id, nombre,
+        apellido, pago, si está por debajo del promedio, promedio, id del
+        monto más bajo, id del monto más alto).
+        """
+        return (
+            TechnicianRepository.with_payment_totals(period=period)
+            .annotate(
+                average_payment=Window(Avg("total_payment")),
+                lowest_paid_id=Window(
+                    FirstValue("id"),
+                    order_by=[F("total_payment").asc(), F("id").desc()],
+                ),
+                highest_paid_id=Window(
+                    FirstValue("id"),
+                    order_by=[F("total_payment").desc(), F("id").asc()],
+                ),
+            )
+            .annotate(
+                is_below_average=ExpressionWrapper(
+                    Q(total_payment__lt=F("average_payment")),
+                    output_field=BooleanField(),
+                )
+            )
+            .filter(
+                Q(is_below_average=True)
+                | Q(id=F("lowest_paid_id"))
+                | Q(id=F("highest_paid_id"))
+            )
+            .order_by("id")
+            .values_list(
+                "id",
+                "first_name",
+                "last_name",
+                "total_payment",
+                "is_below_average",
+                "average_payment",
+                "lowest_paid_id",
+                "highest_paid_id",
+            )
+        )
+
+    @staticmethod
+    def _report_from_rows(rows: List[Tuple[Any, ...]]) -> Dict[str, Any]:
+        """
+        Arma el informe a partir de las filas de `_report_query`.
+        """
+
+        def to_dict(row: Tuple[Any, ...]) -> Dict[str, Any]:
+            return TechnicianPayment.from_row(row[:4]).to_dict()
+
+        default_average: float = 0.0
+        return {
+            "average_payment": round(rows[0][5], 2) if rows else default_average,
+            "below_average_technicians": [to_dict(row) for row in rows if row[4]],
+            "lowest_paid_technician": next(
+                (to_dict(row) for row in rows if row[0] == row[6]), None
+            ),
+            "highest_paid_technician": next(
+                (to_dict(row) for row in rows if row[0] == row[7]), None
+            ),
+        }
@@ -0,0 +1,47 @@
+from typing import Any, Dict
+
+from rest_framework import serializers
+
+from api.pagination import PageQuerySerializer
+from api.technician.serializers.period_field import PeriodField
+
+
+class TechnicianPaymentQuerySerializer(PageQuerySerializer):
+    """
+    Valida los parámetros de consulta del listado de pagos de técnicos.
+
+    `cursor` y `page_size` activan la paginación por id de
+    `PageQuerySerializer`; `stream` activa la respuesta en streaming y `period` limita
+    los totales a los pedidos de ese período de liquidación.
+    """
+
+    name = serializers.CharField(required=False, allow_blank=True, default="")
+    min_payment = serializers.FloatField(required=False)
+    max_payment = serializers.FloatField(required=False)
+    stream = serializers.BooleanField(required=False, default=False)
+    period = PeriodField(required=False)
+
+    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Valida que `min_payment` no sea mayor que `max_payment`.
+
+        Args:
+            data (Dict[str, Any]): Los parámetros de consulta a validar.
+
+        Raises:
+            serializers.ValidationError: Si el rango de pagos es inválido.
+
+        Returns:
+            Dict[str, Any]: Los parámetros validados.
+        """
+        min_payment = data.get("min_payment")
+        max_payment = data.get("max_payment")
+        if (
+            min_payment is not None
+            and max_payment is not None
+            and min_payment > max_payment
+        ):
+            raise serializers.ValidationError(
+                "min_payment no puede ser mayor que max_payment."
+            )
+        return data
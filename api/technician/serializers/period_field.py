@@ -0,0 +1,24 @@
+from datetime import date, datetime
+from typing import Any
+
+from rest_framework import serializers
+
+
+class PeriodField(serializers.Field):
+    """
+    Período de liquidación con formato `AAAA-MM`, representado por la fecha
+    de su primer día.
+    """
+
+    default_error_messages = {
+        "invalid": "El período debe tener el formato AAAA-MM.",
+    }
+
+    def to_internal_value(self, data: Any) -> date:
+        try:
+            return datetime.strptime(str(data), "%Y-%m").date()
+        except ValueError:
+            self.fail("invalid")
+
+    def to_representation(self, value: date) -> str:
+        return value.strftime("%Y-%m")
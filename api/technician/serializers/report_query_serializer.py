@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from api.technician.serializers.period_field import PeriodField
+
+
+class TechnicianReportQuerySerializer(serializers.Serializer):
+    """
+    Valida los parámetros de consulta del informe de técnicos.
+
+    Con `period` el informe se calcula con los pagos de ese período.
+    """
+
+    period = PeriodField(required=False)
@@ -1,4 +1,8 @@
-from typing import List
+from bisect import bisect_right
+from typing import Iterable, List
+
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Cast
 
 
 class PaymentService:
@@ -13,6 +17,11 @@ class PaymentService:
         {"min_hours": 48, "max_hours": float("inf"), "rate": 350, "discount": 0.18},
     ]
 
+    # Límites inferiores de cada tramo, ordenados, para ubicar el tramo por búsqueda binaria.
+    TIER_BOUNDARIES: List[int] = [config["min_hours"] for config in RATE_CONFIG]
+    TIER_RATES: List[int] = [config["rate"] for config in RATE_CONFIG]
+    TIER_DISCOUNTS: List[float] = [config["discount"] for config in RATE_CONFIG]
+
     @staticmethod
     def get_rate_config(total_hours: int) -> dict:
         """
@@ -35,3 +44,59 @@ class PaymentService:
         gross_payment: float = total_hours * config["rate"]
         total_payment: float = gross_payment - (gross_payment * config["discount"])
         return total_payment
+
+    @staticmethod
+    def calculate_payments(hours: Iterable[int]) -> List[float]:
+        """
+        Calcula el pago de muchos técnicos en una sola pasada.
+
+        Ubica el tramo de cada total de horas con búsqueda binaria sobre
+        `TIER_BOUNDARIES` y aplica exactamente las mismas operaciones que
+        `calculate_payment`, por lo que los resultados son idénticos.
+        """
+        boundaries: List[int] = PaymentService.TIER_BOUNDARIES
+        rates: List[int] = PaymentService.TIER_RATES
+        discounts: List[float] = PaymentService.TIER_DISCOUNTS
+
+        payments: List[float] = []
+        for total_hours in hours:
+            if not isinstance(total_hours, int):
+                raise ValueError("El número de horas trabajadas debe ser un entero.")
+            tier: int = bisect_right(boundaries, total_hours) - 1
+            if tier < 0:
+                raise ValueError("Horas trabajadas fuera de los rangos definidos.")
+            gross_payment: float = total_hours * rates[tier]
+            payments.append(gross_payment - (gross_payment * discounts[tier]))
+        return payments
+
+    @staticmethod
+    def get_payment_expression(hours_field: str) -> Case:
+        """
+        Construye una expresión `Case/When` equivalente a `calculate_payments`
+        para calcular el pago en la base de datos a partir de `hours_field`.
+
+        Usa los mismos `TIER_BOUNDARIES`: recorre los tramos de mayor a menor
+        y toma el primero cuyo límite inferior no supera las horas. Las
+        operaciones se hacen en punto flotante de doble precisión y en el
+        mismo orden que en Python, por lo que el resultado es idéntico.
+        Si las horas no caen en ningún tramo, el resultado es NULL.
+        """
+        whens: List[When] = []
+        for boundary, rate, discount in reversed(
+            list(
+                zip(
+                    PaymentService.TIER_BOUNDARIES,
+                    PaymentService.TIER_RATES,
+                    PaymentService.TIER_DISCOUNTS,
+                )
+            )
+        ):
+            gross_payment = Cast(F(hours_field) * rate, FloatField())
+            whens.append(
+                When(
+                    Q(**{f"{hours_field}__gte": boundary}),
+                    then=gross_payment
+                    - (gross_payment * Value(discount, output_field=FloatField())),
+                )
+            )
+        return Case(*whens, output_field=FloatField())
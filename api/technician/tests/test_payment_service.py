@@ -1,5 +1,6 @@
+import random
 import unittest
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from api.technician.services.payment_service import PaymentService
 
@@ -67,6 +68,43 @@ class TestPaymentService(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     PaymentService.calculate_payment(hours)
 
+    def test_tiers_are_contiguous(self) -> None:
+        """
+        Verifica que cada tramo empiece donde termina el anterior, ya que
+        `calculate_payments` y `get_payment_expression` solo usan los límites
+        inferiores de `TIER_BOUNDARIES`.
+        """
+        for previous, config in zip(
+            PaymentService.RATE_CONFIG, PaymentService.RATE_CONFIG[1:]
+        ):
+            with self.subTest(min_hours=config["min_hours"]):
+                self.assertEqual(config["min_hours"], previous["max_hours"] + 1)
+        self.assertEqual(PaymentService.RATE_CONFIG[-1]["max_hours"], float("inf"))
+
+    def test_calculate_payments_matches_scalar(self) -> None:
+        """
+        Verifica que el cálculo por lotes coincida exactamente con el cálculo individual.
+        """
+        rng: random.Random = random.Random(20250422)
+        boundary_hours: List[int] = list(range(0, 200))
+        random_hours: List[int] = [rng.randint(0, 1_000_000) for _ in range(5000)]
+        for hours in (boundary_hours, random_hours, []):
+            with self.subTest(f"Testing {len(hours)} hours"):
+                expected: List[float] = [
+                    PaymentService.calculate_payment(value) for value in hours
+                ]
+                self.assertEqual(PaymentService.calculate_payments(hours), expected)
+
+    def test_calculate_payments_invalid_hours(self) -> None:
+        """
+        Verifica que el cálculo por lotes rechace horas inválidas igual que el individual.
+        """
+        invalid_batches: List[List[Any]] = [[10, -1], [-100], [5, 2.5]]
+        for hours in invalid_batches:
+            with self.subTest(f"Testing invalid batch: {hours}"):
+                with self.assertRaises(ValueError):
+                    PaymentService.calculate_payments(hours)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,294 @@
+from datetime import date, datetime, timezone
+from io import StringIO
+from typing import Dict, Tuple
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from rapihogar.models import (
+    DataVersion,
+    Order,
+    Scheme,
+    Technician,
+    TechnicianPeriodStats,
+    TechnicianStats,
+    User,
+    payroll_period,
+)
+
+SEPTEMBER: date = date(2026, 9, 1)
+OCTOBER: date = date(2026, 10, 1)
+
+
+class TechnicianPeriodStatsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        cls.client_user: User = User.objects.create(
+            email="cliente@prueba.com", username="clienteprueba"
+        )
+        cls.scheme: Scheme = Scheme.objects.create(name="Esquema de prueba")
+        cls.technician1: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        cls.technician2: Technician = Technician.objects.create(
+            first_name="Maria", last_name="Lopez"
+        )
+
+    def _create_order(
+        self, technician: Technician, hours_worked: int, period: date
+    ) -> Order:
+        return Order.objects.create(
+            technician=technician,
+            client=self.client_user,
+            scheme=self.scheme,
+            hours_worked=hours_worked,
+            created_at=datetime(period.year, period.month, 15, tzinfo=timezone.utc),
+        )
+
+    def _period_stats(self) -> Dict[Tuple[int, date], Tuple[int, int]]:
+        return {
+            (stats.technician_id, stats.period): (stats.total_hours, stats.total_orders)
+            for stats in TechnicianPeriodStats.objects.exclude(total_orders=0)
+        }
+
+    def test_payroll_period(self) -> None:
+        """
+        Verifica que el período sea el primer día del mes del pedido.
+        """
+        self.assertEqual(
+            payroll_period(datetime(2026, 10, 31, 23, 59, tzinfo=timezone.utc)),
+            OCTOBER,
+        )
+
+    def test_orders_update_period_stats(self) -> None:
+        """
+        Verifica que crear, modificar y eliminar pedidos actualice los totales
+        de su período sin tocar los de otros períodos.
+        """
+        order: Order = self._create_order(self.technician1, 5, SEPTEMBER)
+        self._create_order(self.technician1, 3, OCTOBER)
+        self.assertEqual(
+            self._period_stats(),
+            {
+                (self.technician1.id, SEPTEMBER): (5, 1),
+                (self.technician1.id, OCTOBER): (3, 1),
+            },
+        )
+
+        order.technician = self.technician2
+        order.hours_worked = 7
+        order.save()
+        self.assertEqual(
+            self._period_stats(),
+            {
+                (self.technician2.id, SEPTEMBER): (7, 1),
+                (self.technician1.id, OCTOBER): (3, 1),
+            },
+        )
+
+        order.created_at = datetime(2026, 10, 2, tzinfo=timezone.utc)
+        order.save(update_fields=["created_at"])
+        self.assertEqual(
+            self._period_stats(),
+            {
+                (self.technician2.id, OCTOBER): (7, 1),
+                (self.technician1.id, OCTOBER): (3, 1),
+            },
+        )
+
+        order.delete()
+        self.assertEqual(self._period_stats(), {(self.technician1.id, OCTOBER): (3, 1)})
+
+    def test_bulk_operations_update_period_stats(self) -> None:
+        """
+        Verifica que `bulk_create` y `bulk_update` mantengan los totales por
+        período.
+        """
+        orders = Order.objects.bulk_create(
+            [
+                Order(
+                    technician=self.technician1,
+                    client=self.client_user,
+                    scheme=self.scheme,
+                    hours_worked=2,
+                    created_at=datetime(2026, month, 1, tzinfo=timezone.utc),
+                )
+                for month in (9, 9, 10)
+            ]
+        )
+        self.assertEqual(
+            self._period_stats(),
+            {
+                (self.technician1.id, SEPTEMBER): (4, 2),
+                (self.technician1.id, OCTOBER): (2, 1),
+            },
+        )
+        for order in orders:
+            order.technician = self.technician2
+        Order.objects.bulk_update(orders, ["technician"])
+        self.assertEqual(
+            self._period_stats(),
+            {
+                (self.technician2.id, SEPTEMBER): (4, 2),
+                (self.technician2.id, OCTOBER): (2, 1),
+            },
+        )
+
+    def test_queryset_update_created_at(self) -> None:
+        """
+        Verifica que `QuerySet.update` de la fecha mueva los totales al nuevo
+        período sin cambiar los totales generales del técnico.
+        """
+        self._create_order(self.technician1, 5, SEPTEMBER)
+        self._create_order(self.technician1, 3, SEPTEMBER)
+        token: str = DataVersion.objects.get_token(DataVersion.TECHNICIANS)
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.update(created_at=datetime(2026, 10, 2, tzinfo=timezone.utc))
+        self.assertEqual(self._period_stats(), {(self.technician1.id, OCTOBER): (8, 2)})
+        stats: TechnicianStats = TechnicianStats.objects.get(
+            technician=self.technician1
+        )
+        self.assertEqual((stats.total_hours, stats.total_orders), (8, 2))
+        self.assertNotEqual(
+            DataVersion.objects.get_token(DataVersion.TECHNICIANS), token
+        )
+
+    def test_orders_without_date_have_no_period(self) -> None:
+        """
+        Verifica que los pedidos sin fecha, como los anteriores a
+        `created_at`, sumen a los totales del técnico pero a ningún período,
+        también al recalcularlos.
+        """
+        order: Order = self._create_order(self.technician1, 5, SEPTEMBER)
+        self._create_order(self.technician1, 3, OCTOBER)
+        Order.objects.filter(pk=order.pk).update(created_at=None)
+        self.assertEqual(self._period_stats(), {(self.technician1.id, OCTOBER): (3, 1)})
+        stats: TechnicianStats = TechnicianStats.objects.get(
+            technician=self.technician1
+        )
+        self.assertEqual((stats.total_hours, stats.total_orders), (8, 2))
+
+        call_command("rebuild_technician_stats", stdout=StringIO())
+        self.assertEqual(self._period_stats(), {(self.technician1.id, OCTOBER): (3, 1)})
+
+        order = Order.objects.get(pk=order.pk)
+        order.hours_worked = 4
+        order.save()
+        self.assertEqual(self._period_stats(), {(self.technician1.id, OCTOBER): (3, 1)})
+        order.delete()
+        self.assertEqual(self._period_stats(), {(self.technician1.id, OCTOBER): (3, 1)})
+
+    def test_rebuild_command(self) -> None:
+        """
+        Verifica que el comando recalcule los totales por período.
+        """
+        self._create_order(self.technician1, 5, SEPTEMBER)
+        self._create_order(self.technician1, 4, SEPTEMBER)
+        self._create_order(self.technician2, 3, OCTOBER)
+        expected = self._period_stats()
+        TechnicianPeriodStats.objects.all().delete()
+        call_command("rebuild_technician_stats", stdout=StringIO())
+        self.assertEqual(self._period_stats(), expected)
+
+
+class TechnicianPeriodViewsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura técnicos con pedidos en septiembre y octubre.
+        """
+        client_user: User = User.objects.create(
+            email="cliente@prueba.com", username="clienteprueba"
+        )
+        cls.technician1: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        cls.technician2: Technician = Technician.objects.create(
+            first_name="Maria", last_name="Lopez"
+        )
+        for technician, hours_worked, month in (
+            (cls.technician1, 10, 9),
+            (cls.technician1, 20, 10),
+            (cls.technician2, 40, 10),
+        ):
+            Order.objects.create(
+                technician=technician,
+                client=client_user,
+                hours_worked=hours_worked,
+                created_at=datetime(2026, month, 10, tzinfo=timezone.utc),
+            )
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def _payments(self, url_name: str, period: str) -> Dict[str, Tuple[int, int]]:
+        response = self.client.get(reverse(url_name), {"period": period})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {
+            row["full_name"]: (row["total_hours"], row["total_orders"])
+            for row in response.json()
+        }
+
+    def test_payments_by_period(self) -> None:
+        """
+        Verifica que `period` limite los totales a los pedidos del período,
+        también en la vista asíncrona.
+        """
+        for url_name in ("technician-payments-list", "technician-payments-list-async"):
+            with self.subTest(url_name):
+                self.assertEqual(
+                    self._payments(url_name, "2026-09"),
+                    {"Juan Perez": (10, 1), "Maria Lopez": (0, 0)},
+                )
+                self.assertEqual(
+                    self._payments(url_name, "2026-10"),
+                    {"Juan Perez": (20, 1), "Maria Lopez": (40, 1)},
+                )
+
+    def test_period_does_not_scan_orders(self) -> None:
+        """
+        Verifica que los pagos de un período se lean de los totales por
+        período y no de la tabla de pedidos.
+        """
+        with self.assertNumQueries(2) as context:
+            self.client.get(reverse("technician-payments-list"), {"period": "2026-09"})
+        payments_sql: str = context.captured_queries[-1]["sql"]
+        self.assertIn("rapihogar_technicianperiodstats", payments_sql)
+        self.assertNotIn("rapihogar_order", payments_sql)
+
+    def test_report_by_period(self) -> None:
+        """
+        Verifica que el informe use los pagos del período indicado.
+        """
+        for url_name in ("technician-report", "technician-report-async"):
+            with self.subTest(url_name):
+                response = self.client.get(reverse(url_name), {"period": "2026-09"})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                report = response.json()
+                self.assertEqual(
+                    report["highest_paid_technician"]["full_name"], "Juan Perez"
+                )
+                self.assertEqual(
+                    report["lowest_paid_technician"]["full_name"], "Maria Lopez"
+                )
+
+    def test_invalid_period(self) -> None:
+        """
+        Verifica que un período con formato inválido devuelva 400.
+        """
+        for url_name in (
+            "technician-payments-list",
+            "technician-payments-list-async",
+            "technician-report",
+            "technician-report-async",
+        ):
+            with self.subTest(url_name):
+                response = self.client.get(reverse(url_name), {"period": "2026-13"})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("period", response.json())
@@ -0,0 +1,104 @@
+from typing import Any, Dict, List
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from api.technician.repositories.technician_repository import TechnicianRepository
+from api.technician.services.payment_service import PaymentService
+from api.technician.value_objects import ReportSummary
+from rapihogar.models import Order, Scheme, Technician, TechnicianStats, User
+
+
+class TechnicianRepositoryTest(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Crea un técnico por cada total de horas a verificar, incluyendo los
+        límites de todos los tramos.
+        """
+        cls.hours: List[int] = [0, 1, 7, 14, 15, 20, 28, 29, 33, 47, 48, 99, 1234]
+        client: User = User.objects.create(
+            first_name="Cliente",
+            last_name="Prueba",
+            email="cliente@prueba.com",
+            username="clienteprueba",
+        )
+        scheme: Scheme = Scheme.objects.create(name="Esquema de prueba")
+        for hours in cls.hours:
+            technician: Technician = Technician.objects.create(
+                first_name="Tecnico", last_name=str(hours)
+            )
+            if hours:
+                Order.objects.create(
+                    technician=technician,
+                    client=client,
+                    scheme=scheme,
+                    hours_worked=hours,
+                    type_request=Order.ORDER,
+                )
+
+    def test_payment_matches_payment_service(self) -> None:
+        """
+        Verifica que el pago calculado en la base de datos sea idéntico al de
+        `PaymentService.calculate_payment` y `calculate_payments`.
+        """
+        technicians = list(TechnicianRepository.with_payment_totals())
+        payments: List[float] = PaymentService.calculate_payments(
+            [technician.total_hours for technician in technicians]
+        )
+        for technician, payment in zip(technicians, payments):
+            with self.subTest(hours=technician.total_hours):
+                self.assertEqual(technician.total_payment, payment)
+                self.assertEqual(
+                    technician.total_payment,
+                    PaymentService.calculate_payment(technician.total_hours),
+                )
+
+    def test_filter_and_order_by_payment(self) -> None:
+        """
+        Verifica que se pueda filtrar y ordenar por pago en la base de datos.
+        """
+        technicians = (
+            TechnicianRepository.with_payment_totals()
+            .filter(total_payment__gte=3150)
+            .order_by("-total_payment")
+        )
+        self.assertEqual(
+            [technician.total_hours for technician in technicians],
+            sorted((hours for hours in self.hours if hours >= 15), reverse=True),
+        )
+
+    @skipUnless(
+        connection.features.supports_over_clause, "Requiere funciones de ventana"
+    )
+    def test_report_query_matches_python_report(self) -> None:
+        """
+        Verifica que el informe calculado en una sola consulta coincida con
+        el calculado en Python, incluyendo el desempate por id.
+        """
+        # Técnicos con los mismos montos que el más bajo y el más alto, para
+        # ejercitar el desempate por id.
+        Technician.objects.create(first_name="Empate", last_name="0")
+        TechnicianStats.objects.create(
+            technician=Technician.objects.create(first_name="Empate", last_name="1234"),
+            total_hours=1234,
+            total_orders=1,
+        )
+
+        python_report: Dict[str, Any] = ReportSummary.from_rows(
+            TechnicianRepository.with_payment_totals()
+            .order_by("id")
+            .values_list("id", "first_name", "last_name", "total_payment")
+        ).to_dict()
+        self.assertEqual(TechnicianRepository.get_report(), python_report)
+
+    @skipUnless(
+        connection.features.supports_over_clause, "Requiere funciones de ventana"
+    )
+    def test_report_query_without_technicians(self) -> None:
+        """
+        Verifica el informe de una sola consulta cuando no hay técnicos.
+        """
+        Technician.objects.all().delete()
+        self.assertEqual(TechnicianRepository.get_report(), ReportSummary().to_dict())
@@ -0,0 +1,290 @@
+from io import StringIO
+from typing import Tuple
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import DatabaseError, transaction
+from django.db.models import F
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.order.seed import OrderSeeder
+from rapihogar.models import (
+    DataVersion,
+    Order,
+    Scheme,
+    Technician,
+    TechnicianStats,
+    TotalsManager,
+    User,
+)
+
+
+class TechnicianStatsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        cls.client_user: User = User.objects.create(
+            first_name="Cliente",
+            last_name="Prueba",
+            email="cliente@prueba.com",
+            username="clienteprueba",
+        )
+        cls.scheme: Scheme = Scheme.objects.create(name="Esquema de prueba")
+        cls.technician1: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        cls.technician2: Technician = Technician.objects.create(
+            first_name="Maria", last_name="Lopez"
+        )
+
+    def _create_order(self, technician: Technician, hours_worked: int) -> Order:
+        return Order.objects.create(
+            technician=technician,
+            client=self.client_user,
+            scheme=self.scheme,
+            hours_worked=hours_worked,
+            type_request=Order.ORDER,
+        )
+
+    def _stats(self, technician: Technician) -> Tuple[int, int]:
+        stats = TechnicianStats.objects.filter(technician=technician).first()
+        return (stats.total_hours, stats.total_orders) if stats else (0, 0)
+
+    def test_create_order_updates_stats(self) -> None:
+        """
+        Verifica que crear pedidos sume horas y pedidos al técnico.
+        """
+        self._create_order(self.technician1, 5)
+        self._create_order(self.technician1, 3)
+        self.assertEqual(self._stats(self.technician1), (8, 2))
+        self.assertEqual(self._stats(self.technician2), (0, 0))
+
+    def test_update_order_view_moves_stats(self) -> None:
+        """
+        Verifica que cambiar técnico y horas desde OrderUpdateView mueva los
+        totales de un técnico al otro.
+        """
+        order: Order = self._create_order(self.technician1, 5)
+        response = self.client.patch(
+            reverse("order-update", args=[order.id]),
+            {"technician": self.technician2.id, "hours_worked": 9},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._stats(self.technician1), (0, 0))
+        self.assertEqual(self._stats(self.technician2), (9, 1))
+
+    def test_save_without_loaded_snapshot(self) -> None:
+        """
+        Verifica que guardar una instancia construida a mano use los valores
+        anteriores de la base de datos.
+        """
+        order: Order = self._create_order(self.technician1, 5)
+        Order(
+            id=order.id,
+            technician=self.technician1,
+            client=self.client_user,
+            scheme=self.scheme,
+            hours_worked=7,
+            type_request=Order.ORDER,
+        ).save()
+        self.assertEqual(self._stats(self.technician1), (7, 1))
+
+    def test_save_with_update_fields(self) -> None:
+        """
+        Verifica que solo se apliquen los campos incluidos en update_fields.
+        """
+        order: Order = Order.objects.get(pk=self._create_order(self.technician1, 5).pk)
+        order.technician = self.technician2
+        order.hours_worked = 2
+        order.save(update_fields=["hours_worked"])
+        self.assertEqual(self._stats(self.technician1), (2, 1))
+        self.assertEqual(self._stats(self.technician2), (0, 0))
+
+    def test_queryset_update_hours_worked(self) -> None:
+        """
+        Verifica que `QuerySet.update` de las horas ajuste los totales e
+        invalide la versión de los datos de técnicos.
+        """
+        self._create_order(self.technician1, 5)
+        self._create_order(self.technician1, 3)
+        self._create_order(self.technician2, 4)
+        token: str = DataVersion.objects.get_token(DataVersion.TECHNICIANS)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(
+                Order.objects.filter(technician=self.technician1).update(
+                    hours_worked=F("hours_worked") + 1
+                ),
+                2,
+            )
+        self.assertEqual(self._stats(self.technician1), (10, 2))
+        self.assertEqual(self._stats(self.technician2), (4, 1))
+        self.assertNotEqual(
+            DataVersion.objects.get_token(DataVersion.TECHNICIANS), token
+        )
+
+    def test_queryset_update_technician(self) -> None:
+        """
+        Verifica que `QuerySet.update` del técnico mueva los totales, aunque
+        los pedidos dejen de cumplir el filtro.
+        """
+        self._create_order(self.technician1, 5)
+        self._create_order(self.technician1, 3)
+        Order.objects.filter(technician=self.technician1).update(
+            technician=self.technician2
+        )
+        self.assertEqual(self._stats(self.technician1), (0, 0))
+        self.assertEqual(self._stats(self.technician2), (8, 2))
+
+    def test_queryset_update_without_stats_fields(self) -> None:
+        """
+        Verifica que `QuerySet.update` de otros campos no toque los totales
+        ni la versión de los datos de técnicos.
+        """
+        self._create_order(self.technician1, 5)
+        token: str = DataVersion.objects.get_token(DataVersion.TECHNICIANS)
+        with self.assertNumQueries(1):
+            Order.objects.update(type_request=Order.REQUEST)
+        self.assertEqual(self._stats(self.technician1), (5, 1))
+        self.assertEqual(DataVersion.objects.get_token(DataVersion.TECHNICIANS), token)
+
+    def test_data_version_bumps_once_on_commit(self) -> None:
+        """
+        Verifica que la versión de datos se renueve una sola vez al confirmar
+        la transacción, y no si se revierte.
+        """
+        token: str = DataVersion.objects.get_token(DataVersion.TECHNICIANS)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._create_order(self.technician1, 5)
+            self._create_order(self.technician2, 3)
+        self.assertEqual(DataVersion.objects.get_token(DataVersion.TECHNICIANS), token)
+        with self.assertNumQueries(1):
+            for callback in callbacks:
+                callback()
+        self.assertNotEqual(
+            DataVersion.objects.get_token(DataVersion.TECHNICIANS), token
+        )
+
+        token = DataVersion.objects.get_token(DataVersion.TECHNICIANS)
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ValueError):
+                with transaction.atomic():
+                    self._create_order(self.technician1, 5)
+                    raise ValueError
+        self.assertEqual(DataVersion.objects.get_token(DataVersion.TECHNICIANS), token)
+
+    def test_delete_order_updates_stats(self) -> None:
+        """
+        Verifica que eliminar pedidos, individualmente o en masa, reste los totales.
+        """
+        order: Order = self._create_order(self.technician1, 5)
+        self._create_order(self.technician1, 3)
+        self._create_order(self.technician2, 4)
+        order.delete()
+        self.assertEqual(self._stats(self.technician1), (3, 1))
+        Order.objects.all().delete()
+        self.assertEqual(self._stats(self.technician1), (0, 0))
+        self.assertEqual(self._stats(self.technician2), (0, 0))
+
+    def test_delete_technician_cascades(self) -> None:
+        """
+        Verifica que eliminar un técnico elimine sus pedidos y estadísticas.
+        """
+        self._create_order(self.technician1, 5)
+        self.technician1.delete()
+        self.assertFalse(TechnicianStats.objects.exists())
+
+    def test_bulk_create_from_seeder_updates_stats(self) -> None:
+        """
+        Verifica que los pedidos creados en masa por OrderSeeder se sumen.
+        """
+        orders = OrderSeeder.create_random_orders(
+            [self.technician1, self.technician2], [self.client_user], [self.scheme], 20
+        )
+        for technician in (self.technician1, self.technician2):
+            assigned = [order for order in orders if order.technician == technician]
+            self.assertEqual(
+                self._stats(technician),
+                (sum(order.hours_worked for order in assigned), len(assigned)),
+            )
+
+    def test_apply_deltas_in_batches(self) -> None:
+        """
+        Verifica que los totales de varios técnicos se sumen y resten en
+        lotes de `UPDATE_BATCH_SIZE` técnicos.
+        """
+        self._create_order(self.technician1, 5)
+        self._create_order(self.technician2, 4)
+        with patch.object(TechnicianStats.objects, "UPDATE_BATCH_SIZE", 1):
+            TechnicianStats.objects.apply_deltas(
+                {self.technician1.id: (-5, -1), self.technician2.id: (6, 2)}
+            )
+        self.assertEqual(self._stats(self.technician1), (0, 0))
+        self.assertEqual(self._stats(self.technician2), (10, 3))
+
+    def test_rebuild_command(self) -> None:
+        """
+        Verifica que el comando recalcule las estadísticas desde los pedidos.
+        """
+        self._create_order(self.technician1, 5)
+        self._create_order(self.technician2, 4)
+        TechnicianStats.objects.update(total_hours=0, total_orders=0)
+        call_command("rebuild_technician_stats", stdout=StringIO())
+        self.assertEqual(self._stats(self.technician1), (5, 1))
+        self.assertEqual(self._stats(self.technician2), (4, 1))
+
+
+class TechnicianStatsAtomicityTest(TransactionTestCase):
+    """
+    Verifica, con autocommit, que un pedido no se guarde ni se elimine si
+    fallan sus estadísticas.
+    """
+
+    def setUp(self) -> None:
+        self.technician: Technician = Technician.objects.create(
+            first_name="Juan", last_name="Perez"
+        )
+        self.order: Order = Order.objects.create(
+            technician=self.technician,
+            client=User.objects.create(
+                email="cliente@prueba.com", username="clienteprueba"
+            ),
+            hours_worked=5,
+        )
+
+    def test_failed_stats_roll_back_save(self) -> None:
+        """
+        Verifica que si fallan las estadísticas no se guarde el pedido.
+        """
+        self.order.hours_worked = 9
+        with patch("rapihogar.signals.apply_stats_changes", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.order.save()
+        self.assertEqual(Order.objects.get(pk=self.order.pk).hours_worked, 5)
+        self.assertEqual(
+            TechnicianStats.objects.get(technician=self.technician).total_hours, 5
+        )
+
+    def test_failed_stats_roll_back_delete(self) -> None:
+        """
+        Verifica que si fallan las estadísticas no se elimine el pedido.
+        """
+        with patch("rapihogar.signals.apply_stats_changes", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                Order.objects.get(pk=self.order.pk).delete()
+        self.assertTrue(Order.objects.filter(pk=self.order.pk).exists())
+        self.assertEqual(
+            TechnicianStats.objects.get(technician=self.technician).total_orders, 1
+        )
+
+    def test_totals_manager_is_abstract(self) -> None:
+        """
+        Verifica que `TotalsManager` exija definir `key` y `lookup`.
+        """
+        with self.assertRaises(TypeError):
+            TotalsManager()
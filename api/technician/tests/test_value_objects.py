@@ -0,0 +1,96 @@
+import random
+import unittest
+from typing import List, Tuple
+
+from api.technician.value_objects import ReportSummary, TechnicianPayment
+
+
+class TestTechnicianPayment(unittest.TestCase):
+    def test_from_row(self) -> None:
+        """
+        Verifica que el pago se construya desde una fila de values_list.
+        """
+        technician_payment: TechnicianPayment = TechnicianPayment.from_row(
+            (7, "Juan", "Perez", 1359.999)
+        )
+        self.assertEqual(
+            technician_payment.to_dict(),
+            {"technician_id": 7, "full_name": "Juan Perez", "total_payment": 1360.0},
+        )
+
+    def test_is_compact(self) -> None:
+        """
+        Verifica que el pago no tenga diccionario de atributos por instancia.
+        """
+        technician_payment: TechnicianPayment = TechnicianPayment(1, "Juan Perez", 0)
+        self.assertFalse(hasattr(technician_payment, "__dict__"))
+
+
+class TestReportSummary(unittest.TestCase):
+    def test_empty_summary(self) -> None:
+        """
+        Verifica el resumen cuando no hay técnicos.
+        """
+        summary: ReportSummary = ReportSummary.from_rows([])
+        self.assertEqual(summary.get_average_payment(), 0.0)
+        self.assertEqual(summary.get_below_average_technicians(0.0), [])
+        self.assertIsNone(summary.get_lowest_paid_technician())
+        self.assertIsNone(summary.get_highest_paid_technician())
+
+    def test_tie_breaking(self) -> None:
+        """
+        Verifica que ante montos iguales el más bajo sea el de mayor id y el
+        más alto el de menor id.
+        """
+        rows: List[Tuple[int, str, str, float]] = [
+            (3, "Carlos", "Juan", 100.0),
+            (1, "Juan", "Perez", 300.0),
+            (4, "Ana", "Diaz", 300.0),
+            (2, "Maria", "Lopez", 100.0),
+        ]
+        summary: ReportSummary = ReportSummary.from_rows(rows)
+        self.assertEqual(summary.get_lowest_paid_technician().technician_id, 3)
+        self.assertEqual(summary.get_highest_paid_technician().technician_id, 1)
+        self.assertEqual(summary.get_average_payment(), 200.0)
+        self.assertEqual(
+            [
+                technician.full_name
+                for technician in summary.get_below_average_technicians(200.0)
+            ],
+            ["Carlos Juan", "Maria Lopez"],
+        )
+
+    def test_matches_multi_pass_computation(self) -> None:
+        """
+        Verifica que el resumen coincida con el cálculo en varias pasadas.
+        """
+        rng: random.Random = random.Random(7)
+        rows: List[Tuple[int, str, str, float]] = [
+            (technician_id, "Tecnico", str(technician_id), rng.choice([0.0, 1.5, 3.0]))
+            for technician_id in rng.sample(range(1, 10_000), 500)
+        ]
+        summary: ReportSummary = ReportSummary.from_rows(rows)
+
+        def key(row: Tuple[int, str, str, float]) -> Tuple[float, int]:
+            return (row[3], -row[0])
+
+        average: float = sum(row[3] for row in rows) / len(rows)
+        self.assertAlmostEqual(summary.get_average_payment(), average)
+        self.assertEqual(
+            summary.get_lowest_paid_technician().technician_id, min(rows, key=key)[0]
+        )
+        self.assertEqual(
+            summary.get_highest_paid_technician().technician_id,
+            max(rows, key=key)[0],
+        )
+        self.assertEqual(
+            [
+                technician.technician_id
+                for technician in summary.get_below_average_technicians(average)
+            ],
+            [row[0] for row in rows if row[3] < average],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
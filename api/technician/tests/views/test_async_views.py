@@ -0,0 +1,101 @@
+import json
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from rapihogar.models import Order, Scheme, Technician, User
+
+
+class AsyncTechnicianViewsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas (se ejecuta una sola vez).
+        """
+        client_user = User.objects.create(
+            first_name="Cliente",
+            last_name="Prueba",
+            email="cliente@prueba.com",
+            username="clienteprueba",
+        )
+        scheme = Scheme.objects.create(name="Esquema de prueba")
+        for index, hours in enumerate((5, 20, 35, 50, 20)):
+            technician = Technician.objects.create(
+                first_name=f"Técnico{index}", last_name="Pérez"
+            )
+            Order.objects.create(
+                technician=technician,
+                client=client_user,
+                scheme=scheme,
+                hours_worked=hours,
+            )
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def assertSameResponse(self, sync_url: str, async_url: str) -> None:
+        sync_response = self.client.get(sync_url)
+        async_response = self.client.get(async_url)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        # La URL de la página siguiente apunta a la misma vista.
+        self.assertEqual(
+            async_response.content.replace(
+                async_url.split("?")[0].encode(), sync_url.split("?")[0].encode()
+            ),
+            sync_response.content,
+        )
+
+    def test_payments_match_sync_view(self) -> None:
+        """
+        Verifica que la vista asíncrona de pagos devuelva el mismo JSON.
+        """
+        sync_url: str = reverse("technician-payments-list")
+        async_url: str = reverse("technician-payments-list-async")
+        for query in (
+            "",
+            "?name=técnico1",
+            "?min_payment=5000",
+            "?page_size=2",
+            "?cursor=2&page_size=2",
+            "?min_payment=10&max_payment=1",
+        ):
+            with self.subTest(query=query):
+                self.assertSameResponse(sync_url + query, async_url + query)
+
+    async def test_payments_stream(self) -> None:
+        """
+        Verifica que el listado en streaming tenga los mismos datos.
+        """
+        expected = (
+            await self.async_client.get(reverse("technician-payments-list"))
+        ).json()
+        response = await self.async_client.get(
+            reverse("technician-payments-list-async") + "?stream=true"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content: bytes = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(json.loads(content), expected)
+
+    def test_report_matches_sync_view(self) -> None:
+        """
+        Verifica que la vista asíncrona del informe devuelva el mismo JSON.
+        """
+        self.assertSameResponse(
+            reverse("technician-report"), reverse("technician-report-async")
+        )
+
+    def test_cached_response(self) -> None:
+        """
+        Verifica que las respuestas asíncronas se cacheen con ETag.
+        """
+        url: str = reverse("technician-report-async")
+        first_response = self.client.get(url)
+        with self.assertNumQueries(1):
+            second_response = self.client.get(url)
+        self.assertEqual(second_response.content, first_response.content)
+        self.assertEqual(second_response["ETag"], first_response["ETag"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first_response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from rapihogar.models import Order, Scheme, Technician, User
+
+
+class VersionedResponseCacheTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas (se ejecuta una sola vez).
+        """
+        cls.technician = Technician.objects.create(first_name="Juan", last_name="Perez")
+        cls.client_user = User.objects.create(
+            first_name="Cliente",
+            last_name="Prueba",
+            email="cliente@prueba.com",
+            username="clienteprueba",
+        )
+        cls.scheme = Scheme.objects.create(name="Esquema de prueba")
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_cached_response_skips_aggregation(self) -> None:
+        """
+        Verifica que una respuesta cacheada solo consulte la versión de datos.
+        """
+        for url_name in ("technician-payments-list", "technician-report"):
+            with self.subTest(url_name=url_name):
+                url: str = reverse(url_name)
+                first_response = self.client.get(url)
+                self.assertEqual(first_response.status_code, status.HTTP_200_OK)
+                with self.assertNumQueries(1):
+                    second_response = self.client.get(url)
+                self.assertEqual(second_response.json(), first_response.json())
+                self.assertEqual(second_response["ETag"], first_response["ETag"])
+
+    def test_if_none_match_returns_not_modified(self) -> None:
+        """
+        Verifica que se responda 304 si el cliente ya tiene la versión vigente.
+        """
+        url: str = reverse("technician-payments-list")
+        etag: str = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_if_none_match_compares_whole_etags(self) -> None:
+        """
+        Verifica que `If-None-Match` se compare por ETag completo, con la
+        comparación débil y aceptando `*`.
+        """
+        url: str = reverse("technician-payments-list")
+        etag: str = self.client.get(url)["ETag"]
+        test_cases = [
+            ('"x' + etag[1:], status.HTTP_200_OK),
+            (etag[:-2] + '"', status.HTTP_200_OK),
+            (f"{etag}-viejo", status.HTTP_200_OK),
+            (f'"otro", W/{etag}', status.HTTP_304_NOT_MODIFIED),
+            ("*", status.HTTP_304_NOT_MODIFIED),
+        ]
+        for header, expected_status in test_cases:
+            with self.subTest(header=header):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=header)
+                self.assertEqual(response.status_code, expected_status)
+
+    def test_order_write_invalidates_cache(self) -> None:
+        """
+        Verifica que crear un pedido invalide las respuestas cacheadas.
+        """
+        url: str = reverse("technician-payments-list")
+        first_response = self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.create(
+                technician=self.technician,
+                client=self.client_user,
+                scheme=self.scheme,
+                hours_worked=5,
+                type_request=Order.ORDER,
+            )
+        second_response = self.client.get(url)
+        self.assertNotEqual(second_response["ETag"], first_response["ETag"])
+        self.assertEqual(second_response.json()[0]["total_hours"], 5)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first_response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_query_params_are_cached_separately(self) -> None:
+        """
+        Verifica que cada combinación de parámetros tenga su propia entrada.
+        """
+        url: str = reverse("technician-payments-list")
+        self.assertEqual(len(self.client.get(url).json()), 1)
+        self.assertEqual(len(self.client.get(url, {"name": "Maria"}).json()), 0)
+
+    def test_technician_write_invalidates_cache(self) -> None:
+        """
+        Verifica que modificar un técnico invalide las respuestas cacheadas.
+        """
+        url: str = reverse("technician-payments-list")
+        self.client.get(url)
+        self.technician.first_name = "Juana"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.technician.save()
+        self.assertEqual(self.client.get(url).json()[0]["full_name"], "Juana Perez")
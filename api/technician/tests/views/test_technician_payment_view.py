@@ -1,5 +1,7 @@
-from typing import Any, Dict, List
+import json
+from typing import Any, Dict, List, Optional
 
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.test import TestCase
 from django.urls import reverse
@@ -22,6 +24,9 @@ class TechnicianPaymentListViewTest(TestCase):
         Technician.objects.create(first_name="Maria", last_name="Lopez")
         Technician.objects.create(first_name="Carlos", last_name="Juan")
 
+    def setUp(self) -> None:
+        cache.clear()
+
     def test_filter_by_name(self) -> None:
         """
         Verifica que el filtro por nombre funcione correctamente.
@@ -156,3 +161,107 @@ class TechnicianPaymentListViewTest(TestCase):
         self.assertEqual(maria_data["total_hours"], 0)
         self.assertEqual(maria_data["total_payment"], 0)
         self.assertEqual(maria_data["total_orders"], 0)
+
+    def test_filter_by_payment_range(self) -> None:
+        """
+        Verifica que el listado se pueda filtrar por rango de pago.
+        """
+        technician = Technician.objects.get(first_name="Juan", last_name="Perez")
+        user = User.objects.create(
+            first_name="Cliente",
+            last_name="Uno",
+            email="cliente@uno.com",
+            username="clienteuno",
+        )
+        technician.order_set.create(
+            type_request=Order.ORDER, client=user, hours_worked=8
+        )
+
+        test_cases = [
+            {"params": {"min_payment": 1}, "expected_names": [FULL_NAME_JUAN]},
+            {
+                "params": {"max_payment": 0},
+                "expected_names": [FULL_NAME_MARIA, FULL_NAME_CARLOS],
+            },
+            {
+                "params": {"min_payment": 1360, "max_payment": 1360},
+                "expected_names": [FULL_NAME_JUAN],
+            },
+        ]
+        for case in test_cases:
+            with self.subTest(params=case["params"]):
+                response: JsonResponse = self.client.get(
+                    reverse("technician-payments-list"), case["params"]
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [technician["full_name"] for technician in response.json()],
+                    case["expected_names"],
+                )
+
+    def test_invalid_payment_range(self) -> None:
+        """
+        Verifica que se rechacen rangos de pago inválidos.
+        """
+        test_cases = [
+            {"min_payment": "abc"},
+            {"min_payment": 10, "max_payment": 5},
+        ]
+        for params in test_cases:
+            with self.subTest(params=params):
+                response: JsonResponse = self.client.get(
+                    reverse("technician-payments-list"), params
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_keyset_pagination(self) -> None:
+        """
+        Verifica que la paginación por cursor recorra todos los técnicos en
+        orden de id sin repetir ninguno.
+        """
+        names: List[str] = []
+        url: Optional[str] = reverse("technician-payments-list") + "?page_size=2"
+        pages: int = 0
+        while url is not None:
+            response: JsonResponse = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            response_data: Dict[str, Any] = response.json()
+            names.extend(
+                technician["full_name"] for technician in response_data["results"]
+            )
+            pages += 1
+            url = response_data["next"]
+
+        self.assertEqual(pages, 2)
+        self.assertEqual(names, [FULL_NAME_JUAN, FULL_NAME_MARIA, FULL_NAME_CARLOS])
+
+    def test_keyset_pagination_with_filter(self) -> None:
+        """
+        Verifica que el cursor respete el filtro por nombre.
+        """
+        juan: Technician = Technician.objects.get(first_name="Juan")
+        response: JsonResponse = self.client.get(
+            reverse("technician-payments-list"), {"name": "Juan", "cursor": juan.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data: Dict[str, Any] = response.json()
+        self.assertEqual(
+            [technician["full_name"] for technician in response_data["results"]],
+            [FULL_NAME_CARLOS],
+        )
+        self.assertIsNone(response_data["next"])
+
+    def test_stream_returns_same_rows(self) -> None:
+        """
+        Verifica que el modo streaming devuelva las mismas filas que el listado.
+        """
+        response: JsonResponse = self.client.get(reverse("technician-payments-list"))
+        stream_response = self.client.get(
+            reverse("technician-payments-list"), {"stream": "true"}
+        )
+        self.assertEqual(stream_response.status_code, status.HTTP_200_OK)
+        self.assertTrue(stream_response.streaming)
+        streamed_data: List[Dict[str, Any]] = json.loads(
+            b"".join(stream_response.streaming_content)
+        )
+        self.assertEqual(streamed_data, response.json())
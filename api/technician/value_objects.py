@@ -1,86 +1,166 @@
+from array import array
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from rapihogar.models import Technician
+TechnicianPaymentRow = Tuple[int, Optional[str], Optional[str], float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TechnicianPayment:
-    """Clase que representa el pago de un técnico."""
+    """
+    Clase que representa el pago de un técnico.
+
+    Solo guarda el id, el nombre completo y el monto, sin conservar la
+    instancia del modelo `Technician`.
+    """
 
-    technician: Technician
+    technician_id: int
+    full_name: str
     total_payment: float
 
+    @classmethod
+    def from_row(cls, row: TechnicianPaymentRow) -> "TechnicianPayment":
+        """
+        Crea el pago a partir de una fila (id, nombre, apellido, pago) de
+        `values_list`.
+        """
+        technician_id, first_name, last_name, total_payment = row
+        return cls(technician_id, f"{first_name} {last_name}", total_payment)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convierte el objeto TechnicianPayment a un diccionario.
         """
         return {
-            "technician_id": self.technician.id,
-            "full_name": f"{self.technician.first_name} {self.technician.last_name}",
+            "technician_id": self.technician_id,
+            "full_name": self.full_name,
             "total_payment": round(self.total_payment, 2),
         }
 
 
-@dataclass(frozen=True)
-class TechniciansPayments:
+class ReportSummary:
     """
-    Esta clase se encarga de calcular el pago total y las horas trabajadas
-    de cada técnico, así como de generar informes relacionados con los
-    pagos de los técnicos.
+    Acumula en una sola pasada los datos del informe de pagos de técnicos.
+
+    Cada fila agregada actualiza la suma, la cantidad y los técnicos con el
+    monto más bajo y más alto. Los ids, nombres y montos se guardan en
+    arreglos compactos para calcular después los técnicos por debajo del
+    promedio sin conservar instancias de modelos.
     """
 
-    technicians_payments: List[TechnicianPayment]
+    def __init__(self) -> None:
+        self._ids: array = array("q")
+        self._payments: array = array("d")
+        self._full_names: List[str] = []
+        self._total: float = 0.0
+        self._lowest_index: Optional[int] = None
+        self._highest_index: Optional[int] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[TechnicianPaymentRow]) -> "ReportSummary":
+        """
+        Construye el resumen a partir de filas (id, nombre, apellido, pago).
+        """
+        summary = cls()
+        for technician_id, first_name, last_name, total_payment in rows:
+            summary.add(technician_id, f"{first_name} {last_name}", total_payment)
+        return summary
+
+    def add(self, technician_id: int, full_name: str, total_payment: float) -> None:
+        """
+        Agrega el pago de un técnico al resumen.
+
+        Ante montos iguales, el más bajo es el técnico de mayor id y el más
+        alto el de menor id.
+        """
+        index: int = len(self._ids)
+        self._ids.append(technician_id)
+        self._payments.append(total_payment)
+        self._full_names.append(full_name)
+        self._total += total_payment
+
+        if self._lowest_index is None:
+            self._lowest_index = self._highest_index = index
+            return
+        lowest_payment: float = self._payments[self._lowest_index]
+        if total_payment < lowest_payment or (
+            total_payment == lowest_payment
+            and technician_id > self._ids[self._lowest_index]
+        ):
+            self._lowest_index = index
+        highest_payment: float = self._payments[self._highest_index]
+        if total_payment > highest_payment or (
+            total_payment == highest_payment
+            and technician_id < self._ids[self._highest_index]
+        ):
+            self._highest_index = index
 
     def get_average_payment(self) -> float:
         """
         Calcula el monto promedio cobrado por todos los técnicos.
         """
-        total_payments = [
-            technician_payment.total_payment
-            for technician_payment in self.technicians_payments
-        ]
         default_average: float = 0.0
-        return (
-            sum(total_payments) / len(total_payments)
-            if total_payments
-            else default_average
-        )
+        return self._total / len(self._ids) if self._ids else default_average
 
     def get_below_average_technicians(
         self, average_payment: float
     ) -> List[TechnicianPayment]:
         """
-        Devuelve una lista de técnicos que cobraron menos que el promedio.
+        Devuelve los técnicos que cobraron menos que el promedio, en el orden
+        en que se agregaron.
         """
         return [
-            technician_payment
-            for technician_payment in self.technicians_payments
-            if technician_payment.total_payment < average_payment
+            self._payment_at(index)
+            for index, total_payment in enumerate(self._payments)
+            if total_payment < average_payment
         ]
 
     def get_lowest_paid_technician(self) -> Optional[TechnicianPayment]:
         """
         Devuelve el técnico con el monto más bajo.
         """
-        return min(
-            self.technicians_payments,
-            key=lambda technician_payment: (
-                technician_payment.total_payment,
-                -technician_payment.technician.id,
-            ),
-            default=None,
+        return (
+            None if self._lowest_index is None else self._payment_at(self._lowest_index)
         )
 
     def get_highest_paid_technician(self) -> Optional[TechnicianPayment]:
         """
         Devuelve el técnico con el monto más alto.
         """
-        return max(
-            self.technicians_payments,
-            key=lambda technician_payment: (
-                technician_payment.total_payment,
-                -technician_payment.technician.id,
+        return (
+            None
+            if self._highest_index is None
+            else self._payment_at(self._highest_index)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte el resumen en el contenido del informe de técnicos.
+        """
+        average_payment: float = self.get_average_payment()
+        lowest_paid_technician: Optional[TechnicianPayment] = (
+            self.get_lowest_paid_technician()
+        )
+        highest_paid_technician: Optional[TechnicianPayment] = (
+            self.get_highest_paid_technician()
+        )
+        return {
+            "average_payment": round(average_payment, 2),
+            "below_average_technicians": [
+                technician_payment.to_dict()
+                for technician_payment in self.get_below_average_technicians(
+                    average_payment
+                )
+            ],
+            "lowest_paid_technician": (
+                lowest_paid_technician.to_dict() if lowest_paid_technician else None
+            ),
+            "highest_paid_technician": (
+                highest_paid_technician.to_dict() if highest_paid_technician else None
             ),
-            default=None,
+        }
+
+    def _payment_at(self, index: int) -> TechnicianPayment:
+        return TechnicianPayment(
+            self._ids[index], self._full_names[index], self._payments[index]
         )
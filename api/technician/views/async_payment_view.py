@@ -0,0 +1,93 @@
+import json
+from typing import Any, AsyncIterator, Dict, List
+
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.views import View
+
+from api.cache import versioned_cache
+from api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    is_paginated,
+    paginated_data,
+    split_page,
+)
+from api.responses import JSON_DUMPS_PARAMS, json_response
+from api.technician.serializers.payment_query_serializer import (
+    TechnicianPaymentQuerySerializer,
+)
+from api.technician.views.payment_view import TechnicianPaymentView
+from rapihogar.models import DataVersion
+
+
+class AsyncTechnicianPaymentView(View):
+    """
+    Versión asíncrona de `TechnicianPaymentView` para servidores ASGI.
+
+    Acepta los mismos parámetros y devuelve el mismo JSON, pero lee los
+    técnicos con el ORM asíncrono, así una consulta larga no ocupa un hilo
+    del servidor mientras espera a la base de datos.
+    """
+
+    instrumented: bool = True
+
+    @versioned_cache(DataVersion.TECHNICIANS)
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """
+        Devuelve una lista de técnicos con sus datos calculados.
+        """
+        query_serializer = TechnicianPaymentQuerySerializer(data=request.GET)
+        if not query_serializer.is_valid():
+            return json_response(query_serializer.errors, status=400)
+        params: Dict[str, Any] = query_serializer.validated_data
+        technicians: QuerySet = TechnicianPaymentView.get_queryset(params)
+
+        if params["stream"]:
+            return self._stream(technicians)
+
+        to_payment_row = TechnicianPaymentView.to_payment_row
+        if not is_paginated(params):
+            data: List[Dict[str, Any]] = [
+                to_payment_row(technician)
+                async for technician in technicians.aiterator(
+                    chunk_size=TechnicianPaymentView.STREAM_CHUNK_SIZE
+                )
+            ]
+            return json_response(data)
+
+        page_size: int = params.get("page_size") or DEFAULT_PAGE_SIZE
+        page, next_cursor = split_page(
+            [technician async for technician in technicians[: page_size + 1]],
+            page_size,
+        )
+        return json_response(
+            paginated_data(
+                request,
+                [to_payment_row(technician) for technician in page],
+                next_cursor,
+            )
+        )
+
+    @staticmethod
+    def _stream(technicians: QuerySet) -> StreamingHttpResponse:
+        """
+        Devuelve el listado como un arreglo JSON escrito a medida que se leen
+        los técnicos.
+        """
+
+        async def generate() -> AsyncIterator[str]:
+            separator: str = ""
+            yield "["
+            async for technician in technicians.aiterator(
+                chunk_size=TechnicianPaymentView.STREAM_CHUNK_SIZE
+            ):
+                yield separator + json.dumps(
+                    TechnicianPaymentView.to_payment_row(technician),
+                    **JSON_DUMPS_PARAMS,
+                )
+                separator = ","
+            yield "]"
+
+        return StreamingHttpResponse(generate(), content_type="application/json")
@@ -0,0 +1,48 @@
+from datetime import date
+from typing import Any, Dict, Optional
+
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+from api.cache import versioned_cache
+from api.responses import json_response
+from api.technician.repositories.technician_repository import TechnicianRepository
+from api.technician.serializers.report_query_serializer import (
+    TechnicianReportQuerySerializer,
+)
+from api.technician.value_objects import ReportSummary
+from rapihogar.models import DataVersion
+
+
+class AsyncTechnicianReportView(View):
+    """
+    Versión asíncrona de `TechnicianReportView` para servidores ASGI.
+    """
+
+    instrumented: bool = True
+
+    @versioned_cache(DataVersion.TECHNICIANS)
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        query_serializer = TechnicianReportQuerySerializer(data=request.GET)
+        if not query_serializer.is_valid():
+            return json_response(query_serializer.errors, status=400)
+        period: Optional[date] = query_serializer.validated_data.get("period")
+
+        if TechnicianRepository.supports_report_query():
+            return json_response(await TechnicianRepository.aget_report(period))
+
+        # `aiterator` no admite `values_list` (ejecuta la consulta fuera del
+        # hilo de la base de datos), así que las filas se leen en una sola
+        # llamada; como tuplas ocupan bastante menos que las instancias.
+        technician_rows = (
+            TechnicianRepository.with_payment_totals(period=period)
+            .order_by("id")
+            .values_list("id", "first_name", "last_name", "total_payment")
+        )
+        data: Dict[str, Any] = ReportSummary.from_rows(
+            [row async for row in technician_rows]
+        ).to_dict()
+
+        return json_response(data)
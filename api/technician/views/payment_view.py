@@ -1,47 +1,119 @@
-from typing import Any, Dict, List
+import json
+from typing import Any, Dict, Iterator, List
 
-from django.db.models import Count, Q, QuerySet, Sum
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from api.technician.services.payment_service import PaymentService
-from rapihogar.models import Technician
+from api.cache import versioned_cache
+from api.metrics.instrumentation import InstrumentedViewMixin
+from api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    is_paginated,
+    paginated_data,
+    split_page,
+)
+from api.technician.repositories.technician_repository import TechnicianRepository
+from api.technician.serializers.payment_query_serializer import (
+    TechnicianPaymentQuerySerializer,
+)
+from rapihogar.models import DataVersion, Technician
 
 
-class TechnicianPaymentView(APIView):
+class TechnicianPaymentView(InstrumentedViewMixin, APIView):
     """
     Endpoint para listar técnicos y calcular el pago según las horas trabajadas.
-    Permite filtrar por parte del nombre.
+    Permite filtrar por parte del nombre y por rango de pago, y calcular
+    los pagos de un período de liquidación con `period=AAAA-MM`.
+
+    Por defecto devuelve el listado completo. Con `cursor` o `page_size`
+    devuelve una página ordenada por id con el formato de `api.pagination`,
+    y con `stream=true` escribe el JSON a medida que lee los técnicos.
     """
 
+    STREAM_CHUNK_SIZE: int = 2000
+
+    @versioned_cache(DataVersion.TECHNICIANS)
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
         Devuelve una lista de técnicos con sus datos calculados.
         """
+        query_serializer = TechnicianPaymentQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return Response(query_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        params: Dict[str, Any] = query_serializer.validated_data
+        technicians: QuerySet = self.get_queryset(params)
+
+        if params["stream"]:
+            return self._stream(technicians)
+
+        if not is_paginated(params):
+            data: List[Dict[str, Any]] = [
+                self.to_payment_row(technician) for technician in technicians
+            ]
+            return Response(data)
 
-        name_filter: str = request.query_params.get("name", "")
-        technicians: QuerySet = Technician.objects.filter(
-            Q(first_name__icontains=name_filter) | Q(last_name__icontains=name_filter)
-        ).annotate(
-            total_hours=Sum("order__hours_worked"),
-            total_orders=Count("order"),
+        page_size: int = params.get("page_size") or DEFAULT_PAGE_SIZE
+        page, next_cursor = split_page(list(technicians[: page_size + 1]), page_size)
+        return Response(
+            paginated_data(
+                request,
+                [self.to_payment_row(technician) for technician in page],
+                next_cursor,
+            )
+        )
+
+    @staticmethod
+    def get_queryset(params: Dict[str, Any]) -> QuerySet:
+        """
+        Devuelve los técnicos con sus pagos, filtrados según los parámetros
+        validados de la consulta y ordenados por id.
+        """
+        technicians: QuerySet = TechnicianRepository.with_payment_totals(
+            TechnicianRepository.filter_by_name(
+                Technician.objects.all(), params["name"]
+            ),
+            params.get("period"),
         )
+        if params.get("min_payment") is not None:
+            technicians = technicians.filter(total_payment__gte=params["min_payment"])
+        if params.get("max_payment") is not None:
+            technicians = technicians.filter(total_payment__lte=params["max_payment"])
+        if params.get("cursor") is not None:
+            technicians = technicians.filter(id__gt=params["cursor"])
+        return technicians.order_by("id")
 
-        default_hours: int = 0
-        data: List[Dict[str, Any]] = [
-            {
-                "full_name": technician.full_name,
-                "total_hours": technician.total_hours or default_hours,
-                "total_payment": round(
-                    PaymentService.calculate_payment(
-                        technician.total_hours or default_hours
-                    ),
-                    2,
-                ),
-                "total_orders": technician.total_orders,
-            }
-            for technician in technicians
-        ]
-
-        return Response(data)
+    def _stream(self, technicians: QuerySet) -> StreamingHttpResponse:
+        """
+        Devuelve el listado como un arreglo JSON escrito de forma incremental,
+        leyendo los técnicos por bloques con un cursor del lado del servidor.
+        """
+
+        def generate() -> Iterator[str]:
+            separator: str = ""
+            yield "["
+            for technician in technicians.iterator(chunk_size=self.STREAM_CHUNK_SIZE):
+                yield separator + json.dumps(
+                    self.to_payment_row(technician),
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+                separator = ","
+            yield "]"
+
+        return StreamingHttpResponse(generate(), content_type="application/json")
+
+    @staticmethod
+    def to_payment_row(technician: Technician) -> Dict[str, Any]:
+        """
+        Convierte un técnico anotado en una fila del listado de pagos.
+        """
+        return {
+            "full_name": technician.full_name,
+            "total_hours": technician.total_hours,
+            "total_payment": round(technician.total_payment, 2),
+            "total_orders": technician.total_orders,
+        }
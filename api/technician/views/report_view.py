@@ -1,59 +1,48 @@
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, Optional
 
-from django.db.models import Count, QuerySet, Sum
+from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from api.technician.services.payment_service import PaymentService
-from api.technician.value_objects import TechnicianPayment, TechniciansPayments
-from rapihogar.models import Technician
+from api.cache import versioned_cache
+from api.metrics.instrumentation import InstrumentedViewMixin
+from api.technician.repositories.technician_repository import TechnicianRepository
+from api.technician.serializers.report_query_serializer import (
+    TechnicianReportQuerySerializer,
+)
+from api.technician.value_objects import ReportSummary
+from rapihogar.models import DataVersion
 
 
-class TechnicianReportView(APIView):
+class TechnicianReportView(InstrumentedViewMixin, APIView):
     """
     Vista para generar un informe de técnicos.
+
+    En PostgreSQL el informe se calcula con una sola consulta; en otros
+    motores se calcula en Python a partir de los pagos de cada técnico.
+    Con `period=AAAA-MM` se usan los pagos de ese período de liquidación.
     """
 
-    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        technician_queryset: QuerySet = Technician.objects.annotate(
-            total_hours=Sum("order__hours_worked")
-        )
+    STREAM_CHUNK_SIZE: int = 2000
 
-        default_hours: int = 0
-        technicians_payments_data: List[TechnicianPayment] = [
-            TechnicianPayment(
-                technician=technician,
-                total_payment=PaymentService.calculate_payment(
-                    technician.total_hours or default_hours
-                ),
-            )
-            for technician in technician_queryset
-        ]
-        technicians = TechniciansPayments(technicians_payments_data)
-        average_payment: float = technicians.get_average_payment()
-        below_average_technicians: List[TechnicianPayment] = (
-            technicians.get_below_average_technicians(average_payment)
-        )
-        lowest_paid_technician: Optional[TechnicianPayment] = (
-            technicians.get_lowest_paid_technician()
-        )
-        highest_paid_technician: Optional[TechnicianPayment] = (
-            technicians.get_highest_paid_technician()
+    @versioned_cache(DataVersion.TECHNICIANS)
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        query_serializer = TechnicianReportQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return Response(query_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        period: Optional[date] = query_serializer.validated_data.get("period")
+
+        if TechnicianRepository.supports_report_query():
+            return Response(TechnicianRepository.get_report(period))
+
+        technician_rows = (
+            TechnicianRepository.with_payment_totals(period=period)
+            .order_by("id")
+            .values_list("id", "first_name", "last_name", "total_payment")
+            .iterator(chunk_size=self.STREAM_CHUNK_SIZE)
         )
-
-        data = {
-            "average_payment": round(average_payment, 2),
-            "below_average_technicians": [
-                technician_payment.to_dict()
-                for technician_payment in below_average_technicians
-            ],
-            "lowest_paid_technician": (
-                lowest_paid_technician.to_dict() if lowest_paid_technician else None
-            ),
-            "highest_paid_technician": (
-                highest_paid_technician.to_dict() if highest_paid_technician else None
-            ),
-        }
+        data: Dict[str, Any] = ReportSummary.from_rows(technician_rows).to_dict()
 
         return Response(data)
@@ -0,0 +1,102 @@
+import difflib
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+SAVEPOINT_PATTERN = re.compile(r'"s\d+_x\d+"')
+PARAMETER_LIST_PATTERN = re.compile(r"\?(?:, \?)+")
+REPEATED_WHEN_PATTERN = re.compile(r"(WHEN \([^()]*\) THEN \? )\1+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Reemplaza los literales, los nombres de savepoints y las listas de
+    parámetros de una consulta, para comparar consultas que solo difieren en
+    sus parámetros o en la cantidad de filas que afectan.
+    """
+    sql = SAVEPOINT_PATTERN.sub('"savepoint"', sql)
+    sql = LITERAL_PATTERN.sub("?", sql)
+    sql = PARAMETER_LIST_PATTERN.sub("?, ...", sql)
+    return REPEATED_WHEN_PATTERN.sub(r"\1... ", sql)
+
+
+def format_queries(queries: Sequence[str]) -> str:
+    """
+    Numera las consultas ejecutadas, una por línea.
+    """
+    return "\n".join(f"{index}. {sql}" for index, sql in enumerate(queries, 1))
+
+
+def diff_queries(
+    expected: Sequence[str],
+    actual: Sequence[str],
+    expected_label: str = "esperado",
+    actual_label: str = "ejecutado",
+) -> str:
+    """
+    Devuelve la diferencia unificada entre dos listas de consultas, con los
+    literales normalizados para que solo aparezcan las consultas que sobran
+    o faltan.
+    """
+    return "\n".join(
+        difflib.unified_diff(
+            [normalize_sql(sql) for sql in expected],
+            [normalize_sql(sql) for sql in actual],
+            fromfile=expected_label,
+            tofile=actual_label,
+            lineterm="",
+        )
+    )
+
+
+class QueryBudgetMixin:
+    """
+    Aserciones sobre la cantidad de consultas de un `TestCase`.
+
+    A diferencia de `assertNumQueries`, fijan un máximo y, al fallar, muestran
+    las consultas ejecutadas o su diferencia con las de otro tamaño de datos.
+    """
+
+    @contextmanager
+    def assertMaxQueries(
+        self, budget: int, using: str = DEFAULT_DB_ALIAS
+    ) -> Iterator[CaptureQueriesContext]:
+        """
+        Falla si el bloque ejecuta más de `budget` consultas.
+        """
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        executed: List[str] = [query["sql"] for query in context.captured_queries]
+        if len(executed) > budget:
+            self.fail(
+                f"Se ejecutaron {len(executed)} consultas, el máximo es {budget}:\n"
+                f"{format_queries(executed)}"
+            )
+
+    def assertConstantQueries(
+        self, queries_by_size: Dict[int, Sequence[str]], budget: int
+    ) -> None:
+        """
+        Falla si para algún tamaño de datos se ejecutaron más de `budget`
+        consultas, o más consultas que con el tamaño más chico, mostrando la
+        diferencia con las consultas de ese tamaño (o las consultas
+        ejecutadas, si no hay diferencia).
+        """
+        smallest: int = min(queries_by_size)
+        baseline: Sequence[str] = queries_by_size[smallest]
+        for size, executed in sorted(queries_by_size.items()):
+            if len(executed) > budget or len(executed) > len(baseline):
+                self.fail(
+                    f"Con {size} filas se ejecutaron {len(executed)} consultas "
+                    f"(máximo {budget}, {len(baseline)} con {smallest} filas):\n"
+                    + (
+                        diff_queries(
+                            baseline, executed, f"{smallest} filas", f"{size} filas"
+                        )
+                        or format_queries(executed)
+                    )
+                )
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Optional
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from rapihogar.models import Company, Technician
+
+
+class PaginationTest(APITestCase):
+    """
+    Verifica que los listados paginados de empresas y de pagos de técnicos
+    usen el mismo formato de `api.pagination`.
+    """
+
+    ROUTES: List[str] = [
+        "company-list",
+        "technician-payments-list",
+        "technician-payments-list-async",
+    ]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Configura los datos iniciales para las pruebas.
+        """
+        cls.companies: List[Company] = Company.objects.bulk_create(
+            [
+                Company(
+                    name=f"Empresa {index}",
+                    phone=f"{index}",
+                    email=f"empresa{index}@rapihogar.com",
+                    website=f"http://www.empresa{index}.com",
+                )
+                for index in range(3)
+            ]
+        )
+        cls.technicians: List[Technician] = Technician.objects.bulk_create(
+            [
+                Technician(first_name=f"Técnico{index}", last_name="Pérez")
+                for index in range(3)
+            ]
+        )
+
+    def test_pages_share_envelope(self) -> None:
+        """
+        Verifica que cada página tenga `results` y `next`, y que seguir `next`
+        recorra todas las filas.
+        """
+        for route in self.ROUTES:
+            with self.subTest(route=route):
+                url: Optional[str] = reverse(route) + "?page_size=2"
+                sizes: List[int] = []
+                while url is not None:
+                    response = self.client.get(url)
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                    data: Dict[str, Any] = response.json()
+                    self.assertEqual(set(data), {"results", "next"})
+                    sizes.append(len(data["results"]))
+                    url = data["next"]
+                self.assertEqual(sizes, [2, 1])
+
+    def test_invalid_page_params(self) -> None:
+        """
+        Verifica que se rechacen un cursor o un tamaño de página inválidos.
+        """
+        for route in self.ROUTES:
+            for params in ({"cursor": "abc"}, {"page_size": 0}, {"page_size": 1001}):
+                with self.subTest(route=route, params=params):
+                    response = self.client.get(reverse(route), params)
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,263 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from rest_framework.test import APITestCase
+
+from api import urls
+from api.benchmarks.utils import rollback_after
+from api.tests.query_budget import QueryBudgetMixin
+from rapihogar.models import Company, Order, Scheme, Technician, User
+
+SIZES: List[int] = [2, 10, 50]
+
+
+@dataclass(frozen=True)
+class Seed:
+    """
+    Ids de los datos sembrados para un tamaño.
+    """
+
+    orders: List[int]
+    companies: List[int]
+    clients: List[int]
+    technicians: List[int]
+
+
+@dataclass(frozen=True)
+class RouteBudget:
+    """
+    Máximo de consultas de una petición a una ruta de `api/urls.py`.
+
+    `kwargs` y `data` reciben los datos sembrados y devuelven los argumentos
+    de la URL y el cuerpo de la petición.
+    """
+
+    route: str
+    budget: int
+    method: str = "get"
+    params: Dict[str, Any] = field(default_factory=dict)
+    kwargs: Callable[[Seed], Dict[str, Any]] = lambda seed: {}
+    data: Optional[Callable[[Seed], Any]] = None
+
+    def __str__(self) -> str:
+        return f"{self.method.upper()} {self.route} {self.params or ''}".strip()
+
+
+def _bulk_update_items(seed: Seed) -> List[Dict[str, Any]]:
+    return [{"id": pk, "hours_worked": 7} for pk in seed.orders]
+
+
+def _company(seed: Seed) -> Dict[str, Any]:
+    return {
+        "name": "Empresa nueva",
+        "phone": "123456789",
+        "email": "nueva@rapihogar.com",
+        "website": "http://www.nueva.com",
+    }
+
+
+def _first_order(seed: Seed) -> Dict[str, Any]:
+    return {"pk": seed.orders[0]}
+
+
+def _first_company(seed: Seed) -> Dict[str, Any]:
+    return {"pk": seed.companies[0]}
+
+
+ROUTE_BUDGETS: List[RouteBudget] = [
+    RouteBudget("api-root", 0),
+    RouteBudget("company-list", 1),
+    RouteBudget("company-list", 1, params={"fields": "id,name"}),
+    RouteBudget("company-list", 1, params={"page_size": 2}),
+    RouteBudget("company-list", 1, method="post", data=_company),
+    RouteBudget("company-detail", 1, kwargs=_first_company),
+    RouteBudget(
+        "company-detail", 2, method="put", kwargs=_first_company, data=_company
+    ),
+    RouteBudget("company-detail", 2, method="delete", kwargs=_first_company),
+    RouteBudget("technician-payments-list", 2),
+    RouteBudget("technician-payments-list", 2, params={"page_size": 2}),
+    RouteBudget("technician-payments-list", 2, params={"name": "juan"}),
+    RouteBudget("technician-payments-list", 2, params={"period": "2026-10"}),
+    RouteBudget("technician-report", 2),
+    RouteBudget("technician-report", 2, params={"period": "2026-10"}),
+    RouteBudget("technician-payments-list-async", 2),
+    RouteBudget("technician-payments-list-async", 2, params={"page_size": 2}),
+    RouteBudget("technician-report-async", 2),
+    RouteBudget("order-bulk-update", 10, method="patch", data=_bulk_update_items),
+    # Un PATCH que no toca `hours_worked` ni `technician` es la lectura y el
+    # UPDATE condicional del pedido. Si cambian las horas se suman un UPDATE
+    # por cada tabla de totales y la renovación de `DataVersion`; si cambia
+    # el técnico, cada tabla de totales además crea la fila que falte y
+    # bloquea ambas filas en orden antes de actualizarlas.
+    *(
+        RouteBudget(
+            route,
+            budget,
+            method="patch",
+            kwargs=_first_order,
+            data=data,
+        )
+        for route in ("order-update", "order-update-async")
+        for budget, data in (
+            (2, lambda seed: {"client": seed.clients[1]}),
+            (5, lambda seed: {"hours_worked": 7}),
+            (9, lambda seed: {"technician": seed.technicians[1]}),
+        )
+    ),
+    RouteBudget("request-metrics", 0),
+    RouteBudget("request-metrics", 0, method="delete"),
+]
+
+
+def _route_names(patterns: List[Any]) -> Set[str]:
+    names: Set[str] = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            names |= _route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+class QueryBudgetTest(QueryBudgetMixin, APITestCase):
+    """
+    Verifica que ninguna ruta de la API supere su máximo de consultas y que
+    la cantidad no crezca con la cantidad de filas.
+    """
+
+    def setUp(self) -> None:
+        self.staff = User.objects.create(
+            email="staff@rapihogar.com", username="staff", is_staff=True
+        )
+        self.client.force_authenticate(self.staff)
+
+    def seed(self, size: int) -> Seed:
+        """
+        Crea `size` técnicos, clientes, pedidos y empresas.
+        """
+        scheme: Scheme = Scheme.objects.create(name="Esquema")
+        clients = User.objects.bulk_create(
+            [
+                User(email=f"cliente{index}@rapihogar.com", username=f"cliente{index}")
+                for index in range(size)
+            ]
+        )
+        technicians = Technician.objects.bulk_create(
+            [
+                Technician(first_name=f"Juan{index}", last_name="Pérez")
+                for index in range(size)
+            ]
+        )
+        orders = Order.objects.bulk_create(
+            [
+                Order(
+                    client=client,
+                    technician=technician,
+                    scheme=scheme,
+                    hours_worked=index % 10 + 1,
+                )
+                for index, (client, technician) in enumerate(zip(clients, technicians))
+            ]
+        )
+        companies = Company.objects.bulk_create(
+            [
+                Company(
+                    name=f"Empresa {index}",
+                    phone=f"{index}",
+                    email=f"empresa{index}@rapihogar.com",
+                    website=f"http://www.empresa{index}.com",
+                )
+                for index in range(size)
+            ]
+        )
+        return Seed(
+            orders=[order.pk for order in orders],
+            companies=[company.pk for company in companies],
+            clients=[client.pk for client in clients],
+            technicians=[technician.pk for technician in technicians],
+        )
+
+    def request(self, budget: RouteBudget, seed: Seed) -> List[str]:
+        """
+        Ejecuta la petición de `budget` sin caché de respuestas y devuelve
+        las consultas ejecutadas.
+        """
+        cache.clear()
+        url: str = reverse(budget.route, kwargs=budget.kwargs(seed))
+        send = getattr(self.client, budget.method)
+        # Las consultas que se ejecutan al confirmar la transacción, como la
+        # renovación de `DataVersion`, también cuentan.
+        with CaptureQueriesContext(connection) as context:
+            with self.captureOnCommitCallbacks(execute=True):
+                if budget.data is None:
+                    response = send(url, budget.params)
+                else:
+                    response = send(url, budget.data(seed), format="json")
+                if response.streaming:
+                    b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 300, f"{budget}: {response.content}")
+        return [query["sql"] for query in context.captured_queries]
+
+    def test_every_route_has_a_budget(self) -> None:
+        """
+        Verifica que cada ruta de `api/urls.py` tenga al menos un máximo.
+        """
+        self.assertEqual(
+            _route_names(urls.urlpatterns),
+            {budget.route for budget in ROUTE_BUDGETS},
+        )
+
+    def test_query_budgets(self) -> None:
+        """
+        Verifica el máximo de consultas de cada ruta con 2, 10 y 50 filas.
+        """
+        queries: Dict[int, Dict[int, List[str]]] = {
+            index: {} for index in range(len(ROUTE_BUDGETS))
+        }
+        for size in SIZES:
+            with rollback_after():
+                seed: Seed = self.seed(size)
+                for index, budget in enumerate(ROUTE_BUDGETS):
+                    with rollback_after():
+                        queries[index][size] = self.request(budget, seed)
+
+        for index, budget in enumerate(ROUTE_BUDGETS):
+            with self.subTest(str(budget)):
+                self.assertConstantQueries(queries[index], budget.budget)
+
+    def test_failure_shows_extra_queries(self) -> None:
+        """
+        Verifica que al superar el máximo se muestre la diferencia de SQL.
+        """
+        with self.assertRaises(AssertionError) as context:
+            self.assertConstantQueries(
+                {
+                    1: ['SELECT * FROM "rapihogar_order"'],
+                    2: [
+                        'SELECT * FROM "rapihogar_order"',
+                        'SELECT * FROM "rapihogar_user" WHERE "id" = 1',
+                        'SELECT * FROM "rapihogar_user" WHERE "id" = 2',
+                    ],
+                },
+                budget=1,
+            )
+        message: str = str(context.exception)
+        self.assertIn("Con 2 filas se ejecutaron 3 consultas", message)
+        self.assertIn('+SELECT * FROM "rapihogar_user" WHERE "id" = ?', message)
+
+    def test_max_queries_lists_executed_queries(self) -> None:
+        """
+        Verifica que `assertMaxQueries` liste las consultas al fallar.
+        """
+        with self.assertRaises(AssertionError) as context:
+            with self.assertMaxQueries(0):
+                Technician.objects.count()
+        self.assertIn(
+            "Se ejecutaron 1 consultas, el máximo es 0:\n1. SELECT",
+            str(context.exception),
+        )
@@ -0,0 +1,110 @@
+import datetime
+import io
+import random
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+from api.technician.services.payment_service import PaymentService
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    def assertSameBytes(self, data, accepted_media_type=None) -> None:
+        self.assertEqual(
+            FastJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type),
+        )
+
+    def test_payment_rows(self) -> None:
+        """
+        Verifica que los pagos redondeados se rendericen igual que con DRF.
+        """
+        rng = random.Random(0)
+        hours = [rng.randint(0, 100_000) for _ in range(5000)]
+        rows = [
+            {
+                "full_name": f"Técnico {index}",
+                "total_hours": hour,
+                "total_payment": round(payment, 2),
+                "total_orders": index,
+            }
+            for index, (hour, payment) in enumerate(
+                zip(hours, PaymentService.calculate_payments(hours))
+            )
+        ]
+        rows.append({"total_payment": round(rng.random() * 1e6, 2)})
+        self.assertSameBytes(rows)
+
+    def test_types_delegated_to_drf_encoder(self) -> None:
+        """
+        Verifica los tipos que orjson serializaría distinto que DRF.
+        """
+        data = {
+            "datetime": datetime.datetime(
+                2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+            ),
+            "date": datetime.date(2024, 1, 2),
+            "time": datetime.time(3, 4, 5, 678901),
+            "decimal": Decimal("1.10"),
+            "uuid": uuid.UUID(int=1),
+            "lazy": gettext_lazy("Pedido"),
+            "error": [ErrorDetail("Campo inválido", code="invalid")],
+            1: "clave numérica",
+            "separators": "  ",
+            "big": 2**70,
+        }
+        self.assertSameBytes(data)
+
+    def test_floats_with_exponent(self) -> None:
+        """
+        Verifica los floats que orjson escribe distinto que `json`.
+        """
+        for value in (1e-05, -2.5e-07, 5e-324, 1e16, 1.5e300, -1.2345678901234568e17):
+            with self.subTest(value=value):
+                self.assertSameBytes(value)
+                self.assertSameBytes({"value": value, "other": [0.5, value]})
+        self.assertSameBytes([0.0001, 0.00012, 1e15, 9999999999999998.0])
+        self.assertSameBytes({"name": "[1e5", "note": ":0.00001"})
+
+    def test_none_and_indent(self) -> None:
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+        self.assertSameBytes({"a": [1, 2]}, "application/json; indent=4")
+
+
+class FastJSONParserTest(SimpleTestCase):
+    def parse(self, parser, content: bytes, encoding: str = "utf-8"):
+        return parser.parse(io.BytesIO(content), parser_context={"encoding": encoding})
+
+    def test_parse(self) -> None:
+        for content in (
+            b'{"id": 1, "hours_worked": 8, "name": "Mar\xc3\xada"}',
+            b"[1, 2.5, null, true]",
+            b'{"big": 100000000000000000000000}',
+        ):
+            with self.subTest(content=content):
+                self.assertEqual(
+                    self.parse(FastJSONParser(), content),
+                    self.parse(JSONParser(), content),
+                )
+
+    def test_parse_latin1(self) -> None:
+        content = '{"name": "María"}'.encode("latin-1")
+        self.assertEqual(
+            self.parse(FastJSONParser(), content, "latin-1"), {"name": "María"}
+        )
+
+    def test_parse_error(self) -> None:
+        for content in (b"{", b'{"value": NaN}'):
+            with self.subTest(content=content):
+                with self.assertRaises(ParseError) as expected:
+                    self.parse(JSONParser(), content)
+                with self.assertRaises(ParseError) as error:
+                    self.parse(FastJSONParser(), content)
+                self.assertEqual(str(error.exception), str(expected.exception))
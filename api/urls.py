@@ -2,7 +2,12 @@ from django.urls import include, path
 from rest_framework import routers
 
 from api.company.views.company_view import CompanyViewSet
+from api.metrics.views.metrics_view import RequestMetricsView
+from api.order.views.async_update_view import AsyncOrderUpdateView
+from api.order.views.bulk_update_view import OrderBulkUpdateView
 from api.order.views.update_view import OrderUpdateView
+from api.technician.views.async_payment_view import AsyncTechnicianPaymentView
+from api.technician.views.async_report_view import AsyncTechnicianReportView
 from api.technician.views.payment_view import TechnicianPaymentView
 from api.technician.views.report_view import TechnicianReportView
 
@@ -19,5 +24,26 @@ urlpatterns = [
     path(
         "technicians/report/", TechnicianReportView.as_view(), name="technician-report"
     ),
+    path("order/bulk/", OrderBulkUpdateView.as_view(), name="order-bulk-update"),
     path("order/<int:pk>/", OrderUpdateView.as_view(), name="order-update"),
+    path(
+        "async/technicians/payments/",
+        AsyncTechnicianPaymentView.as_view(),
+        name="technician-payments-list-async",
+    ),
+    path(
+        "async/technicians/report/",
+        AsyncTechnicianReportView.as_view(),
+        name="technician-report-async",
+    ),
+    path(
+        "async/order/<int:pk>/",
+        AsyncOrderUpdateView.as_view(),
+        name="order-update-async",
+    ),
+    path(
+        "debug/request-metrics/",
+        RequestMetricsView.as_view(),
+        name="request-metrics",
+    ),
 ]
@@ -0,0 +1,62 @@
+"""
+Configuración de gunicorn para producción.
+
+    gunicorn -c gunicorn.conf.py rapihogar.wsgi:application
+    GUNICORN_ASGI=1 gunicorn -c gunicorn.conf.py rapihogar.asgi:application
+
+Con WSGI se usan 2 * CPU + 1 workers con hilos, porque las vistas pasan la
+mayor parte del tiempo esperando a la base de datos; con ASGI alcanza un
+worker de uvicorn por CPU. WEB_CONCURRENCY y GUNICORN_THREADS permiten
+ajustarlo.
+
+Cada worker abre hasta una conexión a PostgreSQL por hilo (o hasta
+`DB_POOL_MAX_SIZE` si se usa el pool de psycopg 3; un worker ASGI sin pool usa
+una). La cantidad de workers se reduce para que el total no supere
+`DB_MAX_CONNECTIONS`, que por defecto es 45: `web` y `asgi` comparten el
+servidor y juntos quedan por debajo del `max_connections = 100` por defecto
+de PostgreSQL, con margen para migraciones, comandos y conexiones de
+administración. Con más workers conviene poner pgbouncer delante de
+PostgreSQL (ver `rapihogar.settings_production`).
+"""
+
+import multiprocessing
+import os
+import sys
+
+cpu_count = multiprocessing.cpu_count()
+asgi = os.getenv("GUNICORN_ASGI", "0") == "1"
+max_connections = int(os.getenv("DB_MAX_CONNECTIONS", "45"))
+pool_max_size = int(os.getenv("DB_POOL_MAX_SIZE", "0"))
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+if asgi:
+    worker_class = "uvicorn_worker.UvicornWorker"
+    workers = int(os.getenv("WEB_CONCURRENCY", cpu_count))
+    connections_per_worker = pool_max_size or 1
+else:
+    worker_class = "gthread"
+    workers = int(os.getenv("WEB_CONCURRENCY", cpu_count * 2 + 1))
+    threads = int(os.getenv("GUNICORN_THREADS", "4"))
+    connections_per_worker = min(threads, pool_max_size or threads)
+
+if connections_per_worker > max_connections:
+    sys.exit(
+        f"DB_MAX_CONNECTIONS={max_connections} no alcanza para un worker con "
+        f"{connections_per_worker} conexiones."
+    )
+if workers * connections_per_worker > max_connections:
+    print(
+        f"gunicorn: {workers} workers con {connections_per_worker} conexiones "
+        f"cada uno superan DB_MAX_CONNECTIONS={max_connections}; se usan "
+        f"{max_connections // connections_per_worker} workers.",
+        file=sys.stderr,
+    )
+    workers = max_connections // connections_per_worker
+
+keepalive = 5
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+# Reinicia cada worker después de una cantidad de peticiones para acotar el
+# crecimiento de memoria; el jitter evita que se reinicien todos a la vez.
+max_requests = 1000
+max_requests_jitter = 100
+accesslog = "-"
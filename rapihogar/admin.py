@@ -2,7 +2,16 @@
 
 from django.contrib import admin
 
-from .models import Company, Order, Scheme, Technician, User
+from .models import (
+    Company,
+    DataVersion,
+    Order,
+    Scheme,
+    Technician,
+    TechnicianPeriodStats,
+    TechnicianStats,
+    User,
+)
 
 
 @admin.register(User)
@@ -47,3 +56,24 @@ class TechnicianAdmin(admin.ModelAdmin):
     search_fields = ("first_name", "last_name")
     ordering = ("last_name",)
     readonly_fields = ("full_name",)
+
+
+@admin.register(TechnicianStats)
+class TechnicianStatsAdmin(admin.ModelAdmin):
+    list_display = ("technician", "total_hours", "total_orders")
+    search_fields = ("technician__first_name", "technician__last_name")
+    readonly_fields = ("technician", "total_hours", "total_orders")
+
+
+@admin.register(TechnicianPeriodStats)
+class TechnicianPeriodStatsAdmin(admin.ModelAdmin):
+    list_display = ("technician", "period", "total_hours", "total_orders")
+    list_filter = ("period",)
+    search_fields = ("technician__first_name", "technician__last_name")
+    readonly_fields = ("technician", "period", "total_hours", "total_orders")
+
+
+@admin.register(DataVersion)
+class DataVersionAdmin(admin.ModelAdmin):
+    list_display = ("name", "token")
+    readonly_fields = ("name", "token")
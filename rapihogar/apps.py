@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class RapihogarConfig(AppConfig):
+    name = "rapihogar"
+
+    def ready(self):
+        from rapihogar import signals  # noqa: F401
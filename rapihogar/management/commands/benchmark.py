@@ -0,0 +1,64 @@
+import json
+import platform
+from typing import Any, Dict
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api.benchmarks.scenarios import SCENARIOS
+
+
+class Command(BaseCommand):
+    help: str = """
+    Este comando ejecuta un escenario de benchmark y muestra el resultado en JSON.
+    Los datos que siembra el escenario se revierten al terminar.
+    Con --output el resultado se agrega como una línea JSON al archivo
+    indicado, para comparar ejecuciones a lo largo del tiempo.
+    Para ejecutar este comando,
+    usa el siguiente comando en la terminal:
+    python manage.py benchmark <escenario> [--size N] [--repeat N] [--output FILE]
+    """
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "scenario",
+            choices=sorted(SCENARIOS),
+            help="Escenario de benchmark a ejecutar",
+        )
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=100_000,
+            help="Cantidad de registros a sembrar para el escenario",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Cantidad de repeticiones de cada medición",
+        )
+        parser.add_argument(
+            "--output",
+            help="Archivo al que agregar el resultado como una línea JSON",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+
+        if not settings.DEBUG:
+            raise CommandError("Este comando solo se puede ejecutar en modo DEBUG.")
+
+        if kwargs["size"] < 1 or kwargs["repeat"] < 1:
+            raise CommandError("--size y --repeat deben ser al menos 1.")
+
+        result: Dict[str, Any] = {
+            "recorded_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            **SCENARIOS[kwargs["scenario"]](kwargs["size"], kwargs["repeat"]),
+        }
+        if kwargs["output"]:
+            with open(kwargs["output"], "a", encoding="utf-8") as output:
+                output.write(json.dumps(result) + "\n")
+        self.stdout.write(json.dumps(result, indent=2))
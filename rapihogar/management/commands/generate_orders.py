@@ -1,7 +1,10 @@
+import random
+import time
 from typing import Any
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 
 from api.order.seed import OrderSeeder
 from rapihogar.models import Scheme, Technician, User
@@ -12,22 +15,59 @@ class Command(BaseCommand):
     Este comando genera un número específico de pedidos aleatorios en la base de datos.
     Para ejecutar este comando,
     usa el siguiente comando en la terminal:
-    python manage.py generate_orders <n> [--delete]
-    Donde <n> es el número de pedidos a generar (entre 1 y 100).
+    python manage.py generate_orders <n> [--delete] [--delete-mode modo]
+        [--batch-size N] [--copy] [--workers N] [--seed N]
+    Donde <n> es el número de pedidos a generar (al menos 1).
     El argumento --delete elimina todos los pedidos previos que estaban en la base de datos.
+    Por defecto los elimina en bloque (TRUNCATE en PostgreSQL) si ninguna señal
+    ni cascada lo impide, y si no por lotes; --delete-mode fuerza un modo
+    (auto, fast, chunked o standard).
+    Los pedidos se insertan por lotes de --batch-size, cada uno en su propia transacción.
+    El argumento --copy inserta los lotes con COPY (solo PostgreSQL).
+    El argumento --workers reparte la carga entre N procesos y --seed permite
+    reproducir la misma carga.
     """
 
     def add_arguments(self, parser: Any) -> None:
         parser.add_argument(
             "n",
             type=int,
-            help="Número de pedidos a generar (entre 1 y 100)",
+            help="Número de pedidos a generar (al menos 1)",
         )
         parser.add_argument(
             "--delete",
             action="store_true",
             help="Elimina todos los pedidos previos que estaban en la base de datos",
         )
+        parser.add_argument(
+            "--delete-mode",
+            default=OrderSeeder.DELETE_AUTO,
+            choices=OrderSeeder.DELETE_MODES,
+            help="Modo de eliminación de --delete (por defecto auto)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=OrderSeeder.DEFAULT_BATCH_SIZE,
+            help="Cantidad de pedidos a insertar por transacción",
+        )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Inserta los pedidos con COPY (solo PostgreSQL)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Cantidad de procesos entre los que se reparten los pedidos",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Semilla de los generadores aleatorios, para reproducir la carga",
+        )
 
     def handle(self, *args: Any, **kwargs: dict[str, Any]) -> None:
 
@@ -36,35 +76,96 @@ class Command(BaseCommand):
 
         n: int = kwargs["n"]
         delete: bool = kwargs["delete"]
+        batch_size: int = kwargs["batch_size"]
+        workers: int = kwargs["workers"]
+        seed: int = (
+            kwargs["seed"] if kwargs["seed"] is not None else random.randrange(2**32)
+        )
+
+        MIN_ORDERS: int = 1
+        if n < MIN_ORDERS:
+            raise CommandError(f"El número de pedidos debe ser al menos {MIN_ORDERS}.")
+        if batch_size < 1:
+            raise CommandError("El tamaño de lote debe ser al menos 1.")
+        if workers < 1:
+            raise CommandError("La cantidad de procesos debe ser al menos 1.")
+        # Se valida antes de --delete para no eliminar los pedidos previos si
+        # la carga no se puede hacer.
+        if kwargs["copy"] and connection.vendor != "postgresql":
+            raise CommandError("COPY solo está disponible en PostgreSQL.")
 
         if delete:
-            OrderSeeder.delete_all_orders()
+            try:
+                used_mode: str = OrderSeeder.delete_all_orders(
+                    kwargs["delete_mode"], chunk_size=batch_size
+                )
+            except ValueError as error:
+                raise CommandError(str(error))
             self.stdout.write(
                 self.style.SUCCESS(
-                    "Se eliminaron todos los pedidos previos correctamente."
+                    "Se eliminaron todos los pedidos previos correctamente "
+                    f"(modo {used_mode})."
                 )
             )
 
-        MIN_ORDERS: int = 1
-        MAX_ORDERS: int = 100
-        if not (MIN_ORDERS <= n <= MAX_ORDERS):
-            raise CommandError(
-                f"El número de pedidos debe estar entre {MIN_ORDERS} y {MAX_ORDERS}."
-            )
-
-        technicians = list(Technician.objects.all())
-        clients = list(User.objects.filter(is_staff=False))
-        schemes = list(Scheme.objects.all())
+        technician_ids = OrderSeeder.get_ids(Technician.objects.all())
+        client_ids = OrderSeeder.get_ids(User.objects.filter(is_staff=False))
+        scheme_ids = OrderSeeder.get_ids(Scheme.objects.all())
 
-        if not technicians:
+        if not technician_ids:
             raise CommandError("No hay técnicos disponibles en la base de datos.")
-        if not clients:
+        if not client_ids:
             raise CommandError("No hay clientes disponibles en la base de datos.")
-        if not schemes:
+        if not scheme_ids:
             raise CommandError("No hay esquemas disponibles en la base de datos.")
 
-        OrderSeeder.create_random_orders(technicians, clients, schemes, n)
+        def report_progress(created: int, elapsed: float) -> None:
+            self.stdout.write(
+                f"{created}/{n} pedidos ({self._rate(created, elapsed)} pedidos/s)"
+            )
+
+        self.stdout.write(f"Semilla: {seed}")
+        start: float = time.perf_counter()
+        try:
+            if workers == 1:
+                created: int = OrderSeeder.create_random_orders_in_batches(
+                    technician_ids,
+                    client_ids,
+                    scheme_ids,
+                    n,
+                    batch_size=batch_size,
+                    use_copy=kwargs["copy"],
+                    progress=report_progress,
+                    rng=random.Random(f"{seed}:0"),
+                )
+            else:
+                results = OrderSeeder.create_random_orders_parallel(
+                    technician_ids,
+                    client_ids,
+                    scheme_ids,
+                    n,
+                    workers=workers,
+                    seed=seed,
+                    batch_size=batch_size,
+                    use_copy=kwargs["copy"],
+                )
+                for index, result in enumerate(results):
+                    self.stdout.write(
+                        f"Proceso {index}: {result.created} pedidos "
+                        f"({self._rate(result.created, result.elapsed)} pedidos/s)"
+                    )
+                created = sum(result.created for result in results)
+        except ValueError as error:
+            raise CommandError(str(error))
+        elapsed: float = time.perf_counter() - start
 
         self.stdout.write(
-            self.style.SUCCESS(f"Se generaron {n} pedidos correctamente.")
+            self.style.SUCCESS(
+                f"Se generaron {created} pedidos correctamente "
+                f"en {elapsed:.2f} s ({self._rate(created, elapsed)} pedidos/s)."
+            )
         )
+
+    @staticmethod
+    def _rate(created: int, elapsed: float) -> int:
+        return round(created / elapsed) if elapsed > 0 else created
@@ -0,0 +1,51 @@
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.benchmarks.load import run_load_test
+
+
+class Command(BaseCommand):
+    help: str = """
+    Este comando envía peticiones concurrentes a una URL y muestra en JSON el
+    throughput y la latencia, para comparar el servidor WSGI con el ASGI.
+    Para ejecutar este comando,
+    usa el siguiente comando en la terminal:
+    python manage.py load_test <url> [--concurrency N] [--requests N]
+    """
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("url", type=str, help="URL a la que enviar las peticiones")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Cantidad de clientes concurrentes",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=1000,
+            help="Cantidad total de peticiones",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Tiempo máximo de espera de cada petición, en segundos",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        if kwargs["concurrency"] < 1 or kwargs["requests"] < kwargs["concurrency"]:
+            raise CommandError(
+                "--concurrency debe ser al menos 1 y --requests al menos --concurrency."
+            )
+
+        result = run_load_test(
+            kwargs["url"],
+            kwargs["concurrency"],
+            kwargs["requests"],
+            kwargs["timeout"],
+        )
+        self.stdout.write(json.dumps(result, indent=2))
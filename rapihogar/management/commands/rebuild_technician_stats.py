@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from rapihogar.models import TechnicianPeriodStats, TechnicianStats
+
+
+class Command(BaseCommand):
+    help: str = """
+    Este comando recalcula desde cero las estadísticas de horas y pedidos por técnico
+    y por técnico y período de liquidación.
+    Para ejecutar este comando,
+    usa el siguiente comando en la terminal:
+    python manage.py rebuild_technician_stats
+    """
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        TechnicianStats.objects.rebuild()
+        TechnicianPeriodStats.objects.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Se recalcularon las estadísticas de "
+                f"{TechnicianStats.objects.count()} técnicos y "
+                f"{TechnicianPeriodStats.objects.count()} períodos correctamente."
+            )
+        )
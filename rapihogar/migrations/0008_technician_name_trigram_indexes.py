@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Índices GIN de trigramas sobre las mismas expresiones que genera el lookup
+# `icontains` en PostgreSQL (UPPER("columna"::text) LIKE UPPER('%valor%')),
+# de modo que el filtro por nombre deja de recorrer la tabla completa.
+TRIGRAM_INDEXES = (
+    ('rapihogar_technician_first_name_trgm', 'first_name'),
+    ('rapihogar_technician_last_name_trgm', 'last_name'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} '
+            f'ON rapihogar_technician USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('rapihogar', '0007_alter_technician_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_technician_stats(apps, schema_editor):
+    Order = apps.get_model('rapihogar', 'Order')
+    TechnicianStats = apps.get_model('rapihogar', 'TechnicianStats')
+    TechnicianStats.objects.bulk_create(
+        [
+            TechnicianStats(
+                technician_id=row['technician_id'],
+                total_hours=row['total_hours'] or 0,
+                total_orders=row['total_orders'],
+            )
+            for row in Order.objects.order_by()
+            .values('technician_id')
+            .annotate(total_hours=Sum('hours_worked'), total_orders=Count('id'))
+        ],
+        batch_size=1000,
+    )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rapihogar', '0008_technician_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechnicianStats',
+            fields=[
+                (
+                    'technician',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='stats',
+                        serialize=False,
+                        to='rapihogar.technician',
+                    ),
+                ),
+                ('total_hours', models.PositiveBigIntegerField(default=0)),
+                ('total_orders', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Estadisticas de tecnico',
+                'verbose_name_plural': 'Estadisticas de tecnicos',
+            },
+        ),
+        migrations.RunPython(populate_technician_stats, migrations.RunPython.noop),
+    ]
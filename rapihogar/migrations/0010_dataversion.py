@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:32
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rapihogar', '0009_technicianstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                (
+                    'name',
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ('token', models.UUIDField(default=uuid.uuid4)),
+            ],
+            options={
+                'verbose_name': 'Version de datos',
+                'verbose_name_plural': 'Versiones de datos',
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TECHNICIAN_HOURS_INDEX = models.Index(fields=['technician', 'hours_worked'], name='order_technician_hours_idx')
+
+
+def index_options(schema_editor):
+    # En PostgreSQL el índice se crea y elimina con CONCURRENTLY, sin bloquear
+    # las escrituras de pedidos mientras se construye.
+    if schema_editor.connection.vendor == 'postgresql':
+        return {'concurrently': True}
+    return {}
+
+
+def create_technician_hours_index(apps, schema_editor):
+    Order = apps.get_model('rapihogar', 'Order')
+    schema_editor.add_index(Order, TECHNICIAN_HOURS_INDEX, **index_options(schema_editor))
+
+
+def drop_technician_hours_index(apps, schema_editor):
+    Order = apps.get_model('rapihogar', 'Order')
+    schema_editor.remove_index(Order, TECHNICIAN_HOURS_INDEX, **index_options(schema_editor))
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('rapihogar', '0011_order_version'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_technician_hours_index, drop_technician_hours_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='order',
+                    index=TECHNICIAN_HOURS_INDEX,
+                ),
+            ],
+        ),
+        # El índice de `technician_id` se elimina recién cuando existe el
+        # compuesto, que lo reemplaza.
+        migrations.AlterField(
+            model_name='order',
+            name='technician',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='rapihogar.technician', verbose_name='tecnico'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:18
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rapihogar', '0012_order_technician_hours_index'),
+    ]
+
+    operations = [
+        # Sin valor por defecto, para que los pedidos existentes queden sin
+        # fecha en lugar de recibir la de la migración.
+        migrations.AddField(
+            model_name='order',
+            name='created_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, null=True),
+        ),
+        migrations.CreateModel(
+            name='TechnicianPeriodStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField()),
+                ('total_hours', models.PositiveBigIntegerField(default=0)),
+                ('total_orders', models.PositiveIntegerField(default=0)),
+                (
+                    'technician',
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='period_stats',
+                        to='rapihogar.technician',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Estadisticas de tecnico por periodo',
+                'verbose_name_plural': 'Estadisticas de tecnicos por periodo',
+                'constraints': [
+                    models.UniqueConstraint(fields=('technician', 'period'), name='technician_period_stats_unique'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def create_technicians_data_version(apps, schema_editor):
+    # El token se renueva al confirmar cada escritura: la fila tiene que
+    # existir antes para que leerlo no tenga que crearla.
+    DataVersion = apps.get_model('rapihogar', 'DataVersion')
+    DataVersion.objects.get_or_create(name='technicians')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rapihogar', '0013_order_created_at_technicianperiodstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_technicians_data_version, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,14 @@
+import operator
+import threading
+import uuid
+from abc import ABCMeta, abstractmethod
+from functools import reduce
+
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, UserManager
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -66,6 +75,182 @@ class Company(models.Model):
         verbose_name_plural = _("Empresas")
 
 
+# Campos de un pedido que afectan las estadísticas y los pagos de los técnicos.
+ORDER_STATS_FIELDS = frozenset(
+    {"technician", "technician_id", "hours_worked", "created_at"}
+)
+
+
+def payroll_period(moment):
+    """
+    Devuelve el período de liquidación de `moment`: el primer día de su mes
+    en la zona horaria actual, o `None` si el pedido no tiene fecha.
+    """
+    if moment is None:
+        return None
+    if timezone.is_aware(moment):
+        moment = timezone.localtime(moment)
+    return moment.date().replace(day=1)
+
+
+def apply_stats_changes(changes):
+    """
+    Aplica a `TechnicianStats` y `TechnicianPeriodStats` los cambios de
+    pedidos `changes`, expresados como (valores anteriores, valores nuevos)
+    de `Order.stats_values()`. `None` indica un pedido nuevo o eliminado.
+    """
+    for manager in (TechnicianStats.objects, TechnicianPeriodStats.objects):
+        manager.apply_deltas(manager.deltas_for_changes(changes))
+
+
+class OrderQuerySet(models.QuerySet):
+    """
+    QuerySet de pedidos que mantiene `TechnicianStats` y
+    `TechnicianPeriodStats` en las operaciones masivas que no emiten señales.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db, savepoint=False):
+            orders = super().bulk_create(objs, *args, **kwargs)
+            apply_stats_changes([(None, order.stats_values()) for order in orders])
+            DataVersion.objects.bump(DataVersion.TECHNICIANS)
+        return orders
+
+    def totals_by_technician(self):
+        """
+        Devuelve, por técnico, la suma de horas y la cantidad de pedidos.
+
+        Usa `COUNT(*)` en lugar de contar ids para que la consulta se resuelva
+        solo con el índice `order_technician_hours_idx`.
+        """
+        return (
+            self.order_by()
+            .values("technician_id")
+            .annotate(total_hours=Sum("hours_worked"), total_orders=Count("*"))
+        )
+
+    def totals_by_technician_and_period(self):
+        """
+        Devuelve, por técnico y período de liquidación, la suma de horas y la
+        cantidad de pedidos. Los pedidos sin fecha no pertenecen a ningún
+        período.
+        """
+        return (
+            self.filter(created_at__isnull=False)
+            .order_by()
+            .annotate(period=TruncMonth("created_at", output_field=models.DateField()))
+            .values("technician_id", "period")
+            .annotate(total_hours=Sum("hours_worked"), total_orders=Count("*"))
+        )
+
+    # `bulk_update` y `Order.save_if_version` aplican la diferencia por su
+    # cuenta, a partir de los valores que ya conocen.
+    _maintains_stats = True
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._maintains_stats = self._maintains_stats
+        return clone
+
+    def _without_stats(self):
+        """
+        Devuelve una copia cuyo `update` no mantiene las estadísticas.
+        """
+        clone = self._chain()
+        clone._maintains_stats = False
+        return clone
+
+    def update(self, **kwargs):
+        # Toda modificación de pedidos incrementa su versión.
+        kwargs.setdefault("version", F("version") + 1)
+        if not self._maintains_stats or not ORDER_STATS_FIELDS & set(kwargs):
+            return super().update(**kwargs)
+        # El UPDATE no emite señales: se bloquean los pedidos afectados en
+        # orden de pk, se leen sus valores antes y después de modificarlos y
+        # se aplica la diferencia a las estadísticas.
+        with transaction.atomic(using=self.db, savepoint=False):
+            pks = list(
+                self.select_for_update().order_by("pk").values_list("pk", flat=True)
+            )
+            previous = self._stats_values_by_pk(pks)
+            rows = super().update(**kwargs)
+            if pks:
+                current = self._stats_values_by_pk(pks)
+                apply_stats_changes([(previous[pk], current[pk]) for pk in pks])
+                DataVersion.objects.bump(DataVersion.TECHNICIANS)
+        return rows
+
+    def _stats_values_by_pk(self, pks, batch_size=1000):
+        """
+        Devuelve los valores de `Order.stats_values()` de los pedidos `pks`,
+        leídos de la base de datos por lotes.
+        """
+        values = {}
+        for start in range(0, len(pks), batch_size):
+            values.update(
+                (pk, (technician_id, hours_worked, payroll_period(created_at)))
+                for pk, technician_id, hours_worked, created_at in (
+                    self.model._base_manager.using(self.db)
+                    .filter(pk__in=pks[start : start + batch_size])
+                    .values_list("pk", "technician_id", "hours_worked", "created_at")
+                )
+            )
+        return values
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        field_names = set(fields)
+        updates_technician = bool({"technician", "technician_id"} & field_names)
+        updates_hours = "hours_worked" in field_names
+        updates_period = "created_at" in field_names
+        updates_stats = updates_technician or updates_hours or updates_period
+        with transaction.atomic(using=self.db, savepoint=False):
+            previous = {}
+            if updates_stats:
+                previous = {
+                    order.pk: order._stats_snapshot
+                    for order in objs
+                    if hasattr(order, "_stats_snapshot")
+                }
+                missing = [order.pk for order in objs if order.pk not in previous]
+                previous.update(
+                    (pk, (technician_id, hours_worked, payroll_period(created_at)))
+                    for pk, technician_id, hours_worked, created_at in (
+                        self.model._base_manager.using(self.db)
+                        .filter(pk__in=missing)
+                        .values_list(
+                            "pk", "technician_id", "hours_worked", "created_at"
+                        )
+                        .iterator()
+                    )
+                )
+            rows = super(OrderQuerySet, self._without_stats()).bulk_update(
+                objs, fields, *args, **kwargs
+            )
+            for order in objs:
+                # La versión se incrementó en la base de datos; se vuelve a
+                # leer al acceder a ella.
+                order.__dict__.pop("version", None)
+            if not updates_stats:
+                return rows
+            if previous:
+                changes = []
+                for order in objs:
+                    old = previous.get(order.pk)
+                    if old is None:
+                        continue
+                    new = (
+                        order.technician_id if updates_technician else old[0],
+                        order.hours_worked if updates_hours else old[1],
+                        payroll_period(order.created_at) if updates_period else old[2],
+                    )
+                    changes.append((old, new))
+                    order._stats_snapshot = new
+                apply_stats_changes(changes)
+            DataVersion.objects.bump(DataVersion.TECHNICIANS)
+        return rows
+
+
 class Order(models.Model):
     REQUEST = 0
     ORDER = 1
@@ -78,17 +263,156 @@ class Order(models.Model):
         choices=ORDER_TYPE_CHOICES, db_index=True, default=ORDER
     )
     client = models.ForeignKey(User, verbose_name="cliente", on_delete=models.CASCADE)
+    # El índice de `technician_id` es el índice compuesto de `Meta.indexes`.
     technician = models.ForeignKey(
-        "Technician", verbose_name="tecnico", on_delete=models.CASCADE, null=False
+        "Technician",
+        verbose_name="tecnico",
+        on_delete=models.CASCADE,
+        null=False,
+        db_index=False,
     )
     scheme = models.ForeignKey(Scheme, null=True, on_delete=models.CASCADE)
     hours_worked = models.PositiveIntegerField(default=0)
+    version = models.PositiveIntegerField(default=1)
+    # Los pedidos anteriores a este campo no tienen fecha: no se conoce su
+    # período de liquidación.
+    created_at = models.DateTimeField(default=timezone.now, null=True)
+
+    objects = OrderQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # Las estadísticas se actualizan en `post_save`: el pedido y sus
+        # totales se guardan en la misma transacción. `delete` no lo necesita
+        # porque Django ya envía `post_delete` dentro de una.
+        using = kwargs.get("using") or router.db_for_write(Order, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            if not self._updates_existing_row(using, kwargs):
+                return super().save(*args, **kwargs)
+            # La versión se incrementa en la base de datos, así un pedido leído
+            # antes de otra modificación, o construido a mano, no la hace
+            # retroceder.
+            previous_version = self.__dict__.get("version")
+            self.version = F("version") + 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "version"}
+            try:
+                super().save(*args, **kwargs)
+            except BaseException:
+                if previous_version is None:
+                    del self.version
+                else:
+                    self.version = previous_version
+                raise
+            self.refresh_from_db(using=using, fields=["version"])
+
+    def _updates_existing_row(self, using, save_kwargs):
+        """
+        Indica si `save` va a actualizar una fila existente. Para un pedido
+        con pk que no se leyó de la base de datos lo comprueba con la misma
+        consulta que toma los valores previos de sus estadísticas.
+        """
+        if save_kwargs.get("force_insert"):
+            return False
+        if not self._state.adding:
+            return True
+        if self.pk is None:
+            return False
+        if save_kwargs.get("force_update") or save_kwargs.get("update_fields"):
+            return True
+        if hasattr(self, "_stats_snapshot"):
+            return Order.objects.using(using).filter(pk=self.pk).exists()
+        self._stats_snapshot = self.read_stats_snapshot(using)
+        if self._stats_snapshot is None:
+            del self._stats_snapshot
+            return False
+        return True
+
+    def save_if_version(self, version, update_fields):
+        """
+        Guarda los campos `update_fields` solo si la versión del pedido en la
+        base de datos sigue siendo `version`, con un único
+        `UPDATE ... WHERE version = X` y sin bloquear la fila.
+
+        Como el UPDATE no emite señales, actualiza aquí las estadísticas de
+        los técnicos y la versión de los datos.
+
+        Returns:
+            bool: `False` si otra modificación cambió la versión del pedido.
+        """
+        values = {
+            self._meta.get_field(name).attname: getattr(
+                self, self._meta.get_field(name).attname
+            )
+            for name in update_fields
+        }
+        updates_stats = bool(ORDER_STATS_FIELDS & set(update_fields))
+        with transaction.atomic(savepoint=False):
+            if (
+                not Order.objects.filter(pk=self.pk, version=version)
+                ._without_stats()
+                .update(version=version + 1, **values)
+            ):
+                return False
+            self.version = version + 1
+            if updates_stats:
+                previous = getattr(self, "_stats_snapshot", None)
+                if previous is None:
+                    raise ValueError(
+                        "El pedido debe leerse de la base de datos antes de guardarlo."
+                    )
+                current = self.stats_values()
+                apply_stats_changes([(previous, current)])
+                self._stats_snapshot = current
+                DataVersion.objects.bump(DataVersion.TECHNICIANS)
+        return True
+
+    def stats_values(self):
+        """
+        Devuelve los valores del pedido que suman a las estadísticas: técnico,
+        horas y período de liquidación.
+        """
+        return (self.technician_id, self.hours_worked, payroll_period(self.created_at))
+
+    def read_stats_snapshot(self, using=None):
+        """
+        Lee de la base de datos los valores del pedido que suman a las
+        estadísticas, o `None` si el pedido no existe.
+        """
+        previous = (
+            Order.objects.using(using)
+            .filter(pk=self.pk)
+            .values_list("technician_id", "hours_worked", "created_at")
+            .first()
+        )
+        if previous is None:
+            return None
+        technician_id, hours_worked, created_at = previous
+        return (technician_id, hours_worked, payroll_period(created_at))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if (
+            "technician_id" in field_names
+            and "hours_worked" in field_names
+            and "created_at" in field_names
+        ):
+            instance._stats_snapshot = instance.stats_values()
+        return instance
 
     class Meta:
         app_label = "rapihogar"
         verbose_name = "Pedido"
         verbose_name_plural = "Pedidos"
         ordering = ("-id",)
+        indexes = [
+            # Cubre las sumas de horas por técnico sin leer la tabla.
+            models.Index(
+                fields=["technician", "hours_worked"],
+                name="order_technician_hours_idx",
+            ),
+        ]
 
 
 class Technician(models.Model):
@@ -117,3 +441,301 @@ class Technician(models.Model):
         app_label = "rapihogar"
         verbose_name = _("Tecnico")
         verbose_name_plural = _("Tecnicos")
+
+
+class TotalsManager(models.Manager, metaclass=ABCMeta):
+    """
+    Manager de totales de horas y pedidos que se mantienen de forma
+    incremental, agrupados por la clave que devuelve `key`.
+    """
+
+    UPDATE_BATCH_SIZE = 100
+
+    @abstractmethod
+    def key(self, values):
+        """
+        Devuelve la clave de los totales a los que suman los valores
+        `values` de `Order.stats_values()`.
+        """
+
+    @abstractmethod
+    def lookup(self, key):
+        """
+        Devuelve los filtros de la fila de totales de `key`.
+        """
+
+    def deltas_for_changes(self, changes):
+        """
+        Agrupa por clave la diferencia de cada cambio de pedido, expresado
+        como (valores anteriores, valores nuevos) de `Order.stats_values()`.
+        Un valor anterior `None` indica un pedido nuevo y uno nuevo `None`,
+        un pedido eliminado.
+        """
+        deltas = {}
+        for previous, current in changes:
+            for values, sign in ((previous, -1), (current, 1)):
+                if values is None:
+                    continue
+                key = self.key(values)
+                hours, count = deltas.get(key, (0, 0))
+                deltas[key] = (hours + sign * values[1], count + sign)
+        return deltas
+
+    def apply_deltas(self, deltas):
+        """
+        Suma a cada clave las horas y pedidos indicados en `deltas`
+        ({clave: (horas, pedidos)}). Solo se crean las filas que faltan para
+        claves que suman pedidos.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if delta != (0, 0)}
+        if not deltas:
+            return
+        # Se procesa en orden de clave para que transacciones concurrentes
+        # bloqueen las filas en el mismo orden y no se produzcan deadlocks.
+        ordered_deltas = sorted(deltas.items())
+        self.bulk_create(
+            [
+                self.model(**self.lookup(key))
+                for key, (_, count) in ordered_deltas
+                if count > 0
+            ],
+            ignore_conflicts=True,
+        )
+        if len(ordered_deltas) == 1:
+            [(key, (hours, count))] = ordered_deltas
+            self.filter(**self.lookup(key)).update(
+                total_hours=F("total_hours") + hours,
+                total_orders=F("total_orders") + count,
+            )
+            return
+        # Con varias claves se bloquean las filas en orden y se actualizan
+        # con un solo UPDATE por lote, en lugar de uno por clave.
+        for start in range(0, len(ordered_deltas), self.UPDATE_BATCH_SIZE):
+            batch = ordered_deltas[start : start + self.UPDATE_BATCH_SIZE]
+            queryset = self.filter(self.batch_filter([key for key, _ in batch]))
+            list(
+                queryset.select_for_update()
+                .order_by(*self.lookup(batch[0][0]))
+                .values_list("pk", flat=True)
+            )
+            queryset.update(
+                total_hours=F("total_hours")
+                + self._case_by_key((key, hours) for key, (hours, _) in batch),
+                total_orders=F("total_orders")
+                + self._case_by_key((key, count) for key, (_, count) in batch),
+            )
+
+    def batch_filter(self, keys):
+        """
+        Devuelve el filtro de las filas de totales de `keys`.
+        """
+        return reduce(operator.or_, (Q(**self.lookup(key)) for key in keys))
+
+    def _case_by_key(self, values):
+        """
+        Devuelve una expresión que vale, para cada clave de `values`
+        ([(clave, valor)]), el valor indicado.
+        """
+        return Case(
+            *[When(**self.lookup(key), then=Value(value)) for key, value in values],
+            default=Value(0),
+            output_field=models.BigIntegerField(),
+        )
+
+
+class TechnicianStatsManager(TotalsManager):
+    def key(self, values):
+        return values[0]
+
+    def lookup(self, key):
+        return {"technician_id": key}
+
+    def batch_filter(self, keys):
+        return Q(technician_id__in=keys)
+
+    def rebuild(self):
+        """
+        Recalcula todas las estadísticas desde la tabla de pedidos.
+        """
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            self.bulk_create(
+                [
+                    self.model(
+                        technician_id=row["technician_id"],
+                        total_hours=row["total_hours"] or 0,
+                        total_orders=row["total_orders"],
+                    )
+                    for row in Order.objects.totals_by_technician().iterator()
+                ],
+                batch_size=1000,
+            )
+            DataVersion.objects.bump(DataVersion.TECHNICIANS)
+
+
+class TechnicianStats(models.Model):
+    """
+    Totales de horas y pedidos por técnico, mantenidos de forma incremental
+    al crear, modificar o eliminar pedidos.
+    """
+
+    technician = models.OneToOneField(
+        Technician,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="stats",
+    )
+    total_hours = models.PositiveBigIntegerField(default=0)
+    total_orders = models.PositiveIntegerField(default=0)
+
+    objects = TechnicianStatsManager()
+
+    class Meta:
+        app_label = "rapihogar"
+        verbose_name = _("Estadisticas de tecnico")
+        verbose_name_plural = _("Estadisticas de tecnicos")
+
+
+class TechnicianPeriodStatsManager(TotalsManager):
+    def key(self, values):
+        return (values[0], values[2])
+
+    def deltas_for_changes(self, changes):
+        # Los pedidos sin fecha no suman a ningún período.
+        return super().deltas_for_changes(
+            tuple(
+                None if values is None or values[2] is None else values
+                for values in change
+            )
+            for change in changes
+        )
+
+    def lookup(self, key):
+        return {"technician_id": key[0], "period": key[1]}
+
+    def rebuild(self):
+        """
+        Recalcula todas las estadísticas por período desde la tabla de
+        pedidos.
+        """
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            self.bulk_create(
+                (
+                    self.model(
+                        technician_id=row["technician_id"],
+                        period=row["period"],
+                        total_hours=row["total_hours"] or 0,
+                        total_orders=row["total_orders"],
+                    )
+                    for row in Order.objects.totals_by_technician_and_period().iterator()
+                ),
+                batch_size=1000,
+            )
+            DataVersion.objects.bump(DataVersion.TECHNICIANS)
+
+
+class TechnicianPeriodStats(models.Model):
+    """
+    Totales de horas y pedidos de un técnico en un período de liquidación
+    (un mes, identificado por su primer día), mantenidos de forma
+    incremental como `TechnicianStats`. Los pagos de un período se leen de
+    aquí sin recorrer sus pedidos.
+    """
+
+    # El índice de `technician_id` es el de la restricción única.
+    technician = models.ForeignKey(
+        Technician,
+        on_delete=models.CASCADE,
+        related_name="period_stats",
+        db_index=False,
+    )
+    period = models.DateField()
+    total_hours = models.PositiveBigIntegerField(default=0)
+    total_orders = models.PositiveIntegerField(default=0)
+
+    objects = TechnicianPeriodStatsManager()
+
+    class Meta:
+        app_label = "rapihogar"
+        verbose_name = _("Estadisticas de tecnico por periodo")
+        verbose_name_plural = _("Estadisticas de tecnicos por periodo")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["technician", "period"], name="technician_period_stats_unique"
+            ),
+        ]
+
+
+# Conjuntos de datos con un token pendiente de renovar, por hilo y base de
+# datos. Un conjunto que sigue pendiente después de revertir una transacción
+# solo hace que se renueve en la próxima que se confirme.
+_pending_bumps = threading.local()
+
+
+class DataVersionManager(models.Manager):
+    def get_token(self, name):
+        """
+        Devuelve el token actual del conjunto de datos `name`.
+        """
+        token = self.filter(name=name).values_list("token", flat=True).first()
+        if token is None:
+            token = self.get_or_create(name=name)[0].token
+        return token
+
+    async def aget_token(self, name):
+        """
+        Versión asíncrona de `get_token`.
+        """
+        token = await self.filter(name=name).values_list("token", flat=True).afirst()
+        if token is None:
+            token = (await self.aget_or_create(name=name))[0].token
+        return token
+
+    def bump(self, name):
+        """
+        Asigna un token nuevo al conjunto de datos `name` cuando se confirma
+        la transacción en curso, o en el momento si no hay una.
+
+        Así la fila de `DataVersion` no queda bloqueada hasta el final de cada
+        transacción que escribe, lo que serializaría las escrituras
+        concurrentes. Aunque se llame muchas veces en una transacción, el
+        token se renueva una sola vez al confirmarla.
+        """
+        pending = _pending_bumps.__dict__.setdefault(self.db, set())
+        pending.add(name)
+
+        def bump_pending():
+            if name in pending:
+                pending.discard(name)
+                self._bump_now(name)
+
+        transaction.on_commit(bump_pending, using=self.db)
+
+    def _bump_now(self, name):
+        if not self.filter(name=name).update(token=uuid.uuid4()):
+            self.get_or_create(name=name)
+
+
+class DataVersion(models.Model):
+    """
+    Token que cambia con cada escritura de un conjunto de datos, usado como
+    parte de las claves de caché y de los ETag de las respuestas.
+
+    Se guarda en la base de datos para que sea el mismo en todos los procesos
+    y se renueva al confirmarse la transacción que modificó los datos, de modo
+    que una transacción revertida no lo cambia. Es un valor aleatorio y no un
+    contador, así un token nunca se reusa.
+    """
+
+    TECHNICIANS = "technicians"
+
+    name = models.CharField(max_length=50, primary_key=True)
+    token = models.UUIDField(default=uuid.uuid4)
+
+    objects = DataVersionManager()
+
+    class Meta:
+        app_label = "rapihogar"
+        verbose_name = _("Version de datos")
+        verbose_name_plural = _("Versiones de datos")
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "api.metrics.instrumentation.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -82,6 +83,50 @@ DATABASES = {
     }
 }
 
+# Con DB_ENGINE=sqlite se usa un archivo SQLite local, por ejemplo para
+# ejecutar los benchmarks sin PostgreSQL.
+if os.getenv("DB_ENGINE") == "sqlite":
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.getenv("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+# LocMemCache es por proceso: con varios procesos conviene un backend
+# compartido (por ejemplo Redis o Memcached) para no repetir cálculos.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "rapihogar"),
+    }
+}
+
+# Segundos que se conserva en caché una respuesta de los endpoints de técnicos.
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300"))
+
+
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+# El renderer y el parser JSON usan orjson si está instalado y generan los
+# mismos bytes que los de DRF.
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -0,0 +1,57 @@
+"""
+Configuración de producción.
+
+Extiende `rapihogar.settings` desactivando DEBUG y reutilizando las conexiones
+a PostgreSQL entre peticiones. Se activa con
+`DJANGO_SETTINGS_MODULE=rapihogar.settings_production` y requiere la variable
+de entorno `SECRET_KEY`.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from rapihogar.settings import *  # noqa: F401,F403
+from rapihogar.settings import DATABASES
+
+try:
+    SECRET_KEY = os.environ["SECRET_KEY"]
+except KeyError:
+    raise ImproperlyConfigured("Falta la variable de entorno SECRET_KEY.")
+
+DEBUG = os.getenv("DEBUG", "0") == "1"
+
+ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "localhost").split(",")
+
+
+# Conexiones a la base de datos
+# https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+# Cada hilo de un worker conserva su conexión durante CONN_MAX_AGE segundos y
+# la verifica antes de reutilizarla, en lugar de abrir una por petición.
+# `gunicorn.conf.py` limita los workers para que el total de conexiones no
+# supere `DB_MAX_CONNECTIONS`.
+# Con DB_POOL_MAX_SIZE se usa en cambio el pool de psycopg 3 (requiere
+# `psycopg[binary,pool]`), que es lo recomendable con el servidor ASGI, donde
+# las conexiones persistentes no se reutilizan entre peticiones.
+
+DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("CONN_MAX_AGE", "60"))
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+if os.getenv("DB_POOL_MAX_SIZE"):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE")),
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+    }
+
+# Con pgbouncer en modo `transaction` delante de PostgreSQL (DB_PGBOUNCER=1 y
+# DB_HOST apuntando a pgbouncer) las conexiones de Django son conexiones al
+# pooler y `DB_MAX_CONNECTIONS` de `gunicorn.conf.py` se mide contra su
+# `max_client_conn`. Los cursores del lado del servidor que usa `iterator()`
+# no sobreviven entre transacciones de distintas conexiones, así que se
+# desactivan.
+if os.getenv("DB_PGBOUNCER") == "1":
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
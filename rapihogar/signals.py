@@ -0,0 +1,101 @@
+"""Mantiene las estadísticas por técnico y período y la versión de los datos"""
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import (
+    ORDER_STATS_FIELDS,
+    DataVersion,
+    Order,
+    Technician,
+    apply_stats_changes,
+    payroll_period,
+)
+
+
+@receiver(pre_save, sender=Order, dispatch_uid="order_stats_snapshot")
+def snapshot_order_stats(sender, instance, **kwargs):
+    """
+    Si el pedido tiene pk y no se cargó desde la base de datos, lee sus
+    valores actuales para poder calcular la diferencia al guardarlo.
+    """
+    if instance.pk is None or hasattr(instance, "_stats_snapshot"):
+        return
+    previous = instance.read_stats_snapshot(kwargs.get("using"))
+    if previous is not None:
+        instance._stats_snapshot = previous
+
+
+@receiver(post_save, sender=Order, dispatch_uid="order_stats_save")
+def update_stats_on_save(sender, instance, created, update_fields=None, **kwargs):
+    previous = None if created else getattr(instance, "_stats_snapshot", None)
+    if previous is not None and update_fields is not None:
+        if not ORDER_STATS_FIELDS & set(update_fields):
+            return
+        technician_id, hours_worked, period = previous
+        if {"technician", "technician_id"} & set(update_fields):
+            technician_id = instance.technician_id
+        if "hours_worked" in update_fields:
+            hours_worked = instance.hours_worked
+        if "created_at" in update_fields:
+            period = payroll_period(instance.created_at)
+        current = (technician_id, hours_worked, period)
+    else:
+        current = instance.stats_values()
+
+    apply_stats_changes([(previous, current)])
+    instance._stats_snapshot = current
+
+
+@receiver(post_delete, sender=Order, dispatch_uid="order_stats_delete")
+def update_stats_on_delete(sender, instance, **kwargs):
+    previous = getattr(instance, "_stats_snapshot", None) or instance.stats_values()
+    apply_stats_changes([(previous, None)])
+
+
+@receiver(post_save, sender=Order, dispatch_uid="order_data_version_save")
+@receiver(post_delete, sender=Order, dispatch_uid="order_data_version_delete")
+@receiver(post_save, sender=Technician, dispatch_uid="technician_data_version_save")
+@receiver(post_delete, sender=Technician, dispatch_uid="technician_data_version_delete")
+def bump_technicians_data_version(sender, update_fields=None, **kwargs):
+    # Un pedido guardado sin tocar técnico ni horas no cambia los pagos.
+    if (
+        sender is Order
+        and update_fields is not None
+        and not ORDER_STATS_FIELDS & set(update_fields)
+    ):
+        return
+    DataVersion.objects.bump(DataVersion.TECHNICIANS)
+
+
+# Receptores de eliminación de pedidos cuyo efecto se puede aplicar en bloque
+# al vaciar la tabla: las estadísticas quedan en cero y se renueva la versión.
+BULK_REPLAYABLE_ORDER_DELETE_RECEIVERS = {
+    "order_stats_delete": update_stats_on_delete,
+    "order_data_version_delete": bump_technicians_data_version,
+}
+
+
+def has_other_order_delete_receivers():
+    """
+    Indica si hay receptores de `pre_delete`/`post_delete` de pedidos además
+    de los que se pueden aplicar en bloque, en cuyo caso los pedidos deben
+    eliminarse de a uno para que reciban la señal.
+
+    Como `Signal` solo indica si hay receptores, se desconectan por un
+    momento los de este módulo para ver si queda alguno. Solo se usa al
+    vaciar la tabla de pedidos desde `generate_orders`, sin otras escrituras
+    en curso.
+    """
+    if pre_delete.has_listeners(Order):
+        return True
+    disconnected = {
+        dispatch_uid: function
+        for dispatch_uid, function in BULK_REPLAYABLE_ORDER_DELETE_RECEIVERS.items()
+        if post_delete.disconnect(sender=Order, dispatch_uid=dispatch_uid)
+    }
+    try:
+        return post_delete.has_listeners(Order)
+    finally:
+        for dispatch_uid, function in disconnected.items():
+            post_delete.connect(function, sender=Order, dispatch_uid=dispatch_uid)